@@ -0,0 +1,54 @@
+import hashlib
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Optional
+from fastapi import Request, Response
+from ..services.data_version import data_versions
+from ..services.response_cache import response_cache
+
+def make_etag(version: str, key: str) -> str:
+    return 'W/"' + hashlib.sha1(f"{version}|{key}".encode()).hexdigest()[:20] + '"'
+
+def _not_modified(request: Request, etag: str, last_modified) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110)
+        return etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+async def conditional_response(
+    request: Request,
+    build: Callable[[], Awaitable[Response]],
+    platform: Optional[str] = None,
+    version: Optional[str] = None,
+) -> Response:
+    """데이터 버전으로 ETag를 만들어 304 / 캐시된 본문 / 새 응답 중 하나를 반환
+
+    platform이 있으면 그 플랫폼의 버전만, 없으면 전체 버전을 본다.
+    ETag는 build 전에 계산하므로 도중에 수집된 데이터는 다음 요청에서 반영된다.
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    etag = make_etag(version or data_versions.version(platform), key)
+    last_modified = data_versions.last_modified(platform)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    body = response_cache.get(key, etag)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    response = await build()
+    if response.status_code == 200:
+        response_cache.put(key, etag, response.body)
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional
+from datetime import datetime, timedelta
+from ...schemas.project import WorkType
+from ...db.database import read_session
+from ..caching import conditional_response
+from ...services.data_version import data_versions
+from ...services.rollups import INTERVALS, hour_bucket, timeseries
+from ...services.skills import canonicalize_skill
+from ...config import settings
+
+router = APIRouter()
+
+@router.get("/analytics/timeseries")
+async def get_timeseries(
+    request: Request,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    interval: str = Query("hour", pattern="^(hour|day|week)$"),
+    platform: Optional[str] = None,
+    work_type: Optional[WorkType] = None,
+    skill: Optional[str] = None,
+    quantiles: List[float] = Query([0.5, 0.9]),
+):
+    """project_rollups에서 읽은 게시 건수와 예산/시급 분위수 (기본: 최근 7일, 시간 단위)"""
+    now = datetime.now()
+    end = end or now
+    start = start or end - timedelta(days=7)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if (end - start) / INTERVALS[interval] > settings.ANALYTICS_MAX_POINTS:
+        raise HTTPException(status_code=400, detail="Too many points; use a larger interval")
+    if any(not 0 <= quantile <= 1 for quantile in quantiles):
+        raise HTTPException(status_code=400, detail="quantiles must be between 0 and 1")
+
+    async def build():
+        async with read_session() as session:
+            points = await timeseries(
+                session, start, end, interval,
+                platform=platform,
+                work_type=work_type.value if work_type else None,
+                skill=canonicalize_skill(skill) if skill else None,
+                quantiles=quantiles,
+            )
+        return ORJSONResponse({"interval": interval, "start": start, "end": end, "points": points})
+
+    # 기본 구간은 현재 시각 기준이므로 시간이 바뀌면 수집이 없어도 ETag가 바뀌어야 함
+    version = f"{data_versions.version(platform)}.{hour_bucket(now):%Y%m%d%H}"
+    return await conditional_response(request, build, platform=platform, version=version)
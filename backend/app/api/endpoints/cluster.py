@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from ...services.change_feed import change_feed
+from ...services.ingest_buffer import ingest_buffer
+from ...services.leader import leader_election
+
+router = APIRouter()
+
+@router.get("/cluster/status")
+async def get_cluster_status():
+    """현재 리더(잠금을 가진 세션)와 이 요청을 처리한 프로세스의 상태"""
+    return {
+        "leader": await leader_election.current_leader(),
+        "process": leader_election.stats(),
+        "change_feed": change_feed.stats(),
+        "ingest": ingest_buffer.stats(),
+    }
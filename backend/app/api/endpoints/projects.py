@@ -1,100 +1,258 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from ...schemas.project import Project, ProjectCreate
-from ...models.project import Project as ProjectModel
-from ...crawlers.wishket import WishketCrawler
-from ...crawlers.freemoa import FreemoaCrawler
-from ...crawlers.upwork import UpworkCrawler
-from ...crawlers.guru import GuruCrawler
-from ...crawlers.freelancer import FreelancerCrawler
-from ...utils.crypto import CryptoUtil
-from ...db.database import async_session
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import List, Optional
+from datetime import datetime
 import json
+from ...schemas.project import Project, ProjectPage, WorkType, PaymentType
+from ...models.project import Project as ProjectModel, ProjectChange
+from ...utils.public_id import decode_id, encode_id
+from ...db.database import async_session, read_session
+from ..caching import conditional_response
+from ...services.change_feed import CRAWL_CHANNEL, change_feed
+from ...services.crawler_scheduler import crawl_once
+from ...services.leader import leader_election
+from ...services.stats_cache import stats_cache
+from ...services.data_version import data_versions
+from ...services.export import FORMATS, export_projects
+from ...services.project_query import (
+    SORTS, ProjectFilter, encode_cursor, encode_search_cursor, list_select, paginate, search, top_skills,
+)
+from ...config import settings
+from sqlalchemy import select
 
 router = APIRouter()
-crypto = CryptoUtil()
-
-@router.get("/projects", response_model=List[Project])
-async def get_projects():
-    async with async_session() as session:
-        result = await session.execute(select(ProjectModel))
-        return result.scalars().all()
-
-@router.get("/projects/{platform}", response_model=List[Project])
-async def get_platform_projects(platform: str):
-    async with async_session() as session:
-        result = await session.execute(
-            select(ProjectModel).filter(ProjectModel.platform == platform)
-        )
-        return result.scalars().all()
+
+SORT_PATTERN = "^(" + "|".join(SORTS) + ")$"
+
+def project_filters(
+    platform: Optional[str] = None,
+    work_type: Optional[WorkType] = None,
+    payment_type: Optional[PaymentType] = None,
+    currency: Optional[str] = None,
+    budget_min: Optional[float] = None,
+    budget_max: Optional[float] = None,
+    budget_usd_min: Optional[float] = None,
+    budget_usd_max: Optional[float] = None,
+    hourly_usd_min: Optional[float] = None,
+    posted_since: Optional[datetime] = None,
+    status: Optional[str] = None,
+    skills_any: Optional[List[str]] = Query(None),
+    skills_all: Optional[List[str]] = Query(None),
+    collapse_duplicates: bool = False,
+    applicants_max: Optional[int] = None,
+    client_rating_min: Optional[float] = None,
+    experience_level: Optional[str] = None,
+    location: Optional[str] = None,
+    exclude_private: bool = False,
+    meta: Optional[str] = Query(None, description='project_metadata 포함 조건 (JSON, 예: {"field": "개발"})'),
+) -> ProjectFilter:
+    return ProjectFilter(
+        platform=platform,
+        work_type=work_type.value if work_type else None,
+        payment_type=payment_type.value if payment_type else None,
+        currency=currency,
+        budget_min=budget_min,
+        budget_max=budget_max,
+        budget_usd_min=budget_usd_min,
+        budget_usd_max=budget_usd_max,
+        hourly_usd_min=hourly_usd_min,
+        posted_since=posted_since,
+        status=status,
+        skills_any=_split_skills(skills_any),
+        skills_all=_split_skills(skills_all),
+        collapse_duplicates=collapse_duplicates,
+        applicants_max=applicants_max,
+        client_rating_min=client_rating_min,
+        experience_level=experience_level,
+        location=location,
+        exclude_private=exclude_private,
+        metadata_contains=_parse_meta(meta),
+    )
+
+def _parse_meta(meta: Optional[str]) -> Optional[dict]:
+    if not meta:
+        return None
+    try:
+        value = json.loads(meta)
+    except ValueError:
+        value = None
+    if not isinstance(value, dict):
+        raise HTTPException(status_code=400, detail="meta must be a JSON object")
+    return value
+
+def _split_skills(values: Optional[List[str]]) -> Optional[List[str]]:
+    # ?skills_any=react&skills_any=python 과 ?skills_any=react,python 모두 허용
+    if not values:
+        return None
+    return [skill for value in values for skill in value.split(",") if skill.strip()]
+
+def page_response(items: List[dict], next_cursor: Optional[str]) -> ORJSONResponse:
+    # DB에서 읽은 값은 다시 검증하지 않고 orjson으로 바로 인코딩 (response_model은 문서용)
+    for item in items:
+        item["public_id"] = encode_id(item["id"])
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor})
+
+async def list_projects(filters: ProjectFilter, cursor: Optional[str], limit: int, sort: str) -> ORJSONResponse:
+    try:
+        stmt = paginate(filters.apply(list_select()), cursor, limit, sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async with read_session() as session:
+        result = await session.execute(stmt)
+        rows = result.mappings().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][SORTS[sort][0].key], rows[-1]["id"])
+    return page_response([dict(row) for row in rows], next_cursor)
+
+@router.get("/projects", response_model=ProjectPage)
+async def get_projects(
+    request: Request,
+    filters: ProjectFilter = Depends(project_filters),
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    sort: str = Query("newest", pattern=SORT_PATTERN),
+):
+    return await conditional_response(request, lambda: list_projects(filters, cursor, limit, sort), platform=filters.platform)
+
+@router.get("/projects/export")
+async def export(
+    format: str = Query("ndjson", pattern="^(ndjson|csv|parquet)$"),
+    compress: bool = True,
+    filters: ProjectFilter = Depends(project_filters),
+):
+    """필터에 맞는 전체 프로젝트를 스트리밍으로 내보냄 (/projects/{platform} 보다 먼저 등록)"""
+    try:
+        chunks = export_projects(filters, format, compress)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    media_type, extension = FORMATS[format]
+    filename = f"projects.{extension}"
+    if compress and format != "parquet":
+        media_type, filename = "application/gzip", f"{filename}.gz"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.get("/projects/{platform}", response_model=ProjectPage)
+async def get_platform_projects(
+    request: Request,
+    platform: str,
+    filters: ProjectFilter = Depends(project_filters),
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    sort: str = Query("newest", pattern=SORT_PATTERN),
+):
+    filters.platform = platform
+    return await conditional_response(request, lambda: list_projects(filters, cursor, limit, sort), platform=platform)
+
+@router.get("/search", response_model=ProjectPage)
+async def search_projects(
+    q: str = Query(..., min_length=1),
+    filters: ProjectFilter = Depends(project_filters),
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+):
+    try:
+        stmt = search(filters.apply(list_select()), q, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async with read_session() as session:
+        result = await session.execute(stmt)
+        rows = [dict(row) for row in result.mappings()]
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_search_cursor(rows[-1]["rank"], rows[-1]["id"])
+    for row in rows:
+        del row["rank"]
+    return page_response(rows, next_cursor)
+
+@router.get("/skills/top")
+async def get_top_skills(
+    filters: ProjectFilter = Depends(project_filters),
+    limit: int = Query(20, ge=1, le=200),
+):
+    async with read_session() as session:
+        result = await session.execute(top_skills(filters, limit))
+        return [
+            {"skill": skill, "display_name": display_name or skill, "count": count}
+            for skill, display_name, count in result
+        ]
 
 @router.post("/crawl")
 async def start_crawling():
-    crawlers = {
-        "wishket": WishketCrawler(),
-        "freemoa": FreemoaCrawler(),
-        "upwork": UpworkCrawler(),
-        "guru": GuruCrawler()
-    }
-    
-    results = []
-    async with async_session() as session:
-        for platform, crawler in crawlers.items():
-            try:
-                projects = await crawler.crawl()
-                
-                for project_data in projects:
-                    try:
-                        project_data.skills = json.dumps(project_data.skills)
-                        db_project = ProjectModel(**project_data.dict())
-                        
-                        # 비동기 방식으로 변경
-                        existing = await session.execute(
-                            select(ProjectModel).filter(ProjectModel.url == db_project.url)
-                        )
-                        if not existing.scalar_one_or_none():
-                            session.add(db_project)
-                            results.append(project_data)
-                    except Exception as e:
-                        print(f"Error saving project from {platform}: {str(e)}")
-                        continue
-                        
-            except Exception as e:
-                print(f"Error crawling {platform}: {str(e)}")
-                continue
-        
-        try:
+    # 브라우저 크롤러는 리더 프로세스에서만 실행하므로 다른 워커는 리더에게 요청만 전달
+    if not leader_election.is_leader:
+        async with async_session() as session:
+            await change_feed.publish(session, CRAWL_CHANNEL, {})
             await session.commit()
-        except Exception as e:
-            await session.rollback()
-            raise HTTPException(status_code=500, detail="Database error")
-            
-    return {"message": f"Crawled {len(results)} new projects"}
+        return {"message": "Crawl requested on the leader"}
+
+    queued = await crawl_once()
+    return {"message": f"Crawled {queued} projects"}
+
+async def _stats_response(request: Request, shape):
+    stats = shape(await stats_cache.get())  # 시각 구간이 바뀌었을 때만 DB 조회
+
+    async def build():
+        return ORJSONResponse(stats)
+
+    # 24시간 건수는 수집 없이도 바뀌므로 건수를 읽은 시각 구간(STATS_CACHE_TTL 단위)도 ETag에 포함
+    version = f"{data_versions.version()}.{stats_cache.window}"
+    return await conditional_response(request, build, version=version)
 
 @router.get("/stats")
-async def get_stats():
-    stats = {}
-    platforms = ["wishket", "freemoa", "upwork", "guru"]
-    
-    async with async_session() as session:
-        for platform in platforms:
-            result = await session.execute(
-                select(ProjectModel).filter(ProjectModel.platform == platform)
-            )
-            stats[platform] = len(result.scalars().all())
-    
-    return stats
-
-@router.get("/{encrypted_id}")
-async def get_project(encrypted_id: str):
-    async with async_session() as session:
-        result = await session.execute(
-            select(ProjectModel).filter(ProjectModel.id == encrypted_id)
-        )
-        project = result.scalar_one_or_none()
-        
-        if project:
-            original_id = crypto.decrypt_id(project.id)
-            project.url = f"https://www.upwork.com/jobs/~{original_id}"
-        return project
\ No newline at end of file
+async def get_stats(request: Request):
+    """플랫폼별 프로젝트 수 ({platform: count}, 기존 응답 형식 유지)"""
+    return await _stats_response(
+        request, lambda stats: {platform: counts["total"] for platform, counts in stats["platforms"].items()}
+    )
+
+@router.get("/stats/detail")
+async def get_stats_detail(request: Request):
+    """전체/24시간 건수와 플랫폼, work_type, payment_type별 분포"""
+    return await _stats_response(request, lambda stats: stats)
+
+@router.get("/changes")
+async def get_changes(since: datetime, platform: Optional[str] = None, limit: int = Query(500, le=5000)):
+    """since 이후 내용이 바뀐 프로젝트의 변경 기록"""
+    stmt = (
+        select(ProjectChange)
+        .filter(ProjectChange.changed_at > since)
+        .order_by(ProjectChange.changed_at, ProjectChange.id)
+        .limit(limit)
+    )
+    if platform:
+        stmt = stmt.filter(ProjectChange.platform == platform)
+    async with read_session() as session:
+        result = await session.execute(stmt)
+        return [
+            {
+                "project_id": change.project_id,
+                "platform": change.platform,
+                "changed_fields": change.changed_fields,
+                "changed_at": change.changed_at,
+            }
+            for change in result.scalars().all()
+        ]
+
+@router.get("/{public_id}", response_model=Project)
+async def get_project(public_id: str):
+    project_id = decode_id(public_id)
+    if project_id is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    async with read_session() as session:
+        result = await session.execute(list_select().where(ProjectModel.id == project_id))
+        row = result.mappings().one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return ORJSONResponse(dict(row, public_id=public_id))
@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Header, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+import asyncio
+import json
+from ...config import settings
+from ...services.broadcast import Event, broadcast_hub
+from ...services.skills import canonicalize_skills
+
+router = APIRouter()
+
+def _event_json(event: Event) -> str:
+    return json.dumps(event.data, default=str, ensure_ascii=False)
+
+async def _subscribe(platform: Optional[List[str]], skills: Optional[List[str]], last_event_id: Optional[int]):
+    return await broadcast_hub.subscribe(
+        platforms=platform,
+        skills=canonicalize_skills(skills) if skills else None,
+        last_event_id=last_event_id,
+    )
+
+@router.get("/stream")
+async def stream_projects(
+    request: Request,
+    platform: Optional[List[str]] = Query(None),
+    skills: Optional[List[str]] = Query(None),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+):
+    """Server-Sent Events로 신규/변경 프로젝트 전달"""
+    subscriber = await _subscribe(platform, skills, last_event_id)
+
+    async def event_source():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscriber.get(), timeout=settings.STREAM_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    break
+                yield f"id: {event.id}\nevent: {event.type}\ndata: {_event_json(event)}\n\n"
+        finally:
+            broadcast_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.websocket("/ws")
+async def websocket_projects(
+    websocket: WebSocket,
+    platform: Optional[List[str]] = Query(None),
+    skills: Optional[List[str]] = Query(None),
+    last_event_id: Optional[int] = None,
+):
+    """WebSocket으로 신규/변경 프로젝트 전달 ({"id", "type", "data"})"""
+    await websocket.accept()
+    subscriber = await _subscribe(platform, skills, last_event_id)
+    try:
+        while True:
+            event = await subscriber.get()
+            if event is None:
+                # 버퍼가 넘친 느린 클라이언트
+                await websocket.close(code=1008, reason="Client too slow")
+                break
+            await websocket.send_text(json.dumps(
+                {"id": event.id, "type": event.type, "data": event.data}, default=str, ensure_ascii=False
+            ))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broadcast_hub.unsubscribe(subscriber)
@@ -0,0 +1,81 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+from sqlalchemy import delete, select
+from ...schemas.project import Project
+from ...schemas.subscription import Subscription, SubscriptionCreate
+from ...models.project import Project as ProjectModel
+from ...models.subscription import Subscription as SubscriptionModel, Notification
+from ...db.database import async_session, read_session
+from ...services.change_feed import SUBSCRIPTION_CHANNEL, change_feed
+from ...services.percolator import CompiledSubscription, percolator
+from ...services.skills import canonicalize_skills
+
+router = APIRouter()
+
+@router.post("/subscriptions", response_model=Subscription)
+async def create_subscription(data: SubscriptionCreate):
+    subscription = SubscriptionModel(
+        name=data.name,
+        skills=canonicalize_skills(data.skills),
+        platforms=data.platforms,
+        work_types=[work_type.value for work_type in data.work_types],
+        payment_types=[payment_type.value for payment_type in data.payment_types],
+        min_budget_usd=data.min_budget_usd,
+        min_hourly_usd=data.min_hourly_usd,
+        active=True,
+    )
+    async with async_session() as session:
+        session.add(subscription)
+        # 수집은 리더 프로세스에서 하므로 다른 프로세스의 percolator도 다시 로드하게 함
+        await change_feed.publish(session, SUBSCRIPTION_CHANNEL, {})
+        await session.commit()
+        await session.refresh(subscription)
+    percolator.add(CompiledSubscription.from_model(subscription))
+    return subscription
+
+@router.get("/subscriptions", response_model=List[Subscription])
+async def get_subscriptions():
+    async with read_session() as session:
+        result = await session.execute(select(SubscriptionModel).order_by(SubscriptionModel.id))
+        return result.scalars().all()
+
+@router.delete("/subscriptions/{subscription_id}")
+async def delete_subscription(subscription_id: int):
+    async with async_session() as session:
+        result = await session.execute(
+            delete(SubscriptionModel).where(SubscriptionModel.id == subscription_id)
+        )
+        if not result.rowcount:
+            raise HTTPException(status_code=404, detail="Subscription not found")
+        await session.execute(delete(Notification).where(Notification.subscription_id == subscription_id))
+        await change_feed.publish(session, SUBSCRIPTION_CHANNEL, {})
+        await session.commit()
+    percolator.remove(subscription_id)
+    return {"message": "Subscription deleted"}
+
+@router.get("/subscriptions/{subscription_id}/notifications")
+async def get_notifications(
+    subscription_id: int,
+    after_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=500),
+):
+    """구독에 매칭된 프로젝트 (after_id 이후 알림만, 오래된 순)"""
+    stmt = (
+        select(Notification.id, Notification.created_at, ProjectModel)
+        .join(ProjectModel, ProjectModel.id == Notification.project_id)
+        .where(Notification.subscription_id == subscription_id)
+        .order_by(Notification.id)
+        .limit(limit)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Notification.id > after_id)
+    async with read_session() as session:
+        result = await session.execute(stmt)
+        return [
+            {"id": notification_id, "created_at": created_at, "project": Project.model_validate(project)}
+            for notification_id, created_at, project in result
+        ]
+
+@router.get("/percolator/stats")
+async def get_percolator_stats():
+    return percolator.stats()
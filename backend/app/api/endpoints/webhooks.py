@@ -0,0 +1,87 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+import secrets
+from sqlalchemy import delete, select, update
+from ...schemas.webhook import Webhook, WebhookCreate, WebhookCreated
+from ...models.webhook import WebhookDelivery, WebhookEndpoint
+from ...db.database import async_session, read_session
+from ...services.webhooks import webhook_dispatcher
+
+router = APIRouter()
+
+@router.post("/webhooks", response_model=WebhookCreated)
+async def create_webhook(data: WebhookCreate):
+    endpoint = WebhookEndpoint(
+        url=data.url,
+        secret=data.secret or secrets.token_hex(32),
+        subscription_id=data.subscription_id,
+        active=True,
+    )
+    async with async_session() as session:
+        session.add(endpoint)
+        await session.commit()
+        await session.refresh(endpoint)
+    return endpoint
+
+@router.get("/webhooks", response_model=List[Webhook])
+async def get_webhooks():
+    async with read_session() as session:
+        result = await session.execute(select(WebhookEndpoint).order_by(WebhookEndpoint.id))
+        return result.scalars().all()
+
+@router.get("/webhooks/stats")
+async def get_webhook_stats():
+    return webhook_dispatcher.stats()
+
+@router.delete("/webhooks/{webhook_id}")
+async def delete_webhook(webhook_id: int):
+    async with async_session() as session:
+        result = await session.execute(delete(WebhookEndpoint).where(WebhookEndpoint.id == webhook_id))
+        if not result.rowcount:
+            raise HTTPException(status_code=404, detail="Webhook not found")
+        await session.execute(delete(WebhookDelivery).where(WebhookDelivery.endpoint_id == webhook_id))
+        await session.commit()
+    return {"message": "Webhook deleted"}
+
+@router.get("/webhooks/{webhook_id}/deliveries")
+async def get_deliveries(
+    webhook_id: int,
+    status: Optional[str] = Query(None, pattern="^(pending|delivered|dead)$"),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    stmt = (
+        select(WebhookDelivery)
+        .where(WebhookDelivery.endpoint_id == webhook_id)
+        .order_by(WebhookDelivery.id.desc())
+        .limit(limit)
+    )
+    if status:
+        stmt = stmt.where(WebhookDelivery.status == status)
+    async with read_session() as session:
+        result = await session.execute(stmt)
+        return [
+            {
+                "id": delivery.id,
+                "project_id": delivery.project_id,
+                "status": delivery.status,
+                "attempts": delivery.attempts,
+                "next_attempt_at": delivery.next_attempt_at,
+                "last_error": delivery.last_error,
+                "delivered_at": delivery.delivered_at,
+            }
+            for delivery in result.scalars().all()
+        ]
+
+@router.post("/webhooks/{webhook_id}/redeliver")
+async def redeliver_dead(webhook_id: int):
+    """dead 상태의 전송 건을 다시 대기열에 넣음"""
+    async with async_session() as session:
+        result = await session.execute(
+            update(WebhookDelivery)
+            .where(WebhookDelivery.endpoint_id == webhook_id, WebhookDelivery.status == "dead")
+            .values(status="pending", attempts=0, next_attempt_at=WebhookDelivery.created_at)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+    webhook_dispatcher.wake()
+    return {"message": f"Requeued {result.rowcount} deliveries"}
@@ -1,6 +1,4 @@
 from pydantic_settings import BaseSettings
-import secrets
-from cryptography.fernet import Fernet
 
 class Settings(BaseSettings):
     POSTGRES_USER: str
@@ -8,15 +6,70 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: str
     POSTGRES_DB: str
+    POSTGRES_READ_HOST: str = ""  # 조회 전용 복제본 (비어 있으면 POSTGRES_HOST 사용)
+
+    # 커넥션 풀 (쓰기: 크롤러 저장, 읽기: API 조회)
+    DB_WRITE_POOL_SIZE: int = 5
+    DB_WRITE_MAX_OVERFLOW: int = 5
+    DB_READ_POOL_SIZE: int = 10
+    DB_READ_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statement cache
     
     WISHKET_URL: str = "https://www.wishket.com/project/?d=A4FwvCCGDODWD6AjGBTAJgMhQYzWAKgE4CuKQA%3D%3D"
     FREEMOA_URL: str = "https://www.freemoa.net/m4/s41?page="
     UPWORK_URL: str = "https://www.upwork.com/nx/search/jobs/?hourly_rate=10-&nbs=1&q=next%20react&sort=recency&t=0"
     GURU_URL: str = "https://www.guru.com/d/jobs/c/programming-development/"
     FREELANCER_URL: str = "https://www.freelancer.com/jobs/html_css_react-js_react-native_python_nextjs/?languages=en,ko"
-    ENCRYPTION_KEY: str = Fernet.generate_key().decode()  # 서버 시작시 생성
+    PUBLIC_ID_KEY: str  # 공개 프로젝트 id 인코딩 키 (필수, 16자 이상 무작위 값). 모든 워커가 같은 값을 써야 하며 바꾸면 기존 URL이 깨짐
+    PUBLIC_ID_CACHE_SIZE: int = 100000  # 인코딩/디코딩 결과 LRU 캐시 크기
+    ENABLED_CRAWLERS: str = "upwork,wishket,guru,freelancer,freemoa"  # 실행할 크롤러 (쉼표 구분, app.crawlers.registry 참고)
     UPWORK_CRAWL_INTERVAL: int = 30  # seconds
     OTHER_CRAWL_INTERVAL: int = 300  # seconds
+    UPSERT_BATCH_SIZE: int = 500  # INSERT ... ON CONFLICT 한 문장당 행 수
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 200  # 목록 API 페이지 크기 상한
+    STATS_CACHE_TTL: int = 300  # seconds, 이 길이의 시각 구간이 바뀌면 /api/stats 집계를 DB에서 다시 읽음
+    RESPONSE_CACHE_SIZE: int = 512  # 읽기 API 응답 캐시 항목 수
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 응답 캐시 전체 크기 상한
+    EXPORT_CHUNK_SIZE: int = 2000  # 내보내기 시 서버 측 커서에서 한 번에 읽는 행 수
+    PARTITION_MONTHS_AHEAD: int = 3  # 미리 만들어 둘 월 파티션 수
+    PARTITION_RETENTION_MONTHS: int = 12  # 이보다 오래된 월 파티션은 Parquet으로 보관 후 삭제
+    PARTITION_MAINTENANCE_INTERVAL: int = 86400  # seconds
+    PROJECT_ACTIVE_DAYS: int = 60  # 게시 후 이 기간이 지난 active 프로젝트는 closed로 표시
+    ARCHIVE_DIR: str = "data/archive"
+    ANALYTICS_MAX_POINTS: int = 2000  # /api/analytics/timeseries 한 번에 반환하는 구간 수 상한
+    ROLLUP_BACKFILL_WORKERS: int = 4  # scripts/backfill_rollups.py 동시 처리 월 수
+    INGEST_QUEUE_SIZE: int = 5000  # 큐가 가득 차면 크롤러가 대기 (backpressure)
+    INGEST_BATCH_SIZE: int = 500  # flush 당 최대 행 수
+    INGEST_FLUSH_INTERVAL: float = 2.0  # seconds
+    INGEST_MAX_RETRIES: int = 5  # 이후에는 스필 파일로 저장
+    INGEST_SPILL_DIR: str = "data/spill"
+    DEDUP_THRESHOLD: float = 0.8  # 유사 중복으로 볼 추정 Jaccard 유사도
+    DEDUP_WINDOW_DAYS: int = 60  # LSH 인덱스에 유지할 기간
+    DEDUP_SHINGLE_SIZE: int = 5  # 문자 n-gram 길이
+    STREAM_HISTORY_SIZE: int = 1000  # Last-Event-ID 재개용으로 보관할 이벤트 수
+    STREAM_CLIENT_BUFFER: int = 256  # 클라이언트별 버퍼, 넘치면 연결 종료
+    STREAM_KEEPALIVE: int = 15  # seconds
+    PERCOLATOR_RELOAD_INTERVAL: int = 60  # 다른 프로세스의 구독 변경을 반영하는 주기 (seconds)
+    WEBHOOK_BATCH_SIZE: int = 50  # 요청 한 번에 담는 프로젝트 수
+    WEBHOOK_MAX_CONCURRENCY: int = 4  # 엔드포인트별 동시 요청 수
+    WEBHOOK_MAX_ATTEMPTS: int = 8  # 초과하면 dead 상태로 전환
+    WEBHOOK_TIMEOUT: float = 10.0  # seconds
+    WEBHOOK_POLL_INTERVAL: float = 5.0  # seconds
+    WEBHOOK_BACKOFF_BASE: float = 10.0  # 첫 재시도 대기 (이후 2배씩, seconds)
+    WEBHOOK_BACKOFF_MAX: float = 3600.0  # seconds
+    FX_RATES_URL: str = "https://open.er-api.com/v6/latest/USD"  # USD 기준 환율 API
+    FX_CACHE_PATH: str = "data/fx_rates.json"
+    FX_REFRESH_INTERVAL: int = 21600  # seconds
+    LEADER_LOCK_ID: int = 7302001  # 크롤러 리더 선출용 advisory lock 키 (같은 DB를 쓰는 배포마다 달라야 함)
+    LEADER_CHECK_INTERVAL: float = 5.0  # 리더 잠금 시도/확인 주기, 장애 시 넘겨받는 데 걸리는 최대 시간 (seconds)
+    CHANGE_FEED_PING_INTERVAL: float = 30.0  # LISTEN 연결 확인 및 재연결 주기 (seconds)
+    SEEN_SET_CAPACITY: int = 200000  # 플랫폼별 Bloom filter 용량
+    SEEN_SET_ERROR_RATE: float = 0.001  # 목표 거짓 양성률
+    SEEN_SET_SNAPSHOT_PATH: str = "data/seen_set.bin"
+    SEEN_SET_SNAPSHOT_INTERVAL: int = 600  # seconds
     class Config:
         env_file = ".env"
 
@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 from logging.handlers import RotatingFileHandler
 
@@ -13,6 +14,7 @@ def setup_logger(name: str) -> logging.Logger:
     )
 
     # 파일 핸들러 생성 (logs 디렉토리에 로그 파일 저장)
+    os.makedirs('logs', exist_ok=True)
     file_handler = RotatingFileHandler(
         f'logs/{name}.log',
         maxBytes=10485760,  # 10MB
@@ -0,0 +1,43 @@
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Type
+from ..config import settings
+
+if TYPE_CHECKING:
+    from .base import BaseCrawler
+
+@dataclass(frozen=True)
+class CrawlerSpec:
+    module: str  # app.crawlers 아래 모듈 이름
+    class_name: str
+    interval: str = "OTHER_CRAWL_INTERVAL"  # 실행 주기 설정 이름 (같은 주기의 크롤러는 한 루프에서 차례로 실행)
+
+# 플랫폼 -> 크롤러. 모듈은 처음 사용할 때 import 하므로 API만 제공하는 프로세스는 selenium/playwright를 불러오지 않음
+CRAWLERS: Dict[str, CrawlerSpec] = {
+    "upwork": CrawlerSpec("upwork", "UpworkCrawler", interval="UPWORK_CRAWL_INTERVAL"),
+    "wishket": CrawlerSpec("wishket", "WishketCrawler"),
+    "guru": CrawlerSpec("guru", "GuruCrawler"),
+    "freelancer": CrawlerSpec("freelancer", "FreelancerCrawler"),
+    "freemoa": CrawlerSpec("freemoa", "FreemoaCrawler"),
+}
+
+def enabled_platforms() -> List[str]:
+    """ENABLED_CRAWLERS에 나열된 플랫폼 (설정 순서)"""
+    platforms = [name.strip() for name in settings.ENABLED_CRAWLERS.split(",") if name.strip()]
+    unknown = [name for name in platforms if name not in CRAWLERS]
+    if unknown:
+        raise ValueError(f"Unknown crawlers in ENABLED_CRAWLERS: {', '.join(unknown)}")
+    return platforms
+
+def crawl_interval(platform: str) -> int:
+    return getattr(settings, CRAWLERS[platform].interval)
+
+@lru_cache(maxsize=None)
+def crawler_class(platform: str) -> Type["BaseCrawler"]:
+    spec = CRAWLERS[platform]
+    module = importlib.import_module(f".{spec.module}", __package__)
+    return getattr(module, spec.class_name)
+
+def create_crawler(platform: str) -> "BaseCrawler":
+    return crawler_class(platform)()
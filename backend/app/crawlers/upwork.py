@@ -254,7 +254,7 @@ class UpworkCrawler(BaseCrawler):
                 work_type=work_type,
                 payment_type=payment_type,
                 original_url=full_url,
-                project_metadata={
+                metadata={
                     "category": "",
                     "location": "",
                     "term": project_length,
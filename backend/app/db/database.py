@@ -1,21 +1,75 @@
+from sqlalchemy import text
+from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from ..config import settings
-from urllib.parse import quote_plus
+from .schema import SCHEMA_UPGRADES
 
-# URL 인코딩을 사용한 연결 문자열 생성
-password = quote_plus(settings.POSTGRES_PASSWORD)
-DATABASE_URL = f"postgresql+asyncpg://{settings.POSTGRES_USER}:{password}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
+def _database_url(host: str) -> URL:
+    # URL.create가 사용자/비밀번호의 특수문자를 인코딩
+    return URL.create(
+        "postgresql+asyncpg",
+        username=settings.POSTGRES_USER,
+        password=settings.POSTGRES_PASSWORD,
+        host=host,
+        port=int(settings.POSTGRES_PORT),
+        database=settings.POSTGRES_DB,
+        query={"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)},
+    )
+
+def _create_engine(host: str, pool_size: int, max_overflow: int):
+    return create_async_engine(
+        _database_url(host),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+    )
+
+# 크롤러 쓰기용과 API 조회용 풀을 분리하여 서로 연결을 기다리지 않도록 함
+engine = _create_engine(settings.POSTGRES_HOST, settings.DB_WRITE_POOL_SIZE, settings.DB_WRITE_MAX_OVERFLOW)
+read_engine = _create_engine(
+    settings.POSTGRES_READ_HOST or settings.POSTGRES_HOST,
+    settings.DB_READ_POOL_SIZE,
+    settings.DB_READ_MAX_OVERFLOW,
+)
 
-# SQLAlchemy 엔진 생성
-engine = create_async_engine(DATABASE_URL)
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+read_session = sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
 
+# 여러 워커가 동시에 시작할 때 DDL이 겹치지 않도록 트랜잭션 단위로 잡는 advisory lock 키
+SCHEMA_LOCK_ID = 7302000
+
+async def lock_schema(conn):
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_ID})
+
+def _create_missing_indexes(sync_conn):
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+async def init_db():
+    """테이블 생성 및 스키마 업그레이드 (앱 시작 시 1회)"""
+    from ..models import project, rollup, skill, subscription, webhook  # noqa: F401 - 모델을 Base.metadata에 등록
+
+    async with engine.begin() as conn:
+        await lock_schema(conn)
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
+        # 기존 테이블에 새로 정의된 인덱스 생성
+        await conn.run_sync(_create_missing_indexes)
+
+async def dispose_engines():
+    await engine.dispose()
+    await read_engine.dispose()
+
 async def get_db():
-    async with async_session() as db:
+    async with read_session() as db:
         try:
             yield db
         finally:
-            await db.close()
\ No newline at end of file
+            await db.close()
@@ -0,0 +1,83 @@
+# 제목(A)과 설명(B)에 가중치를 둔 검색 벡터. 한/영 혼용 텍스트이므로 형태소 분석 없이 'simple' 사용
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+# create_all은 기존 테이블에 컬럼을 추가하지 않으므로, 이미 배포된 DB에 적용할 DDL을 순서대로 관리
+SCHEMA_UPGRADES = [
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)",
+    # keyset 페이지네이션은 posted_date가 NULL이 아니어야 함
+    "UPDATE projects SET posted_date = created_at WHERE posted_date IS NULL",
+    "ALTER TABLE projects ALTER COLUMN posted_date SET NOT NULL",
+    f"ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS minhash BYTEA",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS cluster_id INTEGER",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS budget_min_usd DOUBLE PRECISION",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS budget_max_usd DOUBLE PRECISION",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS budget_hourly_usd DOUBLE PRECISION",
+    # skills JSON -> text[] (ALTER ... USING에는 서브쿼리를 쓸 수 없어 새 컬럼으로 옮긴 뒤 교체)
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'projects' AND column_name = 'skills' AND data_type = 'json'
+        ) THEN
+            ALTER TABLE projects ADD COLUMN skills_array text[];
+            UPDATE projects SET skills_array = ARRAY(
+                SELECT DISTINCT lower(btrim(skill))
+                FROM json_array_elements_text(
+                    CASE json_typeof(skills)
+                        WHEN 'array' THEN skills
+                        WHEN 'string' THEN (skills #>> '{}')::json
+                        ELSE '[]'::json
+                    END
+                ) AS skill
+                WHERE btrim(skill) <> ''
+            );
+            ALTER TABLE projects DROP COLUMN skills;
+            ALTER TABLE projects RENAME COLUMN skills_array TO skills;
+        END IF;
+    END $$
+    """,
+    # project_metadata JSON -> JSONB (GIN jsonb_path_ops 인덱스용)
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'projects' AND column_name = 'project_metadata' AND data_type = 'json'
+        ) THEN
+            ALTER TABLE projects ALTER COLUMN project_metadata TYPE jsonb USING project_metadata::jsonb;
+        END IF;
+    END $$
+    """,
+    # project_metadata에서 승격한 컬럼 (기존 행은 scripts/backfill_metadata.py로 채움)
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS applicants INTEGER",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS view_count INTEGER",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS experience_level VARCHAR(50)",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS client_rating DOUBLE PRECISION",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS is_private BOOLEAN",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS term VARCHAR(100)",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS location VARCHAR(200)",
+    # 파티션 도입 전에 저장된 URL 등록 (project_urls가 비어 있을 때만 한 번)
+    """
+    INSERT INTO project_urls (original_url, posted_date)
+    SELECT original_url, min(posted_date) FROM projects
+    WHERE NOT EXISTS (SELECT 1 FROM project_urls)
+    GROUP BY original_url
+    """,
+    # 스트림 이벤트 id (Last-Event-ID 재개용). 기존 행은 NULL로 두고 이후 추가/변경부터 번호를 받음
+    "CREATE SEQUENCE IF NOT EXISTS project_event_seq",
+    "ALTER TABLE projects ADD COLUMN IF NOT EXISTS event_seq BIGINT",
+    "ALTER TABLE projects ALTER COLUMN event_seq SET DEFAULT nextval('project_event_seq')",
+    # 롤업 스케치(고정 로그 버킷 건수 배열)의 원소별 합 (services.rollups의 upsert에서 사용)
+    """
+    CREATE OR REPLACE FUNCTION sketch_merge(a integer[], b integer[]) RETURNS integer[]
+    LANGUAGE sql IMMUTABLE AS $$
+        SELECT array_agg(coalesce(x, 0) + coalesce(y, 0) ORDER BY i)
+        FROM unnest(a, b) WITH ORDINALITY AS t(x, y, i)
+    $$
+    """,
+]
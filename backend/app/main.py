@@ -1,10 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .api.endpoints import projects
-from .models import project
-from sqlalchemy import create_engine
-from .config import settings
-from .services.crawler_scheduler import CrawlerScheduler
+from .api.endpoints import analytics, cluster, projects, stream, subscriptions, webhooks
+from .db.database import init_db, dispose_engines
+from .services.crawler_scheduler import CrawlerScheduler, on_crawl_request
+from .services.change_feed import CRAWL_CHANNEL, DATA_CHANNEL, INGEST_CHANNEL, SUBSCRIPTION_CHANNEL, change_feed
+from .services.leader import leader_election
+from .services.seen_set import seen_set
+from .services.dedup import dedup_index
+from .services.fx import fx_rates
+from .services.ingest_buffer import ingest_buffer
+from .services.stats_cache import stats_cache
+from .services.data_version import data_versions
+from .services.broadcast import broadcast_hub
+from .services.percolator import percolator
+from .services.partitions import partition_manager
+from .services.webhooks import webhook_dispatcher
 import asyncio
 
 app = FastAPI(title="Project Crawler API")
@@ -18,23 +28,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 데이터베이스 초기화
-engine = create_engine(
-    "postgresql+psycopg2://",
-    pool_pre_ping=True,
-    connect_args={
-        "user": settings.POSTGRES_USER,
-        "password": settings.POSTGRES_PASSWORD,
-        "host": settings.POSTGRES_HOST,
-        "port": settings.POSTGRES_PORT,
-        "database": settings.POSTGRES_DB,
-        "client_encoding": 'utf8'
-    }
-)
-
-project.Base.metadata.create_all(bind=engine)
-
-# 라우터 등록
+# 라우터 등록 (projects의 /api/{public_id} 보다 먼저 매칭되도록 앞에 둠)
+app.include_router(stream.router, prefix="/api", tags=["stream"])
+app.include_router(subscriptions.router, prefix="/api", tags=["subscriptions"])
+app.include_router(webhooks.router, prefix="/api", tags=["webhooks"])
+app.include_router(analytics.router, prefix="/api", tags=["analytics"])
+app.include_router(cluster.router, prefix="/api", tags=["cluster"])
 app.include_router(projects.router, prefix="/api", tags=["projects"])
 
 @app.get("/")
@@ -43,5 +42,43 @@ async def root():
 
 @app.on_event("startup")
 async def startup_event():
-    scheduler = CrawlerScheduler()
-    asyncio.create_task(scheduler.start())
\ No newline at end of file
+    await init_db()
+    await partition_manager.start()
+    await seen_set.warm()
+    await dedup_index.load()
+    await percolator.load()
+    await data_versions.refresh()
+    ingest_buffer.add_listener(stats_cache.on_ingested)
+    ingest_buffer.add_listener(data_versions.on_ingested)
+    ingest_buffer.add_listener(broadcast_hub.on_ingested)
+    ingest_buffer.add_listener(webhook_dispatcher.on_ingested)
+    # 다른 프로세스(리더)의 수집/구독 변경/크롤링 요청 알림
+    change_feed.subscribe(INGEST_CHANNEL, ingest_buffer.on_remote_ingest)
+    change_feed.subscribe(SUBSCRIPTION_CHANNEL, percolator.on_remote_change)
+    change_feed.subscribe(CRAWL_CHANNEL, on_crawl_request)
+    change_feed.subscribe(DATA_CHANNEL, data_versions.on_remote_change)
+    change_feed.subscribe(DATA_CHANNEL, stats_cache.on_remote_change)
+    change_feed.add_reconnect_hook(data_versions.schedule_refresh)
+    change_feed.add_reconnect_hook(stats_cache.invalidate)
+    await change_feed.start()
+    await ingest_buffer.start()
+    asyncio.create_task(fx_rates.refresh_loop())
+    asyncio.create_task(percolator.reload_loop())
+    # 팔로워인 동안 다른 리더가 수집한 내용을 반영하도록 리더가 될 때 메모리 인덱스를 다시 불러옴
+    leader_election.add_promote_hook(seen_set.warm)
+    leader_election.add_promote_hook(dedup_index.load)
+    leader_election.add_promote_hook(percolator.load)
+    # 크롤러 스케줄러, 파티션 관리, seen-set 스냅샷, 웹훅 전송은 리더로 선출된 프로세스 하나에서만 실행
+    leader_election.add_task("scheduler", lambda: CrawlerScheduler().start())
+    leader_election.add_task("partition_maintenance", partition_manager.maintenance_loop)
+    leader_election.add_task("seen_set_snapshot", seen_set.snapshot_loop)
+    leader_election.add_task("webhooks", webhook_dispatcher.run)
+    await leader_election.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await leader_election.stop()
+    await ingest_buffer.stop()
+    await change_feed.stop()
+    seen_set.snapshot()
+    await dispose_engines()
@@ -1,28 +1,123 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, JSON
+from sqlalchemy import (
+    BigInteger, Column, Computed, Integer, String, DateTime, Text, Float, Boolean, JSON, Index, LargeBinary, Sequence,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.sql import func
 from ..db.database import Base
+from ..db.schema import SEARCH_VECTOR_SQL
+
+# 프로젝트가 추가/변경될 때마다 새로 받는 번호. 모든 프로세스가 공유하므로 스트림 이벤트 id로 사용
+EVENT_SEQ = Sequence("project_event_seq", metadata=Base.metadata)
 
 class Project(Base):
     __tablename__ = "projects"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # 파티션 테이블의 기본 키에는 파티션 키(posted_date)가 포함되어야 함
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text)
     budget_min = Column(Float, nullable=True)
     budget_max = Column(Float, nullable=True)
     currency = Column(String(10))
+    budget_min_usd = Column(Float, nullable=True)  # 수집 시점 환율로 환산한 값
+    budget_max_usd = Column(Float, nullable=True)
+    budget_hourly_usd = Column(Float, nullable=True)  # 시급 환산 (시급/월급 프로젝트만)
     platform = Column(String(50), nullable=False)  # wishket, freemoa 등
-    original_url = Column(String(500), unique=True, nullable=False)
+    original_url = Column(String(500), nullable=False)  # (original_url, posted_date) 유니크
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    posted_date = Column(DateTime)
+    posted_date = Column(DateTime, primary_key=True, nullable=False)  # 월 단위 range 파티션 키
     deadline = Column(DateTime, nullable=True)
-    skills = Column(JSON)
+    skills = Column(ARRAY(Text))  # 정규화된 스킬 이름 (skills 테이블의 name)
     url = Column(String(500))
     status = Column(String(50))
     work_type = Column(String(50))
     payment_type = Column(String(50))
-    project_metadata = Column(JSON, nullable=True)
+    project_metadata = Column(JSONB, nullable=True)
+    # project_metadata에서 승격한 컬럼 (수집 시 채움, services.metadata_fields)
+    applicants = Column(Integer, nullable=True)
+    view_count = Column(Integer, nullable=True)
+    experience_level = Column(String(50), nullable=True)
+    client_rating = Column(Float, nullable=True)
+    is_private = Column(Boolean, nullable=True)
+    term = Column(String(100), nullable=True)
+    location = Column(String(200), nullable=True)
+    content_hash = Column(String(64))  # 정규화된 내용의 sha256 (변경 감지용)
+    minhash = Column(LargeBinary)  # 제목+설명 MinHash 서명 (유사 중복 탐지용)
+    cluster_id = Column(Integer, index=True)  # 유사 중복 묶음의 대표(최초 수집) 프로젝트 id
+    event_seq = Column(BigInteger, server_default=EVENT_SEQ.next_value(), index=True)  # 마지막 추가/변경 시점의 이벤트 번호
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True))  # 전문 검색용 (DB에서 자동 갱신)
+
+    # 목록 API의 keyset 페이지네이션 (posted_date, id) 및 필터 조합용 인덱스
+    __table_args__ = (
+        # 파티션 테이블의 유니크 인덱스는 파티션 키를 포함해야 하므로 upsert 충돌 대상은 (original_url, posted_date)
+        Index("ux_projects_original_url_posted_date", "original_url", "posted_date", unique=True),
+        Index("ix_projects_original_url", "original_url"),
+        Index("ix_projects_posted_date_id", "posted_date", "id"),
+        Index("ix_projects_platform_posted_date_id", "platform", "posted_date", "id"),
+        Index("ix_projects_status_posted_date_id", "status", "posted_date", "id"),
+        Index("ix_projects_work_type_posted_date_id", "work_type", "posted_date", "id"),
+        Index("ix_projects_currency_budget_max", "currency", "budget_max"),
+        Index("ix_projects_budget_min_usd", "budget_min_usd"),
+        Index("ix_projects_budget_max_usd", "budget_max_usd"),
+        Index("ix_projects_budget_hourly_usd", "budget_hourly_usd"),
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_projects_skills", "skills", postgresql_using="gin"),
+        Index(
+            "ix_projects_project_metadata", "project_metadata",
+            postgresql_using="gin", postgresql_ops={"project_metadata": "jsonb_path_ops"},
+        ),
+        # 승격 컬럼 정렬(keyset)/범위 필터용
+        Index("ix_projects_applicants_id", "applicants", "id"),
+        Index("ix_projects_view_count_id", "view_count", "id"),
+        Index("ix_projects_client_rating_id", "client_rating", "id"),
+        Index("ix_projects_experience_level", "experience_level"),
+        Index("ix_projects_location", "location"),
+        {"postgresql_partition_by": "RANGE (posted_date)"},
+    )
+
+    def __repr__(self):
+        return f"<Project {self.title}>"
+
+class ProjectUrl(Base):
+    """original_url별 확정 게시일
+
+    projects는 (original_url, posted_date)로만 유니크하므로, 파티션되지 않은 이 테이블이
+    URL 유일성을 보장하고 재수집/동시 수집 시 같은 파티션 행을 찾을 게시일을 정한다.
+    """
+    __tablename__ = "project_urls"
+
+    original_url = Column(String(500), primary_key=True)
+    posted_date = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<ProjectUrl {self.original_url}>"
+
+class DataVersion(Base):
+    """플랫폼별 데이터 버전 (ETag/Last-Modified 계산용, services.data_version)
+
+    쓰기 트랜잭션이 project_event_seq에서 받은 번호로 갱신하므로 모든 워커가 같은 값을 본다.
+    platform이 '*'인 행은 전체 버전.
+    """
+    __tablename__ = "data_versions"
+
+    platform = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False)
+    modified_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<DataVersion {self.platform} {self.version}>"
+
+class ProjectChange(Base):
+    __tablename__ = "project_changes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, nullable=False, index=True)
+    platform = Column(String(50), nullable=False)
+    changed_fields = Column(JSON, nullable=False)  # 변경된 컬럼 이름 목록
+    previous_hash = Column(String(64))
+    content_hash = Column(String(64), nullable=False)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     def __repr__(self):
-        return f"<Project {self.title}>"
\ No newline at end of file
+        return f"<ProjectChange {self.project_id} {self.changed_fields}>"
\ No newline at end of file
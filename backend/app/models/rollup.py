@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import ARRAY
+from ..db.database import Base
+
+class ProjectRollup(Base):
+    """시간(posted_date 기준) x 플랫폼 x work_type x 스킬별 게시 건수와 예산 스케치"""
+
+    __tablename__ = "project_rollups"
+    __table_args__ = (Index("ix_project_rollups_skill_bucket", "skill", "bucket"),)
+
+    bucket = Column(DateTime, primary_key=True)  # 시간 단위로 자른 posted_date
+    platform = Column(String(50), primary_key=True)
+    work_type = Column(String(50), primary_key=True)
+    skill = Column(String(100), primary_key=True)  # canonical 스킬, ''이면 전체 프로젝트
+    count = Column(Integer, nullable=False, default=0)
+    budget_sketch = Column(ARRAY(Integer), nullable=False)  # 고정가 예산(USD) 로그 버킷별 건수
+    hourly_sketch = Column(ARRAY(Integer), nullable=False)  # 시급(USD) 로그 버킷별 건수
+
+    def __repr__(self):
+        return f"<ProjectRollup {self.bucket} {self.platform} {self.work_type} {self.skill!r}>"
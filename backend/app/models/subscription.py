@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import func
+from ..db.database import Base
+
+class Subscription(Base):
+    __tablename__ = "subscriptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(200), nullable=False)
+    skills = Column(ARRAY(String(100)), nullable=False, default=list)  # 모두 포함해야 함 (canonical)
+    platforms = Column(ARRAY(String(50)), nullable=False, default=list)  # 비어 있으면 전체
+    work_types = Column(ARRAY(String(50)), nullable=False, default=list)
+    payment_types = Column(ARRAY(String(50)), nullable=False, default=list)
+    min_budget_usd = Column(Float, nullable=True)  # budget_max_usd 기준
+    min_hourly_usd = Column(Float, nullable=True)  # budget_hourly_usd 기준
+    active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Subscription {self.name}>"
+
+class Notification(Base):
+    __tablename__ = "notifications"
+    __table_args__ = (UniqueConstraint("subscription_id", "project_id"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    subscription_id = Column(Integer, nullable=False, index=True)
+    project_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Notification {self.subscription_id} -> {self.project_id}>"
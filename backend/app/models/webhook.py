@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, JSON, Index
+from sqlalchemy.sql import func
+from ..db.database import Base
+
+class WebhookEndpoint(Base):
+    __tablename__ = "webhook_endpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String(500), nullable=False)
+    secret = Column(String(128), nullable=False)  # HMAC 서명 키
+    subscription_id = Column(Integer, nullable=True, index=True)  # 없으면 모든 신규 프로젝트
+    active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<WebhookEndpoint {self.url}>"
+
+class WebhookDelivery(Base):
+    """전송 대기열 (outbox). 프로젝트 저장과 같은 트랜잭션에서 기록된다"""
+    __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        Index("ix_webhook_deliveries_due", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    endpoint_id = Column(Integer, nullable=False, index=True)
+    project_id = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")  # pending, delivered, dead
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    delivered_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<WebhookDelivery {self.endpoint_id} -> {self.project_id} ({self.status})>"
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
@@ -36,6 +36,27 @@ class ProjectCreate(ProjectBase):
 
 class Project(ProjectBase):
     id: int
+    public_id: Optional[str] = None  # /api/{public_id} 조회용 불투명 id
+    cluster_id: Optional[int] = None  # 유사 중복 묶음의 대표 프로젝트 id
+    budget_min_usd: Optional[float] = None
+    budget_max_usd: Optional[float] = None
+    budget_hourly_usd: Optional[float] = None
+    # metadata에서 승격한 필드
+    applicants: Optional[int] = None
+    view_count: Optional[int] = None
+    experience_level: Optional[str] = None
+    client_rating: Optional[float] = None
+    is_private: Optional[bool] = None
+    term: Optional[str] = None
+    location: Optional[str] = None
+    # ORM 객체에서는 project_metadata 컬럼에서 읽음 (Base.metadata와 충돌 방지)
+    metadata: Optional[Dict[str, Any]] = Field(
+        None, validation_alias=AliasChoices("project_metadata", "metadata")
+    )
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class ProjectPage(BaseModel):
+    items: List[Project]
+    next_cursor: Optional[str] = None  # 마지막 페이지이면 None 
\ No newline at end of file
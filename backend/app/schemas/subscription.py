@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List
+from .project import WorkType, PaymentType
+
+class SubscriptionBase(BaseModel):
+    name: str
+    skills: List[str] = []  # 모두 포함
+    platforms: List[str] = []  # 하나라도 일치 (비어 있으면 전체)
+    work_types: List[WorkType] = []
+    payment_types: List[PaymentType] = []
+    min_budget_usd: Optional[float] = None
+    min_hourly_usd: Optional[float] = None
+
+class SubscriptionCreate(SubscriptionBase):
+    pass
+
+class Subscription(SubscriptionBase):
+    id: int
+    active: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+class WebhookBase(BaseModel):
+    url: str
+    subscription_id: Optional[int] = None  # 없으면 모든 신규 프로젝트
+
+class WebhookCreate(WebhookBase):
+    secret: Optional[str] = None  # 없으면 생성
+
+class Webhook(WebhookBase):
+    id: int
+    active: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class WebhookCreated(Webhook):
+    secret: str
@@ -0,0 +1,157 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from sqlalchemy import select
+from ..config import settings
+from ..db.database import read_session
+from ..models.project import Project as ProjectModel
+from .project_writer import UpsertResult
+
+# 푸시 이벤트에 포함하는 컬럼
+EVENT_FIELDS = [
+    "id", "platform", "title", "description", "budget_min", "budget_max", "currency",
+    "budget_min_usd", "budget_max_usd", "budget_hourly_usd", "posted_date", "deadline",
+    "skills", "url", "original_url", "status", "work_type", "payment_type", "cluster_id",
+]
+
+@dataclass
+class Event:
+    id: int  # projects.event_seq (모든 프로세스에서 같은 값)
+    type: str  # created / updated
+    platform: str
+    skills: Set[str]
+    data: Dict[str, Any]
+
+class Subscriber:
+    """클라이언트 하나의 이벤트 버퍼. 가득 차면 허브가 연결을 끊는다"""
+
+    def __init__(self, platforms: Optional[Set[str]], skills: Optional[Set[str]], buffer_size: int):
+        self.platforms = platforms
+        self.skills = skills
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.dropped = False
+
+    def matches(self, event: Event) -> bool:
+        if self.platforms and event.platform not in self.platforms:
+            return False
+        if self.skills and not self.skills & event.skills:
+            return False
+        return True
+
+    async def get(self) -> Optional[Event]:
+        """다음 이벤트. 느린 소비자로 끊기면 None"""
+        return await self.queue.get()
+
+class BroadcastHub:
+    """수집 경로에서 받은 신규/변경 프로젝트를 SSE/WebSocket 구독자에게 전달
+
+    이벤트 id는 DB 시퀀스(projects.event_seq)에서 오므로 어느 워커에 다시 연결해도 같은 id로 이어받는다.
+    최근 이벤트는 history_size개 보관하고, Last-Event-ID가 보관 중인 이벤트보다 오래되었으면
+    그 사이의 행을 DB에서 읽는다. 중간에 다시 변경된 행은 최신 상태로 한 번만 전달된다.
+    """
+
+    def __init__(self, history_size: int, buffer_size: int):
+        self.buffer_size = buffer_size
+        self.history: deque = deque(maxlen=history_size)
+        self.subscribers: Set[Subscriber] = set()
+        self.last_event_id = 0
+        self.dropped_count = 0
+
+    async def subscribe(
+        self,
+        platforms: Optional[Iterable[str]] = None,
+        skills: Optional[Iterable[str]] = None,
+        last_event_id: Optional[int] = None,
+    ) -> Subscriber:
+        platforms = set(platforms) if platforms else None
+        backlog: List[Event] = []
+        truncated = False
+        if last_event_id is not None:
+            oldest = self.history[0].id if self.history else None
+            if oldest is None or oldest > last_event_id:
+                backlog, truncated = await self._load_since(last_event_id, oldest, platforms)
+
+        # DB에서 읽은 이벤트는 버퍼와 별도로 모두 담을 수 있도록 큐를 늘림
+        subscriber = Subscriber(platforms, set(skills) if skills else None, self.buffer_size + len(backlog))
+        resumed = last_event_id
+        for event in backlog:
+            if subscriber.matches(event):
+                subscriber.queue.put_nowait(event)
+            resumed = event.id
+        if truncated:
+            # 남은 이벤트가 더 있으면 여기까지 보낸 뒤 연결을 끊어 클라이언트가 마지막 id로 다시 이어받게 함
+            subscriber.queue.put_nowait(None)
+            return subscriber
+        if resumed is not None:
+            for event in self.history:
+                if event.id > resumed and subscriber.matches(event):
+                    if not self._offer(subscriber, event):
+                        return subscriber
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    async def _load_since(
+        self, last_event_id: int, before: Optional[int], platforms: Optional[Set[str]],
+    ) -> Tuple[List[Event], bool]:
+        """last_event_id 이후, before(보관 중인 가장 오래된 이벤트) 이전에 추가/변경된 행"""
+        limit = self.history.maxlen
+        columns = [getattr(ProjectModel, name) for name in EVENT_FIELDS]
+        stmt = select(*columns, ProjectModel.event_seq, ProjectModel.updated_at).where(ProjectModel.event_seq > last_event_id)
+        if before is not None:
+            stmt = stmt.where(ProjectModel.event_seq < before)
+        if platforms:
+            stmt = stmt.where(ProjectModel.platform.in_(platforms))
+        async with read_session() as session:
+            rows = (await session.execute(stmt.order_by(ProjectModel.event_seq).limit(limit))).all()
+        events = [self._event("created" if row.updated_at is None else "updated", row._mapping) for row in rows]
+        return events, len(rows) == limit
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    def _offer(self, subscriber: Subscriber, event: Event) -> bool:
+        try:
+            subscriber.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            # 느린 소비자: 버퍼를 비우고 종료 신호를 넣어 연결을 끊게 함
+            subscriber.dropped = True
+            self.subscribers.discard(subscriber)
+            self.dropped_count += 1
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            subscriber.queue.put_nowait(None)
+            return False
+
+    @staticmethod
+    def _event(event_type: str, row: Mapping[str, Any]) -> Event:
+        return Event(
+            id=row["event_seq"],
+            type=event_type,
+            platform=row["platform"],
+            skills=set(row.get("skills") or []),
+            data={name: row.get(name) for name in EVENT_FIELDS},
+        )
+
+    def publish(self, event_type: str, row: Dict[str, Any]):
+        event = self._event(event_type, row)
+        self.last_event_id = max(self.last_event_id, event.id)
+        self.history.append(event)
+        for subscriber in list(self.subscribers):
+            if subscriber.matches(event):
+                self._offer(subscriber, event)
+
+    async def on_ingested(self, result: UpsertResult):
+        """ingest 리스너: 새로 추가되거나 내용이 바뀐 프로젝트를 발행"""
+        for row in sorted(result.rows, key=lambda row: row["event_seq"]):
+            self.publish("created" if row["is_new"] else "updated", row)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self.subscribers),
+            "last_event_id": self.last_event_id,
+            "dropped_subscribers": self.dropped_count,
+        }
+
+broadcast_hub = BroadcastHub(history_size=settings.STREAM_HISTORY_SIZE, buffer_size=settings.STREAM_CLIENT_BUFFER)
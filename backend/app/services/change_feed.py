@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import socket
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import engine
+
+INGEST_CHANNEL = "project_ingest"
+SUBSCRIPTION_CHANNEL = "subscription_changes"
+CRAWL_CHANNEL = "crawl_requests"
+DATA_CHANNEL = "data_changes"  # 수집 외 경로(보존 작업 등)로 바뀐 플랫폼
+
+# NOTIFY payload 상한(8000 bytes) 안에 들어가도록 한 알림에 담는 id 수
+MAX_IDS_PER_NOTIFY = 500
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+ReconnectHook = Callable[[], None]
+
+class ChangeFeed:
+    """Postgres LISTEN/NOTIFY로 프로세스 사이에 이벤트 전달
+
+    수집은 리더 프로세스에서만 일어나므로 다른 프로세스는 알림으로 데이터 버전, 통계 캐시,
+    스트림 구독자를 갱신한다. 알림은 호출자의 트랜잭션 안에서 보내므로 커밋된 경우에만 전달되고,
+    자기 프로세스가 보낸 알림은 origin으로 걸러 무시한다.
+    """
+
+    def __init__(self, ping_interval: float):
+        self.ping_interval = ping_interval
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+        self._reconnect_hooks: List[ReconnectHook] = []
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+        self.connected = False
+        self.received = 0
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def subscribe(self, channel: str, handler: Handler):
+        """다른 프로세스가 channel로 보낸 알림을 받을 콜백 등록 (start 전에 호출)"""
+        self._handlers[channel].append(handler)
+
+    def add_reconnect_hook(self, hook: ReconnectHook):
+        """연결이 끊긴 동안 놓친 알림이 있을 수 있으므로 다시 연결되면 호출할 콜백 (캐시 무효화 등)"""
+        self._reconnect_hooks.append(hook)
+
+    async def publish(self, session: Union[AsyncSession, AsyncConnection], channel: str, payload: Dict[str, Any]):
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": channel, "payload": json.dumps(dict(payload, origin=self.origin))},
+        )
+
+    async def publish_ingest(self, session: AsyncSession, rows: List[Dict[str, Any]]):
+        """수집 트랜잭션에서 기록된 행 id를 알림"""
+        new = [row["id"] for row in rows if row["is_new"]]
+        updated = [row["id"] for row in rows if not row["is_new"]]
+        for start in range(0, max(len(new), len(updated)), MAX_IDS_PER_NOTIFY):
+            await self.publish(session, INGEST_CHANNEL, {
+                "new": new[start:start + MAX_IDS_PER_NOTIFY],
+                "updated": updated[start:start + MAX_IDS_PER_NOTIFY],
+            })
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        for task in [self._task, *self._pending]:
+            if task:
+                task.cancel()
+        await asyncio.gather(*[task for task in [self._task, *self._pending] if task], return_exceptions=True)
+        self._task = None
+
+    async def _run(self):
+        first = True
+        while True:
+            conn: Optional[AsyncConnection] = None
+            try:
+                conn = await engine.connect()
+                await conn.execution_options(isolation_level="AUTOCOMMIT")
+                raw = (await conn.get_raw_connection()).driver_connection
+                for channel in self._handlers:
+                    await raw.add_listener(channel, self._dispatch)
+                self.connected = True
+                self.logger.info(f"Listening on {', '.join(self._handlers)}")
+                if not first:
+                    for hook in self._reconnect_hooks:
+                        hook()
+                first = False
+                while True:
+                    # 연결이 끊긴 것을 알아차리기 위한 주기적 확인
+                    await asyncio.sleep(self.ping_interval)
+                    await conn.execute(text("SELECT 1"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Change feed connection lost: {str(e)}")
+            finally:
+                self.connected = False
+                if conn is not None:
+                    # 리스너가 등록된 연결은 풀에 돌려주지 않고 닫음
+                    await conn.invalidate()
+            await asyncio.sleep(self.ping_interval)
+
+    def _dispatch(self, connection, pid: int, channel: str, payload: str):
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            self.logger.error(f"Invalid payload on {channel}: {payload[:200]}")
+            return
+        if data.get("origin") == self.origin:
+            return
+        self.received += 1
+        for handler in self._handlers[channel]:
+            task = asyncio.create_task(self._call(channel, handler, data))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _call(self, channel: str, handler: Handler, data: Dict[str, Any]):
+        try:
+            await handler(data)
+        except Exception as e:
+            self.logger.error(f"Handler {handler.__name__} for {channel} failed: {str(e)}")
+
+    def stats(self) -> dict:
+        return {
+            "origin": self.origin,
+            "connected": self.connected,
+            "channels": list(self._handlers),
+            "received": self.received,
+        }
+
+change_feed = ChangeFeed(ping_interval=settings.CHANGE_FEED_PING_INTERVAL)
@@ -1,61 +1,54 @@
 import asyncio
+from collections import defaultdict
 from typing import List
-from ..crawlers.upwork import UpworkCrawler
-from ..crawlers.wishket import WishketCrawler
-from ..crawlers.guru import GuruCrawler
-from ..crawlers.freelancer import FreelancerCrawler
-from ..crawlers.freemoa import FreemoaCrawler
-from ..db.database import async_session
-from ..models.project import Project as ProjectModel
+from ..crawlers.registry import crawl_interval, create_crawler, enabled_platforms
+from ..services.ingest_buffer import ingest_buffer
+from ..services.leader import leader_election
 from ..schemas.project import ProjectCreate
-from ..config import settings
 
 class CrawlerScheduler:
     def __init__(self):
-        self.upwork = UpworkCrawler()
-        self.other_crawlers = [
-            WishketCrawler(),
-            GuruCrawler(),
-            FreelancerCrawler(),
-            FreemoaCrawler()
-        ]
-        
+        # 같은 주기의 크롤러끼리 한 루프에서 차례로 실행 (upwork는 자체 주기)
+        self.groups = defaultdict(list)
+        for platform in enabled_platforms():
+            self.groups[crawl_interval(platform)].append(create_crawler(platform))
+
     async def start(self):
-        await asyncio.gather(
-            self.upwork_loop(),
-            self.other_crawlers_loop()
-        )
-    
-    async def upwork_loop(self):
-        while True:
-            try:
-                projects = await self.upwork.crawl()
-                await save_projects(projects)
-            except Exception as e:
-                print(f"Error in Upwork crawler: {e}")
-            await asyncio.sleep(settings.UPWORK_CRAWL_INTERVAL)
-    
-    async def other_crawlers_loop(self):
+        await asyncio.gather(*(
+            self.crawl_loop(crawlers, interval) for interval, crawlers in self.groups.items()
+        ))
+
+    async def crawl_loop(self, crawlers, interval: int):
         while True:
-            for crawler in self.other_crawlers:
+            for crawler in crawlers:
                 try:
                     projects = await crawler.crawl()
                     await save_projects(projects)
                 except Exception as e:
                     print(f"Error in {crawler.__class__.__name__}: {e}")
-            await asyncio.sleep(settings.OTHER_CRAWL_INTERVAL)
+            await asyncio.sleep(interval)
+
+# 활성화된 크롤러를 한 번씩 실행 (/api/crawl)
+async def crawl_once() -> int:
+    queued = 0
+    for platform in enabled_platforms():
+        try:
+            projects = await create_crawler(platform).crawl()
+        except Exception as e:
+            print(f"Error crawling {platform}: {str(e)}")
+            continue
+
+        # 저장(중복 확인 포함)은 write-behind 버퍼가 배치 upsert로 처리
+        await save_projects(projects)
+        queued += len(projects)
+    return queued
+
+async def on_crawl_request(payload: dict):
+    """다른 프로세스에 들어온 /api/crawl 요청 (change feed 핸들러, 리더만 실행)"""
+    if leader_election.is_leader:
+        queued = await crawl_once()
+        print(f"Crawled {queued} projects on request")
 
-# save_projects 함수를 직접 구현
+# 저장은 write-behind 버퍼가 배치로 처리
 async def save_projects(projects: List[ProjectCreate]):
-    async with async_session() as session:
-        for project in projects:
-            try:
-                project_id = str(project.project_metadata.get("project_id", ""))
-                if not project_id:
-                    continue
-                db_project = ProjectModel(**project.dict())
-                session.add(db_project)
-            except Exception as e:
-                print(f"Error saving project: {e}")
-                continue
-        await session.commit() 
\ No newline at end of file
+    await ingest_buffer.enqueue(projects)
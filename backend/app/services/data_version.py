@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.sql import func
+from ..core.logging import setup_logger
+from ..db.database import async_session
+from ..models.project import EVENT_SEQ, DataVersion
+from .project_writer import UpsertResult
+
+ALL_PLATFORMS = "*"  # 전체 버전을 담는 행
+
+# 아직 기록된 적 없는 플랫폼의 Last-Modified
+_NEVER = datetime.fromtimestamp(0, timezone.utc)
+
+async def record_versions(session: Union[AsyncSession, AsyncConnection], platforms: Iterable[str]):
+    """바뀐 플랫폼과 전체 버전을 새 시퀀스 번호로 교체 (호출자의 트랜잭션 안에서 실행)
+
+    값은 매번 새로 받은 번호이므로 트랜잭션 커밋 순서가 뒤바뀌어도 이전에 발급한 버전과 겹치지 않는다.
+    """
+    platforms = set(platforms)
+    if not platforms:
+        return
+    # 행 잠금 순서를 고정해 동시에 쓰는 트랜잭션끼리 교착되지 않도록 정렬
+    keys = sorted(platforms | {ALL_PLATFORMS})
+    stmt = insert(DataVersion).values([{"platform": key, "version": EVENT_SEQ.next_value()} for key in keys])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DataVersion.platform],
+        set_={"version": stmt.excluded.version, "modified_at": func.now()},
+    )
+    await session.execute(stmt)
+
+class DataVersions:
+    """플랫폼별 데이터 버전 (data_versions 테이블의 사본)
+
+    쓰기 트랜잭션이 record_versions로 테이블을 갱신하고, 각 프로세스는 수집/변경 알림을 받을 때마다
+    이 작은 테이블을 다시 읽는다. 모든 워커가 같은 DB 상태에서 값을 만들므로 어느 워커가 응답해도
+    ETag / Last-Modified가 같고, 읽기 API는 이 값으로 DB 조회 없이 304를 응답한다.
+    """
+
+    def __init__(self):
+        self._versions: Dict[str, Tuple[int, datetime]] = {}
+        self._lock = asyncio.Lock()
+        self._pending = False
+        self._tasks: Set[asyncio.Task] = set()
+        self.refreshes = 0
+        self.logger = setup_logger(self.__class__.__name__)
+
+    async def refresh(self):
+        """테이블을 다시 읽음. 읽는 중에 들어온 요청은 한 번 더 읽는 것으로 합침"""
+        self._pending = True
+        async with self._lock:
+            if not self._pending:
+                return
+            self._pending = False
+            async with async_session() as session:
+                result = await session.execute(select(DataVersion.platform, DataVersion.version, DataVersion.modified_at))
+                self._versions = {
+                    platform: (version, modified_at.replace(microsecond=0))
+                    for platform, version, modified_at in result
+                }
+            self.refreshes += 1
+
+    def schedule_refresh(self):
+        """change feed 재연결 훅: 연결이 끊긴 동안 놓친 변경을 반영하도록 다시 읽음"""
+        task = asyncio.get_running_loop().create_task(self._refresh_logged())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh_logged(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            self.logger.error(f"Failed to refresh data versions: {str(e)}")
+
+    async def on_ingested(self, result: UpsertResult):
+        """ingest 리스너 (이 프로세스 또는 다른 프로세스의 수집): 커밋된 버전을 다시 읽음"""
+        if result.rows:
+            await self.refresh()
+
+    async def on_remote_change(self, payload: dict):
+        """change feed 핸들러: 수집 외 경로(보존 작업 등)로 바뀐 버전을 다시 읽음"""
+        await self.refresh()
+
+    def version(self, platform: Optional[str] = None) -> str:
+        version, _ = self._versions.get(platform or ALL_PLATFORMS, (0, _NEVER))
+        return str(version)
+
+    def last_modified(self, platform: Optional[str] = None) -> datetime:
+        _, modified = self._versions.get(platform or ALL_PLATFORMS, (0, _NEVER))
+        return modified
+
+    def stats(self) -> dict:
+        return {platform: version for platform, (version, _) in self._versions.items()}
+
+data_versions = DataVersions()
@@ -0,0 +1,174 @@
+import hashlib
+import re
+import time
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import async_session
+from ..models.project import Project as ProjectModel
+
+NUM_BINS = 64  # 서명 길이 (32비트 값 64개 = 256 bytes)
+BANDS = 16
+ROWS_PER_BAND = NUM_BINS // BANDS
+_EMPTY = 0xFFFFFFFF
+_NON_WORD = re.compile(r"[^\w]+")
+
+def _normalize(text: str) -> str:
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+def minhash_signature(title: str, description: str, shingle_size: int = 5) -> Optional[bytes]:
+    """제목+설명의 문자 n-gram MinHash 서명 (one-permutation hashing)
+
+    shingle마다 해시를 한 번만 계산해 상위 비트로 bin을 고르고 bin별 최솟값을 남긴다.
+    한/영 혼용 텍스트에서도 동작하도록 단어가 아닌 문자 단위 shingle을 사용한다.
+    """
+    text = _normalize(f"{title or ''} {description or ''}")
+    if len(text) < shingle_size:
+        return None
+    bins = [_EMPTY] * NUM_BINS
+    for shingle in {text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1)}:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+        index, value = value % NUM_BINS, value >> 32
+        if value < bins[index]:
+            bins[index] = value
+    # 비어 있는 bin은 다음 bin 값으로 채움 (densification)
+    for index in range(NUM_BINS):
+        if bins[index] == _EMPTY:
+            for offset in range(1, NUM_BINS):
+                candidate = bins[(index + offset) % NUM_BINS]
+                if candidate != _EMPTY:
+                    bins[index] = candidate
+                    break
+    return array("I", bins).tobytes()
+
+def similarity(a: bytes, b: bytes) -> float:
+    """두 서명으로 추정한 Jaccard 유사도"""
+    left, right = array("I", a), array("I", b)
+    return sum(x == y for x, y in zip(left, right)) / NUM_BINS
+
+class DedupIndex:
+    """MinHash 서명의 LSH 인덱스 (최근 DEDUP_WINDOW_DAYS 이내 프로젝트)
+
+    서명을 BANDS개 구간으로 나눠 구간 값이 같은 프로젝트만 후보로 비교하므로
+    조회 비용이 전체 이력 크기와 무관하다. 유사한 프로젝트는 먼저 수집된 프로젝트의
+    cluster_id를 공유한다.
+    """
+
+    def __init__(self, threshold: float, window_days: int):
+        self.threshold = threshold
+        self.window = timedelta(days=window_days)
+        self.signatures: Dict[int, bytes] = {}
+        self.clusters: Dict[int, int] = {}
+        self.posted: Dict[int, datetime] = {}
+        self.buckets: Dict[bytes, Set[int]] = {}
+        self._last_evicted = time.monotonic()
+        self.logger = setup_logger(self.__class__.__name__)
+
+    @staticmethod
+    def _band_keys(signature: bytes):
+        width = ROWS_PER_BAND * 4
+        for band in range(BANDS):
+            yield bytes([band]) + signature[band * width:(band + 1) * width]
+
+    def add(self, project_id: int, signature: bytes, cluster_id: int, posted_date: datetime):
+        if project_id in self.signatures:
+            self.remove(project_id)
+        self.signatures[project_id] = signature
+        self.clusters[project_id] = cluster_id
+        self.posted[project_id] = posted_date
+        for key in self._band_keys(signature):
+            self.buckets.setdefault(key, set()).add(project_id)
+
+    def remove(self, project_id: int):
+        signature = self.signatures.pop(project_id, None)
+        self.clusters.pop(project_id, None)
+        self.posted.pop(project_id, None)
+        if signature is None:
+            return
+        for key in self._band_keys(signature):
+            bucket = self.buckets.get(key)
+            if bucket:
+                bucket.discard(project_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def find_cluster(self, signature: bytes, exclude: Optional[int] = None) -> Optional[int]:
+        """임계값 이상으로 가장 유사한 후보의 cluster_id"""
+        candidates: Set[int] = set()
+        for key in self._band_keys(signature):
+            candidates |= self.buckets.get(key, set())
+        candidates.discard(exclude)
+
+        best, best_score = None, self.threshold
+        for candidate in candidates:
+            score = similarity(signature, self.signatures[candidate])
+            if score >= best_score:
+                best, best_score = candidate, score
+        return self.clusters[best] if best is not None else None
+
+    def evict(self):
+        cutoff = datetime.now() - self.window
+        for project_id in [pid for pid, posted in self.posted.items() if posted < cutoff]:
+            self.remove(project_id)
+        self._last_evicted = time.monotonic()
+
+    async def load(self):
+        """최근 기간의 서명을 DB에서 읽어 인덱스 재구성"""
+        stmt = select(ProjectModel.id, ProjectModel.minhash, ProjectModel.cluster_id, ProjectModel.posted_date).where(
+            ProjectModel.posted_date >= datetime.now() - self.window,
+            ProjectModel.minhash.isnot(None),
+        )
+        async with async_session() as session:
+            result = await session.stream(stmt.execution_options(yield_per=10000))
+            async for project_id, signature, cluster_id, posted_date in result:
+                self.add(project_id, signature, cluster_id or project_id, posted_date)
+        self.logger.info(f"Dedup index loaded: {self.stats()}")
+
+    async def assign_clusters(self, session: AsyncSession, rows: Iterable[Dict[str, Any]]):
+        """새로 저장된 행에 cluster_id를 지정하고 인덱스에 반영 (호출자의 트랜잭션 안에서 실행)"""
+        if time.monotonic() - self._last_evicted > 3600:
+            self.evict()
+
+        updates = []
+        for row in rows:
+            project_id, signature = row["id"], row.get("minhash")
+            if not row["is_new"]:
+                # 갱신된 행은 기존 클러스터를 유지하고 서명만 교체
+                if signature and project_id in self.clusters:
+                    self.add(project_id, signature, self.clusters[project_id], row["posted_date"])
+                continue
+
+            cluster_id = project_id
+            if signature:
+                cluster_id = self.find_cluster(signature, exclude=project_id) or project_id
+                self.add(project_id, signature, cluster_id, row["posted_date"])
+            row["cluster_id"] = cluster_id
+            updates.append({"pk": project_id, "posted": row["posted_date"], "cluster_id": cluster_id})
+
+        if updates:
+            await session.execute(
+                update(ProjectModel)
+                # posted_date 조건으로 해당 파티션만 갱신
+                .where(ProjectModel.id == bindparam("pk"), ProjectModel.posted_date == bindparam("posted"))
+                .values(cluster_id=bindparam("cluster_id")),
+                updates,
+                execution_options={"synchronize_session": False},
+            )
+
+    def discard(self, project_ids: List[int]):
+        """커밋에 실패한 행을 인덱스에서 제거"""
+        for project_id in project_ids:
+            self.remove(project_id)
+
+    def stats(self) -> dict:
+        return {
+            "projects": len(self.signatures),
+            "buckets": len(self.buckets),
+            "clusters": len(set(self.clusters.values())),
+        }
+
+dedup_index = DedupIndex(threshold=settings.DEDUP_THRESHOLD, window_days=settings.DEDUP_WINDOW_DAYS)
@@ -0,0 +1,161 @@
+import csv
+import io
+import json
+import zlib
+from typing import Any, AsyncIterator, Dict, List
+from sqlalchemy import select
+from ..config import settings
+from ..db.database import read_session
+from ..models.project import Project as ProjectModel
+from .project_query import ProjectFilter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # parquet 내보내기는 pyarrow가 설치된 경우에만
+    pa = None
+    pq = None
+
+# 내보내는 컬럼 (검색/중복 탐지용 내부 컬럼 제외)
+EXPORT_COLUMNS = [
+    "id", "platform", "title", "description", "budget_min", "budget_max", "currency",
+    "budget_min_usd", "budget_max_usd", "budget_hourly_usd", "posted_date", "deadline",
+    "created_at", "updated_at", "skills", "url", "original_url", "status", "work_type",
+    "payment_type", "cluster_id", "project_metadata",
+]
+
+FORMATS = {
+    # format: (media type, 파일 확장자)
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+def export_statement(filters: ProjectFilter):
+    columns = [getattr(ProjectModel, name) for name in EXPORT_COLUMNS]
+    return filters.apply(select(*columns)).order_by(ProjectModel.posted_date.desc(), ProjectModel.id.desc())
+
+async def stream_rows(filters: ProjectFilter) -> AsyncIterator[List[Any]]:
+    """서버 측 커서로 EXPORT_CHUNK_SIZE 행씩 읽음 (ORM 객체를 만들지 않는 Core 행)"""
+    stmt = export_statement(filters).execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+    async with read_session() as session:
+        result = await session.stream(stmt)
+        async for chunk in result.partitions():
+            yield chunk
+
+def _to_dict(row) -> Dict[str, Any]:
+    return dict(zip(EXPORT_COLUMNS, row))
+
+async def _ndjson(filters: ProjectFilter) -> AsyncIterator[bytes]:
+    async for chunk in stream_rows(filters):
+        yield "".join(
+            json.dumps(_to_dict(row), default=str, ensure_ascii=False) + "\n" for row in chunk
+        ).encode()
+
+async def _csv(filters: ProjectFilter) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    skills_index = EXPORT_COLUMNS.index("skills")
+    metadata_index = EXPORT_COLUMNS.index("project_metadata")
+    async for chunk in stream_rows(filters):
+        for row in chunk:
+            values = list(row)
+            values[skills_index] = ";".join(values[skills_index] or [])
+            values[metadata_index] = json.dumps(values[metadata_index], ensure_ascii=False) if values[metadata_index] else ""
+            writer.writerow(values)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모아 두었다가 꺼내 가는 파일 객체"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+def parquet_schema():
+    return pa.schema([
+        ("id", pa.int64()),
+        ("platform", pa.string()),
+        ("title", pa.string()),
+        ("description", pa.string()),
+        ("budget_min", pa.float64()),
+        ("budget_max", pa.float64()),
+        ("currency", pa.string()),
+        ("budget_min_usd", pa.float64()),
+        ("budget_max_usd", pa.float64()),
+        ("budget_hourly_usd", pa.float64()),
+        ("posted_date", pa.timestamp("us")),
+        ("deadline", pa.timestamp("us")),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+        ("skills", pa.list_(pa.string())),
+        ("url", pa.string()),
+        ("original_url", pa.string()),
+        ("status", pa.string()),
+        ("work_type", pa.string()),
+        ("payment_type", pa.string()),
+        ("cluster_id", pa.int64()),
+        ("project_metadata", pa.string()),  # JSON 문자열
+    ])
+
+def to_arrow_table(chunk, schema):
+    """EXPORT_COLUMNS 순서의 행 묶음을 Arrow 테이블로 변환 (metadata는 JSON 문자열)"""
+    columns = [list(values) for values in zip(*chunk)]
+    metadata_index = EXPORT_COLUMNS.index("project_metadata")
+    columns[metadata_index] = [
+        json.dumps(value, ensure_ascii=False) if value is not None else None
+        for value in columns[metadata_index]
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+async def _parquet(filters: ProjectFilter) -> AsyncIterator[bytes]:
+    # parquet는 컬럼별로 자체 압축(zstd)하므로 gzip으로 다시 감싸지 않음
+    schema = parquet_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        async for chunk in stream_rows(filters):
+            # 청크마다 row group 하나
+            writer.write_table(to_arrow_table(chunk, schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip 헤더
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def export_projects(filters: ProjectFilter, format: str, compress: bool = True) -> AsyncIterator[bytes]:
+    """필터에 맞는 프로젝트를 format 형식의 바이트 청크로 내보냄 (메모리 사용량은 청크 크기에만 비례)"""
+    if format == "parquet":
+        if pa is None:
+            raise ValueError("Parquet export requires pyarrow")
+        return _parquet(filters)
+    chunks = _ndjson(filters) if format == "ndjson" else _csv(filters)
+    return _gzip(chunks) if compress else chunks
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import aiohttp
+from ..config import settings
+from ..core.logging import setup_logger
+
+# 오프라인 기본 환율 (1 USD 당 통화 단위). 캐시 파일도 없고 갱신도 실패했을 때 사용
+DEFAULT_RATES = {
+    "USD": 1.0,
+    "KRW": 1350.0,
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "JPY": 150.0,
+    "CAD": 1.36,
+    "AUD": 1.52,
+    "INR": 83.0,
+}
+
+HOURS_PER_MONTH = 160  # 월 단위 금액을 시급 환산할 때 기준 근무 시간
+
+class FxRates:
+    """로컬 캐시 파일을 쓰는 USD 기준 환율표
+
+    수집 경로에서는 메모리의 환율만 조회하고, 갱신은 별도 태스크가 주기적으로 한다.
+    """
+
+    def __init__(self, cache_path: str, url: str):
+        self.cache_path = cache_path
+        self.url = url
+        self.rates: Dict[str, float] = dict(DEFAULT_RATES)
+        self.updated_at: Optional[datetime] = None
+        self.logger = setup_logger(self.__class__.__name__)
+        self._load_cache()
+
+    def _load_cache(self):
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            self.rates.update({code: float(rate) for code, rate in cached["rates"].items() if rate})
+            self.updated_at = datetime.fromisoformat(cached["updated_at"])
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.error(f"Failed to load FX cache: {e}")
+
+    def to_usd(self, amount: Optional[float], currency: Optional[str]) -> Optional[float]:
+        if not amount or not currency:
+            return None
+        rate = self.rates.get(currency.upper())
+        if not rate:
+            return None
+        return round(amount / rate, 2)
+
+    async def refresh(self):
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
+            async with session.get(self.url) as response:
+                response.raise_for_status()
+                data = await response.json()
+        rates = {code: float(rate) for code, rate in data["rates"].items() if rate}
+        if "KRW" not in rates:
+            raise ValueError("FX response does not include KRW")
+        self.rates.update(rates)
+        self.updated_at = datetime.now(timezone.utc)
+
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"updated_at": self.updated_at.isoformat(), "rates": self.rates}, f)
+        os.replace(tmp_path, self.cache_path)
+        self.logger.info(f"FX rates refreshed: KRW={self.rates['KRW']}")
+
+    async def refresh_loop(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                # 실패하면 캐시/기본 환율을 계속 사용
+                self.logger.error(f"Failed to refresh FX rates: {e}")
+            await asyncio.sleep(settings.FX_REFRESH_INTERVAL)
+
+    def normalize_budget(self, row: Dict[str, Any]) -> Dict[str, Optional[float]]:
+        """USD 환산 예산과 시급 환산 금액 (고정 금액 프로젝트는 시급 환산 없음)"""
+        budget_min_usd = self.to_usd(row.get("budget_min"), row.get("currency"))
+        budget_max_usd = self.to_usd(row.get("budget_max"), row.get("currency"))
+        upper = budget_max_usd or budget_min_usd
+
+        budget_hourly_usd = None
+        if upper and row.get("payment_type") == "hourly":
+            budget_hourly_usd = upper
+        elif upper and row.get("payment_type") == "monthly":
+            budget_hourly_usd = round(upper / HOURS_PER_MONTH, 2)
+
+        return {
+            "budget_min_usd": budget_min_usd,
+            "budget_max_usd": budget_max_usd,
+            "budget_hourly_usd": budget_hourly_usd,
+        }
+
+fx_rates = FxRates(cache_path=settings.FX_CACHE_PATH, url=settings.FX_RATES_URL)
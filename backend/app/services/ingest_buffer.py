@@ -0,0 +1,272 @@
+import asyncio
+import glob
+import json
+import os
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import async_session
+from ..models.project import Project as ProjectModel
+from ..schemas.project import ProjectCreate
+from .project_writer import UpsertResult, upsert_projects
+from .broadcast import EVENT_FIELDS
+from .change_feed import change_feed
+from .data_version import record_versions
+from .dedup import dedup_index
+from .partitions import partition_manager
+from .percolator import percolator
+from .rollups import record_rollups
+from .seen_set import seen_set
+from .skills import register_skills
+from .webhooks import enqueue_deliveries
+
+Listener = Callable[[UpsertResult], Awaitable[None]]
+
+_STOP = object()
+
+# 재시도 후 스필하는 오류 (DB에 닿지 못한 경우). 그 외 오류는 같은 배치를 다시 써도 실패하므로 배치를 나눔
+CONNECTION_ERRORS = (OperationalError, InterfaceError, OSError, asyncio.TimeoutError)
+
+def is_connection_error(error: Exception) -> bool:
+    if isinstance(error, CONNECTION_ERRORS):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+class IngestBuffer:
+    """모든 크롤링 경로가 공유하는 write-behind 버퍼
+
+    단일 writer 태스크가 큐에서 프로젝트를 모아 행 수 또는 경과 시간 기준으로 flush 한다.
+    큐가 가득 차면 enqueue가 대기하여 DB 지연이 크롤러까지 전달되고 (backpressure),
+    재시도 후에도 DB에 쓸 수 없으면 로컬 파일로 내보낸 뒤 복구 시 다시 적재한다.
+    연결 문제가 아닌 오류(제약 조건 위반 등)는 배치를 반으로 나눠 다시 쓰고, 혼자서도 실패하는
+    행은 rejected-*.ndjson으로 격리한다 (다시 적재하지 않음).
+    """
+
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float, spill_dir: str):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_dir = spill_dir
+        self._listeners: List[Listener] = []
+        self._task: Optional[asyncio.Task] = None
+        self._has_spill = False
+
+        self.flush_count = 0
+        self.flushed_rows = 0
+        self.spilled_rows = 0
+        self.rejected_rows = 0
+        self.last_flush_latency: Optional[float] = None
+        self.total_flush_latency = 0.0
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def add_listener(self, listener: Listener):
+        """flush 결과를 받을 콜백 등록 (커밋 이후 호출)"""
+        self._listeners.append(listener)
+
+    async def enqueue(self, projects: List[ProjectCreate]):
+        for project in projects:
+            if project:
+                await self.queue.put(project)
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+        await self.replay_spill()
+
+    async def stop(self):
+        """남은 항목을 모두 flush 한 뒤 writer 태스크 종료"""
+        if self._task is None:
+            return
+        await self.queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self.queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: List[ProjectCreate]):
+        started = time.perf_counter()
+        for attempt in range(settings.INGEST_MAX_RETRIES):
+            try:
+                result = await self._write_isolating(batch)
+                break
+            except Exception as e:
+                # 연결 오류만 전달됨. upsert는 멱등이므로 앞서 기록된 절반이 있어도 배치 전체를 다시 씀
+                self.log_error(f"Flush of {len(batch)} projects failed (attempt {attempt + 1})", e)
+                await asyncio.sleep(min(2 ** attempt, 30))
+        else:
+            self._spill(batch)
+            return
+
+        latency = time.perf_counter() - started
+        self.flush_count += 1
+        self.flushed_rows += len(batch)
+        self.last_flush_latency = latency
+        self.total_flush_latency += latency
+        self.logger.info(
+            f"Flushed {len(batch)} projects in {latency * 1000:.0f}ms: inserted={result.inserted}, "
+            f"updated={result.updated}, unchanged={result.unchanged}, queue_depth={self.queue.qsize()}"
+        )
+
+        await self._notify(result)
+
+        if self._has_spill:
+            self._has_spill = False
+            asyncio.create_task(self.replay_spill())
+
+    async def _write_isolating(self, batch: List[ProjectCreate]) -> UpsertResult:
+        """연결 오류가 아닌 실패는 배치를 반으로 나눠 다시 쓰고, 한 행만으로도 실패하면 격리"""
+        try:
+            return await self._write(batch)
+        except Exception as e:
+            if is_connection_error(e):
+                raise
+            if len(batch) == 1:
+                self._reject(batch[0], e)
+                return UpsertResult()
+            self.log_error(f"Flush of {len(batch)} projects failed, splitting batch", e)
+        middle = len(batch) // 2
+        result = await self._write_isolating(batch[:middle])
+        result.merge(await self._write_isolating(batch[middle:]))
+        return result
+
+    async def _write(self, batch: List[ProjectCreate]) -> UpsertResult:
+        # project_id가 없는 프로젝트는 저장하지 않음
+        projects = [
+            project for project in batch
+            if str((project.metadata or {}).get("project_id", ""))
+        ]
+        # seen-set 음성(확실히 새 프로젝트)은 기존 행 조회를 생략하고, 나머지는 content_hash로 변경 여부 확인
+        candidates = seen_set.candidates(projects)
+        await partition_manager.ensure([project.posted_date for project in projects])
+        async with async_session() as session:
+            result = await upsert_projects(session, projects, lookup_urls=candidates)
+            try:
+                await register_skills(session, [row["skills"] for row in result.rows])
+                await dedup_index.assign_clusters(session, result.rows)
+                await record_rollups(session, result.rows)
+                notifications = await percolator.record(session, result.rows)
+                await enqueue_deliveries(session, result.rows, notifications)
+                await record_versions(session, {row["platform"] for row in result.rows})
+                await change_feed.publish_ingest(session, result.rows)
+                await session.commit()
+            except Exception:
+                # assign_clusters가 인덱스에 추가한 새 행은 롤백되었으므로 제거 (이후 행이 없는 행에 묶이지 않도록)
+                dedup_index.discard([row["id"] for row in result.rows if row["is_new"]])
+                raise
+        seen_set.record(result.rows, candidates)
+        return result
+
+    async def _notify(self, result: UpsertResult):
+        for listener in self._listeners:
+            try:
+                await listener(result)
+            except Exception as e:
+                self.log_error(f"Ingest listener {listener.__name__} failed", e)
+
+    async def on_remote_ingest(self, payload: dict):
+        """다른 프로세스(리더)가 저장한 행을 읽어 이 프로세스의 리스너에 전달 (change feed 핸들러)"""
+        new = set(payload.get("new", []))
+        ids = [*new, *payload.get("updated", [])]
+        if not ids:
+            return
+        columns = [getattr(ProjectModel, name) for name in EVENT_FIELDS]
+        async with async_session() as session:
+            rows = await session.execute(select(*columns, ProjectModel.event_seq).where(ProjectModel.id.in_(ids)))
+            result = UpsertResult(rows=[dict(row._mapping, is_new=row.id in new) for row in rows])
+        result.inserted = sum(1 for row in result.rows if row["is_new"])
+        result.updated = len(result.rows) - result.inserted
+        await self._notify(result)
+
+    def _spill(self, batch: List[ProjectCreate]):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        # 여러 워커가 같은 디렉터리를 쓰므로 파일 이름에 pid를 넣어 겹치지 않게 함
+        path = os.path.join(self.spill_dir, f"ingest-{datetime.now():%Y%m%d%H%M%S%f}-{os.getpid()}.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            for project in batch:
+                f.write(project.model_dump_json() + "\n")
+        self.spilled_rows += len(batch)
+        self._has_spill = True
+        self.log_error(f"Database unavailable, spilled {len(batch)} projects to {path}")
+
+    def _reject(self, project: ProjectCreate, error: Exception):
+        """혼자서도 기록에 실패한 행을 오류와 함께 격리 파일에 추가 (replay_spill 대상 아님)"""
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, f"rejected-{datetime.now():%Y%m%d}-{os.getpid()}.ndjson")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"error": str(error), "project": project.model_dump(mode="json")}, ensure_ascii=False) + "\n")
+        self.rejected_rows += 1
+        self.log_error(f"Rejected project {project.original_url} to {path}", error)
+
+    async def replay_spill(self):
+        """스필 파일을 다시 큐에 적재 (파일은 읽은 뒤 삭제)
+
+        모든 워커가 같은 디렉터리를 보므로 읽기 전에 이름을 바꿔 선점하고, 이름 바꾸기에 실패하면
+        다른 워커가 이미 가져간 파일로 보고 건너뛴다.
+        """
+        for path in sorted(glob.glob(os.path.join(self.spill_dir, "ingest-*.ndjson"))):
+            claimed = f"{path}.replaying-{os.getpid()}"
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+            try:
+                with open(claimed, encoding="utf-8") as f:
+                    projects = [ProjectCreate.model_validate_json(line) for line in f if line.strip()]
+                os.remove(claimed)
+            except Exception as e:
+                self.log_error(f"Failed to read spill file {claimed}", e)
+                continue
+            self.logger.info(f"Replaying {len(projects)} spilled projects from {path}")
+            await self.enqueue(projects)
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "flush_count": self.flush_count,
+            "flushed_rows": self.flushed_rows,
+            "spilled_rows": self.spilled_rows,
+            "rejected_rows": self.rejected_rows,
+            "last_flush_latency": self.last_flush_latency,
+            "avg_flush_latency": self.total_flush_latency / self.flush_count if self.flush_count else None,
+        }
+
+    def log_error(self, message: str, error: Exception = None):
+        if error:
+            self.logger.error(f"{message}: {str(error)}")
+        else:
+            self.logger.error(message)
+
+ingest_buffer = IngestBuffer(
+    max_size=settings.INGEST_QUEUE_SIZE,
+    batch_size=settings.INGEST_BATCH_SIZE,
+    flush_interval=settings.INGEST_FLUSH_INTERVAL,
+    spill_dir=settings.INGEST_SPILL_DIR,
+)
@@ -0,0 +1,161 @@
+import asyncio
+import os
+import socket
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import engine
+
+TaskFactory = Callable[[], Awaitable[None]]
+PromoteHook = Callable[[], Awaitable[None]]
+
+class LeaderElection:
+    """Postgres session advisory lock으로 크롤링을 맡을 프로세스 하나를 선출
+
+    모든 워커가 전용 연결에서 주기적으로 pg_try_advisory_lock을 시도하고, 잠금을 얻은 프로세스만
+    등록된 리더 작업(크롤러 스케줄러 등)을 실행한다. 리더 프로세스가 죽거나 연결이 끊기면
+    Postgres가 잠금을 풀어 다른 워커가 다음 확인 주기 안에 이어받는다.
+    리더 쪽에서 연결 오류를 감지하면 즉시 리더 작업을 취소한다.
+
+    팔로워인 동안에는 다른 리더가 수집한 내용이 메모리 인덱스에 없으므로 리더가 되면 먼저
+    promote hook으로 다시 불러온 뒤 작업을 시작하고, 잠금을 가진 동안 예외로 끝난 작업은 다시 시작한다.
+    """
+
+    def __init__(self, lock_id: int, check_interval: float):
+        self.lock_id = lock_id
+        self.check_interval = check_interval
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+        self.is_leader = False
+        self.since: Optional[datetime] = None
+        self.elections = 0
+        self._factories: List[Tuple[str, TaskFactory]] = []
+        self._promote_hooks: List[PromoteHook] = []
+        self.restarts: Counter = Counter()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._conn: Optional[AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def add_task(self, name: str, factory: TaskFactory):
+        """리더인 동안만 실행할 작업 등록 (리더가 될 때마다 factory로 새로 시작)"""
+        self._factories.append((name, factory))
+
+    def add_promote_hook(self, hook: PromoteHook):
+        """리더가 되어 작업을 시작하기 전에 실행할 콜백 (메모리 인덱스 재구성 등)"""
+        self._promote_hooks.append(hook)
+
+    async def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """리더 작업을 멈추고 연결을 닫아 잠금을 넘김"""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._demote()
+        await self._close()
+
+    async def _run(self):
+        while True:
+            try:
+                if self._conn is None:
+                    await self._connect()
+                if self.is_leader:
+                    await self._conn.execute(text("SELECT 1"))
+                else:
+                    result = await self._conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_id})
+                    if result.scalar():
+                        await self._promote()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Leader election connection failed: {str(e)}")
+                await self._demote()
+                await self._close()
+            await asyncio.sleep(self.check_interval)
+
+    async def _connect(self):
+        conn = await engine.connect()
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        # 상태 조회에서 pg_stat_activity로 현재 리더를 보여주기 위한 이름
+        await conn.execute(text("SELECT set_config('application_name', :name, false)"), {"name": self.identity[:63]})
+        self._conn = conn
+
+    async def _close(self):
+        if self._conn is not None:
+            # 풀에 돌려주면 잠금이 그대로 남으므로 연결 자체를 닫음
+            conn, self._conn = self._conn, None
+            try:
+                await conn.invalidate()
+            except Exception as e:
+                self.logger.error(f"Failed to close leader connection: {str(e)}")
+
+    async def _promote(self):
+        # hook이 실패하면 예외가 _run으로 전달되어 연결을 닫고 잠금을 넘김
+        for hook in self._promote_hooks:
+            await hook()
+        self.is_leader = True
+        self.since = datetime.now(timezone.utc)
+        self.elections += 1
+        self.logger.info(f"{self.identity} became leader")
+        for name, factory in self._factories:
+            self._tasks[name] = asyncio.create_task(self._supervise(name, factory))
+
+    async def _supervise(self, name: str, factory: TaskFactory):
+        """리더 작업이 끝나거나 예외가 나면 잠금을 가진 동안 다시 시작"""
+        while True:
+            try:
+                await factory()
+                self.logger.error(f"Leader task {name} exited, restarting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Leader task {name} crashed, restarting: {str(e)}")
+            self.restarts[name] += 1
+            await asyncio.sleep(self.check_interval)
+
+    async def _demote(self):
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        self.since = None
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.logger.info(f"{self.identity} stepped down")
+
+    async def current_leader(self) -> Optional[dict]:
+        """잠금을 가진 세션 (어느 프로세스에서 조회해도 같은 결과)"""
+        async with engine.connect() as conn:
+            result = await conn.execute(text(
+                "SELECT a.application_name, a.backend_start FROM pg_locks l "
+                "JOIN pg_stat_activity a ON a.pid = l.pid "
+                "WHERE l.locktype = 'advisory' AND l.granted AND l.classid::bigint = :high "
+                "AND l.objid::bigint = :low AND l.objsubid = 1"
+            ), {"high": self.lock_id >> 32, "low": self.lock_id & 0xFFFFFFFF})
+            row = result.first()
+        if row is None:
+            return None
+        return {"identity": row.application_name, "connected_at": row.backend_start}
+
+    def stats(self) -> dict:
+        return {
+            "identity": self.identity,
+            "is_leader": self.is_leader,
+            "leader_since": self.since,
+            "elections": self.elections,
+            "tasks": {
+                name: ("running" if not task.done() else "stopped")
+                for name, task in self._tasks.items()
+            },
+            "restarts": dict(self.restarts),
+        }
+
+leader_election = LeaderElection(lock_id=settings.LEADER_LOCK_ID, check_interval=settings.LEADER_CHECK_INTERVAL)
@@ -0,0 +1,56 @@
+import re
+from typing import Any, Dict, Optional, Set
+
+# project_metadata에서 컬럼으로 승격하는 키 (필터/정렬에 인덱스를 쓰기 위함)
+PROMOTED_FIELDS = ["applicants", "view_count", "experience_level", "client_rating", "is_private", "term", "location"]
+
+# 크롤러가 값을 수집하지 않고 고정값을 넣는 플랫폼별 키 (값 없음으로 취급)
+PLACEHOLDER_FIELDS: Dict[str, Set[str]] = {
+    "upwork": {"applicants"},  # 목록 페이지에 지원자 수가 없어 항상 0
+}
+
+# 천 단위 구분 기호를 포함한 첫 번째 정수 ("1,234명", "10 to 15" -> 10, "Less than 5" -> 5)
+_NUMBER = re.compile(r"\d+(?:,\d{3})*")
+
+def _int(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        # 범위는 하한(첫 번째 수)을 사용. 숫자를 모두 이어 붙이면 "10 to 15"가 1015가 됨
+        match = _NUMBER.search(value)
+        return int(match.group().replace(",", "")) if match else None
+    return None
+
+def _rating(value: Any) -> Optional[float]:
+    # 크롤러는 평점을 찾지 못하면 0을 넣으므로 0 이하는 값 없음으로 취급
+    try:
+        rating = float(value)
+    except (TypeError, ValueError):
+        return None
+    return rating if rating > 0 else None
+
+def _text(value: Any, length: int) -> Optional[str]:
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    return value[:length] if value else None
+
+def _bool(value: Any) -> Optional[bool]:
+    return value if isinstance(value, bool) else None
+
+def extract_metadata_fields(platform: str, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """project_metadata에서 승격 컬럼 값을 추출 (없거나 형식이 맞지 않거나 플랫폼 고정값이면 None)"""
+    metadata = metadata or {}
+    placeholders = PLACEHOLDER_FIELDS.get(platform, set())
+    metadata = {key: value for key, value in metadata.items() if key not in placeholders}
+    return {
+        "applicants": _int(metadata.get("applicants")),
+        "view_count": _int(metadata.get("view_count")),
+        "experience_level": _text(metadata.get("experience_level"), 50),
+        "client_rating": _rating(metadata.get("client_rating")),
+        "is_private": _bool(metadata.get("is_private")),
+        "term": _text(metadata.get("term"), 100),
+        "location": _text(metadata.get("location"), 200),
+    }
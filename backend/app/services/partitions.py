@@ -0,0 +1,207 @@
+import asyncio
+import os
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Set, Tuple
+from sqlalchemy import column, delete, distinct, exists, select, table, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import async_session, engine, lock_schema
+from ..models.project import Project as ProjectModel, ProjectUrl
+from .change_feed import DATA_CHANNEL, change_feed
+from .data_version import data_versions, record_versions
+from .stats_cache import stats_cache
+from .export import EXPORT_COLUMNS, parquet_schema, pa, pq, to_arrow_table
+
+PARENT = ProjectModel.__tablename__
+
+def month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month:%Y_%m}"
+
+def create_partition_sql(month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+class PartitionManager:
+    """projects 테이블의 월 단위 range 파티션 관리
+
+    기본(default) 파티션을 두지 않아야 최신순 조회가 최근 파티션만 순서대로 읽는다 (ordered append).
+    그래서 수집 배치에 아직 파티션이 없는 달의 게시일이 있으면 저장 전에 별도의 짧은 트랜잭션에서 만든다.
+    projects가 아직 파티션 테이블이 아니면 (scripts/partition_projects.py 적용 전) 아무것도 하지 않는다.
+    """
+
+    def __init__(self, months_ahead: int, retention_months: int, archive_dir: str):
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.archive_dir = archive_dir
+        self.enabled = False
+        self.months: Set[date] = set()
+        self.logger = setup_logger(self.__class__.__name__)
+
+    async def _list_partitions(self, conn) -> List[Tuple[str, date]]:
+        result = await conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent"
+        ), {"parent": PARENT})
+        prefix = f"{PARENT}_p"
+        partitions = []
+        for (name,) in result:
+            if name.startswith(prefix):
+                year, month = name[len(prefix):].split("_")
+                partitions.append((name, date(int(year), int(month), 1)))
+        return sorted(partitions, key=lambda item: item[1])
+
+    async def start(self):
+        async with engine.begin() as conn:
+            await lock_schema(conn)
+            await self.setup(conn)
+
+    async def setup(self, conn: AsyncConnection):
+        """파티션 테이블 여부 확인 및 이번 달부터 months_ahead개월치 파티션 생성"""
+        result = await conn.execute(text("SELECT relkind FROM pg_class WHERE relname = :parent"), {"parent": PARENT})
+        self.enabled = result.scalar() == "p"
+        if not self.enabled:
+            self.logger.info("projects is not partitioned; run scripts/partition_projects.py to migrate")
+            return
+        current = month_start(datetime.now())
+        for offset in range(self.months_ahead + 1):
+            await conn.execute(text(create_partition_sql(add_months(current, offset))))
+        self.months = {month for _, month in await self._list_partitions(conn)}
+
+    async def ensure(self, posted_dates: Iterable[datetime]):
+        """저장할 행의 게시일이 속한 파티션이 없으면 생성
+
+        수집 트랜잭션과 분리된 자체 트랜잭션에서 만들고 커밋된 뒤에만 목록에 추가한다.
+        (DDL이 잡는 부모 테이블의 ACCESS EXCLUSIVE 잠금을 수집 트랜잭션 내내 들고 있지 않도록)
+        """
+        if not self.enabled:
+            return
+        missing = {month_start(posted_date) for posted_date in posted_dates} - self.months
+        if not missing:
+            return
+        async with engine.begin() as conn:
+            await lock_schema(conn)
+            for month in sorted(missing):
+                await conn.execute(text(create_partition_sql(month)))
+        self.months |= missing
+
+    async def mark_inactive(self) -> int:
+        """마감일이 지난 프로젝트는 expired, 오래된 프로젝트는 closed로 표시
+
+        content_hash는 크롤러가 본 내용 기준이므로 다시 수집되어도 active로 되돌아가지 않는다.
+        """
+        async with async_session() as session:
+            expired = await session.execute(
+                update(ProjectModel)
+                .where(ProjectModel.status.in_(["active", "private"]), ProjectModel.deadline < datetime.now())
+                .values(status="expired")
+                .returning(ProjectModel.platform)
+                .execution_options(synchronize_session=False)
+            )
+            expired = expired.scalars().all()
+            closed = await session.execute(
+                update(ProjectModel)
+                .where(
+                    ProjectModel.status.in_(["active", "private"]),
+                    ProjectModel.posted_date < datetime.now() - timedelta(days=settings.PROJECT_ACTIVE_DAYS),
+                )
+                .values(status="closed")
+                .returning(ProjectModel.platform)
+                .execution_options(synchronize_session=False)
+            )
+            closed = closed.scalars().all()
+            platforms = set(expired) | set(closed)
+            if platforms:
+                # 목록/통계 ETag와 응답 캐시가 바뀐 데이터를 반영하도록 (다른 프로세스는 DATA_CHANNEL 알림으로 다시 읽음)
+                await record_versions(session, platforms)
+                await change_feed.publish(session, DATA_CHANNEL, {"platforms": sorted(platforms)})
+            await session.commit()
+        if platforms:
+            await data_versions.refresh()
+        return len(expired) + len(closed)
+
+    async def archive_expired(self) -> List[str]:
+        """보존 기간이 지난 파티션을 Parquet으로 보관한 뒤 분리/삭제"""
+        if not self.enabled:
+            return []
+        if pa is None:
+            self.logger.error("pyarrow is not installed; old partitions are kept")
+            return []
+        cutoff = add_months(month_start(datetime.now()), -self.retention_months)
+        async with engine.connect() as conn:
+            partitions = [(name, month) for name, month in await self._list_partitions(conn) if month < cutoff]
+
+        archived = []
+        for name, month in partitions:
+            path = await self._archive(name)
+            partition = table(name, column("original_url"), column("platform"))
+            async with engine.begin() as conn:
+                platforms = (await conn.execute(select(distinct(partition.c.platform)))).scalars().all()
+                # 삭제되는 프로젝트의 URL은 다시 수집되면 새 게시일로 등록되도록 함
+                await conn.execute(
+                    delete(ProjectUrl).where(exists().where(partition.c.original_url == ProjectUrl.original_url))
+                )
+                await conn.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+                await conn.execute(text(f"DROP TABLE {name}"))
+                if platforms:
+                    await record_versions(conn, platforms)
+                    await change_feed.publish(conn, DATA_CHANNEL, {"platforms": sorted(platforms), "deleted": True})
+            await data_versions.refresh()
+            stats_cache.invalidate()
+            self.months.discard(month)
+            archived.append(path)
+            self.logger.info(f"Archived partition {name} to {path}")
+        return archived
+
+    async def _archive(self, name: str) -> str:
+        os.makedirs(self.archive_dir, exist_ok=True)
+        path = os.path.join(self.archive_dir, f"{name}.parquet")
+        tmp_path = f"{path}.tmp"
+        partition = table(name, *[column(column_name) for column_name in EXPORT_COLUMNS])
+        stmt = select(*partition.columns).order_by(partition.c.id).execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+
+        schema = parquet_schema()
+        writer = pq.ParquetWriter(tmp_path, schema, compression="zstd")
+        try:
+            async with async_session() as session:
+                result = await session.stream(stmt)
+                async for chunk in result.partitions():
+                    writer.write_table(to_arrow_table(chunk, schema))
+        finally:
+            writer.close()
+        # 파일을 끝까지 쓴 뒤에만 보관본으로 교체 (중간에 실패하면 파티션은 삭제되지 않음)
+        os.replace(tmp_path, path)
+        return path
+
+    async def maintenance_loop(self):
+        while True:
+            try:
+                await self.start()
+                marked = await self.mark_inactive()
+                archived = await self.archive_expired()
+                self.logger.info(f"Partition maintenance: marked={marked}, archived={len(archived)}")
+            except Exception as e:
+                self.logger.error(f"Partition maintenance failed: {str(e)}")
+            await asyncio.sleep(settings.PARTITION_MAINTENANCE_INTERVAL)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "partitions": [partition_name(month) for month in sorted(self.months)],
+        }
+
+partition_manager = PartitionManager(
+    months_ahead=settings.PARTITION_MONTHS_AHEAD,
+    retention_months=settings.PARTITION_RETENTION_MONTHS,
+    archive_dir=settings.ARCHIVE_DIR,
+)
@@ -0,0 +1,203 @@
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import async_session
+from ..models.subscription import Subscription as SubscriptionModel, Notification
+from .skills import canonicalize_skills
+
+def _at_least(value: Optional[float], minimum: float) -> bool:
+    # 금액이 없는 프로젝트는 금액 조건이 있는 구독과 매칭하지 않음
+    return value is not None and value >= minimum
+
+@dataclass(frozen=True)
+class CompiledSubscription:
+    id: int
+    skills: FrozenSet[str]
+    platforms: FrozenSet[str]
+    work_types: FrozenSet[str]
+    payment_types: FrozenSet[str]
+    min_budget_usd: Optional[float]
+    min_hourly_usd: Optional[float]
+
+    @classmethod
+    def from_model(cls, subscription: SubscriptionModel) -> "CompiledSubscription":
+        return cls(
+            id=subscription.id,
+            skills=frozenset(canonicalize_skills(subscription.skills or [])),
+            platforms=frozenset(subscription.platforms or []),
+            work_types=frozenset(subscription.work_types or []),
+            payment_types=frozenset(subscription.payment_types or []),
+            min_budget_usd=subscription.min_budget_usd,
+            min_hourly_usd=subscription.min_hourly_usd,
+        )
+
+    def matches(self, row: Dict[str, Any], skills: FrozenSet[str]) -> bool:
+        if self.platforms and row.get("platform") not in self.platforms:
+            return False
+        if self.work_types and row.get("work_type") not in self.work_types:
+            return False
+        if self.payment_types and row.get("payment_type") not in self.payment_types:
+            return False
+        if self.min_budget_usd is not None and not _at_least(row.get("budget_max_usd"), self.min_budget_usd):
+            return False
+        if self.min_hourly_usd is not None and not _at_least(row.get("budget_hourly_usd"), self.min_hourly_usd):
+            return False
+        return self.skills <= skills
+
+def budget_bucket(value: float) -> int:
+    """로그 스케일 예산 구간 (1 미만은 0번 구간)"""
+    return max(0, int(math.log2(value))) if value >= 1 else 0
+
+class Percolator:
+    """저장된 검색 조건(구독)의 역색인
+
+    구독마다 가장 선택적인 조건 하나(앵커)에만 색인한다:
+    가장 드문 스킬 > 플랫폼 > 작업 형태 > 지불 방식 > 시급/예산 구간 > 조건 없음.
+    프로젝트는 자신의 스킬/플랫폼/형태/예산 구간에 해당하는 목록만 후보로 보고
+    후보만 전체 조건을 확인하므로, 비용이 전체 구독 수가 아닌 후보 수에 비례한다.
+    """
+
+    def __init__(self):
+        self.subscriptions: Dict[int, CompiledSubscription] = {}
+        self.by_skill: Dict[str, Dict[int, CompiledSubscription]] = {}
+        self.by_platform: Dict[str, Dict[int, CompiledSubscription]] = {}
+        self.by_work_type: Dict[str, Dict[int, CompiledSubscription]] = {}
+        self.by_payment_type: Dict[str, Dict[int, CompiledSubscription]] = {}
+        self.by_hourly: Dict[int, Dict[int, CompiledSubscription]] = {}
+        self.by_budget: Dict[int, Dict[int, CompiledSubscription]] = {}
+        self.unanchored: Dict[int, CompiledSubscription] = {}
+        self._anchors: Dict[int, List[Dict[int, CompiledSubscription]]] = {}
+
+        self.matched_projects = 0
+        self.notifications = 0
+        self.candidates_checked = 0
+        self.total_match_time = 0.0
+        self.logger = setup_logger(self.__class__.__name__)
+
+    @staticmethod
+    def _posting(index: Dict[Any, Dict[int, CompiledSubscription]], key: Any) -> Dict[int, CompiledSubscription]:
+        return index.setdefault(key, {})
+
+    def _anchor_lists(self, subscription: CompiledSubscription) -> List[Dict[int, CompiledSubscription]]:
+        if subscription.skills:
+            # 모든 스킬을 포함해야 하므로 가장 드문 스킬 하나만 색인해도 충분
+            skill = min(subscription.skills, key=lambda s: (len(self.by_skill.get(s, ())), s))
+            return [self._posting(self.by_skill, skill)]
+        # 아래 조건들은 "하나라도 일치"이므로 값마다 색인
+        if subscription.platforms:
+            return [self._posting(self.by_platform, value) for value in subscription.platforms]
+        if subscription.work_types:
+            return [self._posting(self.by_work_type, value) for value in subscription.work_types]
+        if subscription.payment_types:
+            return [self._posting(self.by_payment_type, value) for value in subscription.payment_types]
+        if subscription.min_hourly_usd is not None:
+            return [self._posting(self.by_hourly, budget_bucket(subscription.min_hourly_usd))]
+        if subscription.min_budget_usd is not None:
+            return [self._posting(self.by_budget, budget_bucket(subscription.min_budget_usd))]
+        return [self.unanchored]
+
+    def add(self, subscription: CompiledSubscription):
+        if subscription.id in self.subscriptions:
+            self.remove(subscription.id)
+        self.subscriptions[subscription.id] = subscription
+        anchors = self._anchor_lists(subscription)
+        for posting in anchors:
+            posting[subscription.id] = subscription
+        self._anchors[subscription.id] = anchors
+
+    def remove(self, subscription_id: int):
+        self.subscriptions.pop(subscription_id, None)
+        for posting in self._anchors.pop(subscription_id, []):
+            posting.pop(subscription_id, None)
+
+    def match(self, row: Dict[str, Any]) -> List[int]:
+        """프로젝트 행과 일치하는 구독 id 목록"""
+        skills = frozenset(row.get("skills") or [])
+        postings = [self.by_skill.get(skill) for skill in skills]
+        postings.append(self.by_platform.get(row.get("platform")))
+        postings.append(self.by_work_type.get(row.get("work_type")))
+        postings.append(self.by_payment_type.get(row.get("payment_type")))
+        # 최소 금액 구간이 프로젝트 금액 구간 이하인 구독만 후보
+        if row.get("budget_hourly_usd") is not None:
+            top = budget_bucket(row["budget_hourly_usd"])
+            postings.extend(posting for bucket, posting in self.by_hourly.items() if bucket <= top)
+        if row.get("budget_max_usd") is not None:
+            top = budget_bucket(row["budget_max_usd"])
+            postings.extend(posting for bucket, posting in self.by_budget.items() if bucket <= top)
+        postings.append(self.unanchored)
+
+        matched = []
+        for posting in postings:
+            if not posting:
+                continue
+            self.candidates_checked += len(posting)
+            # 구독은 한 종류의 앵커에만 색인되고 프로젝트는 스킬 외에는 종류마다 값이 하나라서 후보가 겹치지 않음
+            matched.extend(sub.id for sub in posting.values() if sub.matches(row, skills))
+        return matched
+
+    async def record(self, session: AsyncSession, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, int]]:
+        """새로 저장된 행을 구독과 매칭해 notifications에 기록 (호출자의 트랜잭션 안에서 실행)"""
+        started = time.perf_counter()
+        notifications = []
+        for row in rows:
+            if not row["is_new"]:
+                continue
+            subscription_ids = self.match(row)
+            if subscription_ids:
+                self.matched_projects += 1
+                notifications.extend(
+                    {"subscription_id": subscription_id, "project_id": row["id"]}
+                    for subscription_id in subscription_ids
+                )
+        self.total_match_time += time.perf_counter() - started
+
+        if notifications:
+            await session.execute(insert(Notification).values(notifications).on_conflict_do_nothing())
+            self.notifications += len(notifications)
+        return notifications
+
+    async def load(self):
+        """활성 구독을 DB에서 읽어 인덱스 재구성"""
+        async with async_session() as session:
+            result = await session.execute(select(SubscriptionModel).where(SubscriptionModel.active.is_(True)))
+            compiled = [CompiledSubscription.from_model(subscription) for subscription in result.scalars()]
+        fresh = Percolator()
+        for subscription in compiled:
+            fresh.add(subscription)
+        for name in ("subscriptions", "by_skill", "by_platform", "by_work_type", "by_payment_type",
+                     "by_hourly", "by_budget", "unanchored", "_anchors"):
+            setattr(self, name, getattr(fresh, name))
+        self.logger.info(f"Percolator loaded: {self.stats()}")
+
+    async def on_remote_change(self, payload: dict):
+        """다른 프로세스에서 구독이 추가/삭제되었다는 알림을 받으면 다시 로드"""
+        await self.load()
+
+    async def reload_loop(self):
+        """다른 프로세스에서 변경된 구독을 반영하기 위해 주기적으로 재구성"""
+        while True:
+            await asyncio.sleep(settings.PERCOLATOR_RELOAD_INTERVAL)
+            try:
+                await self.load()
+            except Exception as e:
+                self.logger.error(f"Failed to reload subscriptions: {str(e)}")
+
+    def stats(self) -> dict:
+        return {
+            "subscriptions": len(self.subscriptions),
+            "skill_keys": len(self.by_skill),
+            "unanchored": len(self.unanchored),
+            "matched_projects": self.matched_projects,
+            "notifications": self.notifications,
+            "candidates_checked": self.candidates_checked,
+            "total_match_time": self.total_match_time,
+        }
+
+percolator = Percolator()
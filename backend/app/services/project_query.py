@@ -0,0 +1,203 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import func, or_, select, tuple_
+from ..models.project import Project as ProjectModel
+from ..models.skill import Skill
+from .skills import canonicalize_skills
+
+# 목록 응답(schemas.project.Project)에 필요한 컬럼. ORM 객체 대신 Core 행으로 읽음
+LIST_COLUMNS = [
+    ProjectModel.id,
+    ProjectModel.platform,
+    ProjectModel.title,
+    ProjectModel.description,
+    ProjectModel.budget_min,
+    ProjectModel.budget_max,
+    ProjectModel.currency,
+    ProjectModel.budget_min_usd,
+    ProjectModel.budget_max_usd,
+    ProjectModel.budget_hourly_usd,
+    ProjectModel.posted_date,
+    ProjectModel.deadline,
+    ProjectModel.skills,
+    ProjectModel.url,
+    ProjectModel.status,
+    ProjectModel.original_url,
+    ProjectModel.work_type,
+    ProjectModel.payment_type,
+    ProjectModel.cluster_id,
+    ProjectModel.applicants,
+    ProjectModel.view_count,
+    ProjectModel.experience_level,
+    ProjectModel.client_rating,
+    ProjectModel.is_private,
+    ProjectModel.term,
+    ProjectModel.location,
+    ProjectModel.project_metadata.label("metadata"),
+]
+
+# 목록 정렬: 이름 -> (컬럼, 내림차순 여부). 승격 컬럼 정렬은 값이 있는 프로젝트만 대상 (keyset 조건 단순화)
+SORTS = {
+    "newest": (ProjectModel.posted_date, True),
+    "applicants": (ProjectModel.applicants, False),  # 지원자 적은 순
+    "client_rating": (ProjectModel.client_rating, True),
+    "view_count": (ProjectModel.view_count, True),
+}
+
+def list_select():
+    return select(*LIST_COLUMNS)
+
+@dataclass
+class ProjectFilter:
+    """목록/내보내기 API 공통 필터"""
+    platform: Optional[str] = None
+    work_type: Optional[str] = None
+    payment_type: Optional[str] = None
+    currency: Optional[str] = None
+    budget_min: Optional[float] = None  # 예산 상한이 이 값 이상
+    budget_max: Optional[float] = None  # 예산 하한이 이 값 이하
+    budget_usd_min: Optional[float] = None  # USD 환산 예산 상한이 이 값 이상
+    budget_usd_max: Optional[float] = None  # USD 환산 예산 하한이 이 값 이하
+    hourly_usd_min: Optional[float] = None  # 시급 환산 금액이 이 값 이상
+    posted_since: Optional[datetime] = None
+    status: Optional[str] = None
+    skills_any: Optional[List[str]] = None  # 하나라도 포함
+    skills_all: Optional[List[str]] = None  # 모두 포함
+    collapse_duplicates: bool = False  # 유사 중복은 대표 프로젝트만
+    applicants_max: Optional[int] = None
+    client_rating_min: Optional[float] = None
+    experience_level: Optional[str] = None
+    location: Optional[str] = None
+    exclude_private: bool = False
+    metadata_contains: Optional[dict] = None  # project_metadata @> 값 (GIN jsonb_path_ops)
+
+    def apply(self, stmt):
+        if self.platform:
+            stmt = stmt.where(ProjectModel.platform == self.platform)
+        if self.work_type:
+            stmt = stmt.where(ProjectModel.work_type == self.work_type)
+        if self.payment_type:
+            stmt = stmt.where(ProjectModel.payment_type == self.payment_type)
+        if self.currency:
+            stmt = stmt.where(ProjectModel.currency == self.currency)
+        if self.budget_min is not None:
+            stmt = stmt.where(ProjectModel.budget_max >= self.budget_min)
+        if self.budget_max is not None:
+            stmt = stmt.where(ProjectModel.budget_min <= self.budget_max)
+        if self.budget_usd_min is not None:
+            stmt = stmt.where(ProjectModel.budget_max_usd >= self.budget_usd_min)
+        if self.budget_usd_max is not None:
+            stmt = stmt.where(ProjectModel.budget_min_usd <= self.budget_usd_max)
+        if self.hourly_usd_min is not None:
+            stmt = stmt.where(ProjectModel.budget_hourly_usd >= self.hourly_usd_min)
+        if self.posted_since:
+            stmt = stmt.where(ProjectModel.posted_date >= self.posted_since)
+        if self.status:
+            stmt = stmt.where(ProjectModel.status == self.status)
+        # text[] GIN 인덱스를 쓰는 && / @> 연산자
+        if self.skills_any:
+            stmt = stmt.where(ProjectModel.skills.overlap(canonicalize_skills(self.skills_any)))
+        if self.skills_all:
+            stmt = stmt.where(ProjectModel.skills.contains(canonicalize_skills(self.skills_all)))
+        if self.collapse_duplicates:
+            stmt = stmt.where(or_(ProjectModel.cluster_id.is_(None), ProjectModel.cluster_id == ProjectModel.id))
+        if self.applicants_max is not None:
+            stmt = stmt.where(ProjectModel.applicants <= self.applicants_max)
+        if self.client_rating_min is not None:
+            stmt = stmt.where(ProjectModel.client_rating >= self.client_rating_min)
+        if self.experience_level:
+            stmt = stmt.where(ProjectModel.experience_level == self.experience_level)
+        if self.location:
+            stmt = stmt.where(ProjectModel.location == self.location)
+        if self.exclude_private:
+            stmt = stmt.where(ProjectModel.is_private.isnot(True))
+        if self.metadata_contains:
+            stmt = stmt.where(ProjectModel.project_metadata.contains(self.metadata_contains))
+        return stmt
+
+def top_skills(filters: ProjectFilter, limit: int):
+    """필터 조건에 맞는 프로젝트의 스킬별 건수 (skill, display_name, count)"""
+    skill = func.unnest(ProjectModel.skills).label("skill")
+    matched = filters.apply(select(skill)).subquery()
+    count = func.count().label("count")
+    return (
+        select(matched.c.skill, Skill.display_name, count)
+        .outerjoin(Skill, Skill.name == matched.c.skill)
+        .group_by(matched.c.skill, Skill.display_name)
+        .order_by(count.desc(), matched.c.skill)
+        .limit(limit)
+    )
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode(cursor: str) -> list:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    return json.loads(raw)
+
+def encode_cursor(value, project_id: int) -> str:
+    """정렬 컬럼 값과 id로 만든 커서 (newest 정렬은 posted_date)"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return _encode([value, project_id])
+
+def decode_cursor(cursor: str, sort: str = "newest") -> Tuple[object, int]:
+    """잘못된 커서는 ValueError"""
+    try:
+        value, project_id = _decode(cursor)
+        if sort == "newest":
+            value = datetime.fromisoformat(value)
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("cursor value is not a number")
+        return value, int(project_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def encode_search_cursor(rank: float, project_id: int) -> str:
+    return _encode([rank, project_id])
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        rank, project_id = _decode(cursor)
+        return float(rank), int(project_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def to_tsquery_text(query: str) -> str:
+    """검색어를 접두 일치 tsquery로 변환 ("react 개발" -> "'react':* & '개발':*")
+
+    각 단어는 따옴표로 감싸 문서와 같은 파서("next.js" 등)로 분해되게 하고,
+    한국어는 조사가 붙은 형태("리액트로")로 저장되므로 접두 일치로 찾는다.
+    """
+    terms = query.lower().split()
+    if not terms:
+        raise ValueError("Search query has no searchable terms")
+    quoted = ("'" + term.replace("\\", "\\\\").replace("'", "''") + "'" for term in terms)
+    return " & ".join(f"{term}:*" for term in quoted)
+
+def paginate(stmt, cursor: Optional[str], limit: int, sort: str = "newest"):
+    """(정렬 컬럼, id) keyset 페이지네이션. 다음 페이지 확인을 위해 limit + 1 행 조회"""
+    column, descending = SORTS[sort]
+    if sort != "newest":
+        stmt = stmt.where(column.isnot(None))
+    if cursor:
+        value, project_id = decode_cursor(cursor, sort)
+        key, bound = tuple_(column, ProjectModel.id), tuple_(value, project_id)
+        stmt = stmt.where(key < bound if descending else key > bound)
+    if descending:
+        return stmt.order_by(column.desc(), ProjectModel.id.desc()).limit(limit + 1)
+    return stmt.order_by(column, ProjectModel.id).limit(limit + 1)
+
+def search(stmt, query: str, cursor: Optional[str], limit: int):
+    """전문 검색 + (rank, id) 내림차순 keyset 페이지네이션. 각 행 끝에 rank 컬럼이 추가됨"""
+    tsquery = func.to_tsquery("simple", to_tsquery_text(query))
+    rank = func.ts_rank_cd(ProjectModel.search_vector, tsquery).label("rank")
+    stmt = stmt.add_columns(rank).where(ProjectModel.search_vector.op("@@")(tsquery))
+    if cursor:
+        last_rank, project_id = decode_search_cursor(cursor)
+        stmt = stmt.where(tuple_(rank, ProjectModel.id) < tuple_(last_rank, project_id))
+    return stmt.order_by(rank.desc(), ProjectModel.id.desc()).limit(limit + 1)
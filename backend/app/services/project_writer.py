@@ -0,0 +1,211 @@
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Optional, Set
+from sqlalchemy import String, any_, bindparam, func, insert as sa_insert, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.project import EVENT_SEQ, Project as ProjectModel, ProjectChange, ProjectUrl
+from ..schemas.project import ProjectCreate
+from ..config import settings
+from .dedup import minhash_signature
+from .fx import fx_rates
+from .metadata_fields import extract_metadata_fields
+from .skills import project_skills
+
+# 재크롤링 시 덮어쓰지 않는 컬럼 (게시일은 크롤링 시각으로 채워지는 플랫폼이 있음)
+IMMUTABLE_COLUMNS = {"id", "original_url", "created_at", "updated_at", "posted_date"}
+
+# content_hash 계산에 포함되는 컬럼
+HASHED_COLUMNS = [
+    "title", "description", "budget_min", "budget_max", "currency", "deadline",
+    "skills", "url", "status", "work_type", "payment_type", "project_metadata",
+]
+
+_WHITESPACE = re.compile(r"\s+")
+
+@dataclass
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    rows: List[Dict[str, Any]] = field(default_factory=list)  # 실제로 기록된 행 (id, is_new 포함)
+    changes: List[Dict[str, Any]] = field(default_factory=list)  # 갱신된 행의 변경 기록
+
+    def merge(self, other: "UpsertResult"):
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.rows.extend(other.rows)
+        self.changes.extend(other.changes)
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip()
+    if isinstance(value, float):
+        return round(value, 2)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+def normalized_fields(row: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {name: _normalize(row.get(name)) for name in HASHED_COLUMNS}
+    if fields["skills"]:
+        fields["skills"] = sorted(fields["skills"])
+    return fields
+
+def compute_content_hash(row: Dict[str, Any]) -> str:
+    """정규화된 내용 컬럼의 안정적인 sha256 해시"""
+    payload = json.dumps(normalized_fields(row), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def changed_fields(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    old_fields, new_fields = normalized_fields(old), normalized_fields(new)
+    return [name for name in HASHED_COLUMNS if old_fields[name] != new_fields[name]]
+
+def project_to_row(project: ProjectCreate) -> Dict[str, Any]:
+    """ProjectCreate를 projects 테이블 컬럼 딕셔너리로 변환"""
+    data = project.dict()
+    data["project_metadata"] = data.pop("metadata", None)
+    data["work_type"] = project.work_type.value
+    data["payment_type"] = project.payment_type.value
+    data["skills"] = project_skills(project)
+    data["content_hash"] = compute_content_hash(data)
+    data.update(fx_rates.normalize_budget(data))
+    data.update(extract_metadata_fields(data["platform"], data["project_metadata"]))
+    data["minhash"] = minhash_signature(project.title, project.description, settings.DEDUP_SHINGLE_SIZE)
+    return data
+
+def _urls_param(urls: Iterable[str]):
+    return any_(bindparam("urls", list(urls), type_=ARRAY(String)))
+
+async def _existing_hashes(session: AsyncSession, urls: List[str]) -> Dict[str, str]:
+    result = await session.execute(
+        select(ProjectModel.original_url, ProjectModel.content_hash)
+        .where(ProjectModel.original_url == _urls_param(urls))
+    )
+    return dict(result.all())
+
+async def _claim_urls(session: AsyncSession, rows: List[Dict[str, Any]]) -> Dict[str, datetime]:
+    """project_urls에 URL을 등록하고 URL별 확정 게시일(파티션 키)을 반환
+
+    ON CONFLICT DO NOTHING은 같은 URL을 먼저 넣은 트랜잭션이 끝날 때까지 기다리므로,
+    동시에 같은 URL을 쓰는 writer도 모두 처음 등록된 게시일로 같은 행을 upsert 한다.
+    """
+    claimed = {}
+    size = settings.UPSERT_BATCH_SIZE
+    # URL 순서로 등록해 동시에 실행되는 writer끼리 같은 순서로 잠금을 잡도록 함
+    rows = sorted(rows, key=lambda row: row["original_url"])
+    for start in range(0, len(rows), size):
+        chunk = rows[start:start + size]
+        stmt = insert(ProjectUrl).values([
+            {"original_url": row["original_url"], "posted_date": row["posted_date"]} for row in chunk
+        ]).on_conflict_do_nothing(index_elements=[ProjectUrl.original_url]).returning(
+            ProjectUrl.original_url, ProjectUrl.posted_date,
+        )
+        claimed.update((await session.execute(stmt)).all())
+    others = [row["original_url"] for row in rows if row["original_url"] not in claimed]
+    if others:
+        result = await session.execute(
+            select(ProjectUrl.original_url, ProjectUrl.posted_date).where(ProjectUrl.original_url == _urls_param(others))
+        )
+        claimed.update(result.all())
+    return claimed
+
+async def _previous_values(session: AsyncSession, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+    columns = [getattr(ProjectModel, name) for name in HASHED_COLUMNS]
+    result = await session.execute(
+        select(ProjectModel.original_url, *columns).where(ProjectModel.original_url == _urls_param(urls))
+    )
+    return {row.original_url: dict(row._mapping) for row in result}
+
+async def upsert_rows(
+    session: AsyncSession,
+    rows: Iterable[Dict[str, Any]],
+    lookup_urls: Optional[Set[str]] = None,
+) -> UpsertResult:
+    """INSERT ... ON CONFLICT (original_url, posted_date) DO UPDATE 로 행을 일괄 반영
+
+    content_hash가 같은 행은 쓰지 않고 (unchanged), 바뀐 행은 변경된 필드 목록을
+    project_changes에 남긴다. lookup_urls가 주어지면 그 URL만 기존 행을 조회한다
+    (seen-set 음성으로 확실히 새 프로젝트인 URL은 조회 생략). 커밋은 호출자가 담당한다.
+    """
+    # 같은 배치 안의 중복 URL은 마지막 값만 유지 (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신할 수 없음)
+    unique_rows = {row["original_url"]: row for row in rows}
+    result = UpsertResult()
+    if not unique_rows:
+        return result
+
+    # 기존 해시를 한 번에 조회해 내용이 같은 행은 쓰기 자체를 생략
+    urls = [url for url in unique_rows if lookup_urls is None or url in lookup_urls]
+    existing = await _existing_hashes(session, urls) if urls else {}
+    pending = [
+        row for original_url, row in unique_rows.items()
+        if existing.get(original_url) != row["content_hash"]
+    ]
+    result.unchanged += len(unique_rows) - len(pending)
+    if not pending:
+        return result
+
+    # 게시일(파티션 키)은 처음 등록된 값을 써야 같은 행으로 충돌 처리됨
+    claimed = await _claim_urls(session, pending)
+    for row in pending:
+        row["posted_date"] = claimed[row["original_url"]]
+
+    changed_urls = [row["original_url"] for row in pending if row["original_url"] in existing]
+    previous = await _previous_values(session, changed_urls) if changed_urls else {}
+
+    size = settings.UPSERT_BATCH_SIZE
+    for start in range(0, len(pending), size):
+        chunk = pending[start:start + size]
+        stmt = insert(ProjectModel).values(chunk)
+        set_ = {name: stmt.excluded[name] for name in chunk[0] if name not in IMMUTABLE_COLUMNS}
+        set_["updated_at"] = func.now()
+        set_["event_seq"] = EVENT_SEQ.next_value()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectModel.original_url, ProjectModel.posted_date],
+            set_=set_,
+            where=ProjectModel.content_hash.is_distinct_from(stmt.excluded.content_hash),
+        ).returning(
+            ProjectModel.id,
+            ProjectModel.original_url,
+            ProjectModel.event_seq,
+            literal_column("(xmax = 0)").label("is_new"),
+        )
+
+        written = (await session.execute(stmt)).all()
+        for project_id, original_url, event_seq, is_new in written:
+            row = dict(unique_rows[original_url], id=project_id, event_seq=event_seq, is_new=is_new)
+            result.rows.append(row)
+            if is_new:
+                result.inserted += 1
+                continue
+            result.updated += 1
+            old = previous.get(original_url)
+            result.changes.append({
+                "project_id": project_id,
+                "platform": row["platform"],
+                "changed_fields": changed_fields(old, row) if old else HASHED_COLUMNS,
+                "previous_hash": existing.get(original_url),
+                "content_hash": row["content_hash"],
+            })
+
+    # 동시에 다른 writer가 같은 내용을 먼저 쓴 경우 WHERE 조건으로 걸러진 행
+    result.unchanged += len(pending) - len(result.rows)
+
+    if result.changes:
+        await session.execute(sa_insert(ProjectChange), result.changes)
+    return result
+
+async def upsert_projects(
+    session: AsyncSession,
+    projects: Iterable[ProjectCreate],
+    lookup_urls: Optional[Set[str]] = None,
+) -> UpsertResult:
+    return await upsert_rows(session, [project_to_row(project) for project in projects], lookup_urls)
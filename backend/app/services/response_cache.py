@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+from ..config import settings
+
+class ResponseCache:
+    """ETag별 응답 본문을 보관하는 LRU 캐시 (항목 수와 전체 바이트 수로 제한)
+
+    항목은 저장 당시의 ETag와 함께 보관되며, 데이터 버전이 바뀌어 ETag가 달라지면 무시된다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, etag: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != etag:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: str, etag: str, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = (etag, body)
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+response_cache = ResponseCache(max_entries=settings.RESPONSE_CACHE_SIZE, max_bytes=settings.RESPONSE_CACHE_MAX_BYTES)
@@ -0,0 +1,169 @@
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Integer, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import settings
+from ..models.rollup import ProjectRollup
+
+# 예산 스케치: 경계가 SKETCH_GAMMA배씩 커지는 고정 로그 버킷의 건수 배열.
+# 버킷 경계가 모든 행에서 같으므로 원소별 합으로 병합되고, 분위수의 상대 오차는 버킷 폭의 절반(약 ±12%) 이내.
+SKETCH_GAMMA = 1.25
+SKETCH_MIN = 1.0  # USD, 0번 버킷은 SKETCH_MIN * SKETCH_GAMMA 미만을 모두 담음
+SKETCH_SIZE = 80  # 마지막 버킷은 약 4,500만 USD 이상을 모두 담음
+_LOG_GAMMA = math.log(SKETCH_GAMMA)
+
+INTERVALS = {"hour": timedelta(hours=1), "day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+RollupKey = Tuple[datetime, str, str, str]  # (bucket, platform, work_type, skill)
+
+def sketch_index(value: float) -> int:
+    if value < SKETCH_MIN * SKETCH_GAMMA:
+        return 0
+    return min(int(math.log(value / SKETCH_MIN) / _LOG_GAMMA), SKETCH_SIZE - 1)
+
+def sketch_value(index: int) -> float:
+    """버킷의 대표값 (경계의 기하 평균)"""
+    return round(SKETCH_MIN * SKETCH_GAMMA ** (index + 0.5), 2)
+
+def merge_sketch(target: List[int], sketch: Iterable[int]):
+    for index, count in enumerate(sketch):
+        target[index] += count
+
+def sketch_quantiles(sketch: List[int], quantiles: Iterable[float]) -> Dict[str, Optional[float]]:
+    total = sum(sketch)
+    result = {}
+    for quantile in quantiles:
+        label = f"p{quantile * 100:g}"
+        if not total:
+            result[label] = None
+            continue
+        rank = quantile * (total - 1)
+        cumulative = 0
+        for index, count in enumerate(sketch):
+            cumulative += count
+            if cumulative > rank:
+                result[label] = sketch_value(index)
+                break
+    return result
+
+def hour_bucket(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+def truncate(value: datetime, interval: str) -> datetime:
+    value = hour_bucket(value)
+    if interval == "hour":
+        return value
+    value = value.replace(hour=0)
+    if interval == "week":
+        value -= timedelta(days=value.weekday())
+    return value
+
+def accumulate(rows: Iterable[Dict[str, Any]], rollups: Optional[Dict[RollupKey, list]] = None) -> Dict[RollupKey, list]:
+    """행을 (시간, 플랫폼, work_type, 스킬) 키별 [건수, 예산 스케치, 시급 스케치]로 집계
+
+    스킬이 ''인 키는 전체 프로젝트 건수이므로 스킬이 여러 개인 프로젝트도 한 번만 센다.
+    """
+    rollups = {} if rollups is None else rollups
+    for row in rows:
+        budget = None
+        if row.get("payment_type") == "fixed":
+            budget = row.get("budget_max_usd") or row.get("budget_min_usd")
+        hourly = row.get("budget_hourly_usd")
+        bucket = hour_bucket(row["posted_date"])
+        work_type = row.get("work_type") or "undefined"
+        skills = dict.fromkeys(skill[:100] for skill in row.get("skills") or [])
+        for skill in ["", *skills]:
+            key = (bucket, row["platform"], work_type, skill)
+            entry = rollups.get(key)
+            if entry is None:
+                entry = rollups[key] = [0, [0] * SKETCH_SIZE, [0] * SKETCH_SIZE]
+            entry[0] += 1
+            if budget:
+                entry[1][sketch_index(budget)] += 1
+            if hourly:
+                entry[2][sketch_index(hourly)] += 1
+    return rollups
+
+async def upsert_rollups(session: AsyncSession, rollups: Dict[RollupKey, list]):
+    """집계를 project_rollups에 더함 (ON CONFLICT 시 건수는 합, 스케치는 sketch_merge로 원소별 합)"""
+    # 키 순서로 써서 동시에 실행되는 트랜잭션끼리 같은 순서로 행 잠금을 잡도록 함
+    values = [
+        {
+            "bucket": bucket, "platform": platform, "work_type": work_type, "skill": skill,
+            "count": count, "budget_sketch": budget_sketch, "hourly_sketch": hourly_sketch,
+        }
+        for (bucket, platform, work_type, skill), (count, budget_sketch, hourly_sketch) in sorted(rollups.items())
+    ]
+    size = settings.UPSERT_BATCH_SIZE
+    for start in range(0, len(values), size):
+        stmt = insert(ProjectRollup).values(values[start:start + size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectRollup.bucket, ProjectRollup.platform, ProjectRollup.work_type, ProjectRollup.skill],
+            set_={
+                "count": ProjectRollup.count + stmt.excluded.count,
+                "budget_sketch": func.sketch_merge(ProjectRollup.budget_sketch, stmt.excluded.budget_sketch, type_=ARRAY(Integer)),
+                "hourly_sketch": func.sketch_merge(ProjectRollup.hourly_sketch, stmt.excluded.hourly_sketch, type_=ARRAY(Integer)),
+            },
+        )
+        await session.execute(stmt)
+
+async def record_rollups(session: AsyncSession, rows: List[Dict[str, Any]]):
+    """새로 추가된 행을 롤업에 반영 (수집 트랜잭션 안에서 실행)
+
+    게시 건수 집계이므로 재수집으로 갱신된 행은 다시 세지 않는다.
+    """
+    rollups = accumulate(row for row in rows if row["is_new"])
+    if rollups:
+        await upsert_rollups(session, rollups)
+
+async def timeseries(
+    session: AsyncSession,
+    start: datetime,
+    end: datetime,
+    interval: str = "hour",
+    platform: Optional[str] = None,
+    work_type: Optional[str] = None,
+    skill: Optional[str] = None,
+    quantiles: Iterable[float] = (0.5, 0.9),
+) -> List[Dict[str, Any]]:
+    """[start, end) 구간의 interval별 게시 건수와 예산/시급 분위수 (빈 구간은 0건)"""
+    stmt = select(
+        ProjectRollup.bucket, ProjectRollup.count, ProjectRollup.budget_sketch, ProjectRollup.hourly_sketch,
+    ).where(
+        ProjectRollup.skill == (skill or ""),
+        ProjectRollup.bucket >= hour_bucket(start),
+        ProjectRollup.bucket < end,
+    )
+    if platform:
+        stmt = stmt.where(ProjectRollup.platform == platform)
+    if work_type:
+        stmt = stmt.where(ProjectRollup.work_type == work_type)
+
+    step = INTERVALS[interval]
+    points = {}
+    current = truncate(start, interval)
+    while current < end:
+        points[current] = [0, [0] * SKETCH_SIZE, [0] * SKETCH_SIZE]
+        current += step
+
+    result = await session.execute(stmt)
+    for bucket, count, budget_sketch, hourly_sketch in result:
+        point = points.get(truncate(bucket, interval))
+        if point is None:
+            continue
+        point[0] += count
+        merge_sketch(point[1], budget_sketch)
+        merge_sketch(point[2], hourly_sketch)
+
+    quantiles = list(quantiles)
+    return [
+        {
+            "bucket": bucket,
+            "count": count,
+            "budget_usd": sketch_quantiles(budget_sketch, quantiles),
+            "hourly_usd": sketch_quantiles(hourly_sketch, quantiles),
+        }
+        for bucket, (count, budget_sketch, hourly_sketch) in points.items()
+    ]
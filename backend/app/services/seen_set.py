@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import math
+import os
+import struct
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+from sqlalchemy import select
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import async_session
+from ..models.project import Project as ProjectModel
+from ..schemas.project import ProjectCreate
+
+class BloomFilter:
+    """고정 크기 Bloom filter (blake2b 기반 double hashing)"""
+
+    _HEADER = struct.Struct("<QQdII")  # capacity, size(bits), error_rate, hash_count, count
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size, self.hash_count = self.dimensions(capacity, error_rate)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def dimensions(capacity: int, error_rate: float):
+        """(비트 수 m, 해시 함수 수 k)"""
+        size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        return size, max(1, round(size / capacity * math.log(2)))
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> bool:
+        """키를 추가하고, 새로 추가된 키인지 반환"""
+        added = False
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+    @property
+    def false_positive_rate(self) -> float:
+        """현재 항목 수 기준 추정 거짓 양성률"""
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    def to_bytes(self) -> bytes:
+        header = self._HEADER.pack(self.capacity, self.size, self.error_rate, self.hash_count, self.count)
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """to_bytes 결과에서 복원. 헤더와 비트 배열 길이가 맞지 않으면 ValueError"""
+        if len(data) < cls._HEADER.size:
+            raise ValueError("Bloom filter data is shorter than its header")
+        capacity, size, error_rate, hash_count, count = cls._HEADER.unpack_from(data)
+        if size < 8 or hash_count < 1 or len(data) != cls._HEADER.size + (size + 7) // 8:
+            raise ValueError(f"Invalid bloom filter: size={size}, hash_count={hash_count}, length={len(data)}")
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.size, bloom.error_rate = capacity, size, error_rate
+        bloom.hash_count, bloom.count = hash_count, count
+        bloom.bits = bytearray(data[cls._HEADER.size:cls._HEADER.size + (size + 7) // 8])
+        return bloom
+
+class SeenSet:
+    """플랫폼별 수집 이력 (original_url) Bloom filter
+
+    음성 결과는 확실히 새 프로젝트이므로 기존 행 조회를 생략하고, 양성 결과만 writer가 DB에서
+    기존 content_hash를 읽어 변경 여부를 확인한다.
+    """
+
+    # 스냅샷: magic, (taken_at, 필터 수), 필터마다 (이름 길이, blob 길이, 이름, blob), 끝에 앞부분 전체의 blake2b
+    _SNAPSHOT_MAGIC = b"SEEN2"
+    _CHECKSUM_SIZE = 16
+
+    def __init__(self, capacity: int, error_rate: float, snapshot_path: str):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.snapshot_path = snapshot_path
+        self.filters: Dict[str, BloomFilter] = {}
+        self.warmed_at: Optional[datetime] = None
+        self.lookups = 0
+        self.positives = 0
+        self.false_positives = 0
+        self.logger = setup_logger(self.__class__.__name__)
+
+    def _filter(self, platform: str) -> BloomFilter:
+        if platform not in self.filters:
+            self.filters[platform] = BloomFilter(self.capacity, self.error_rate)
+        return self.filters[platform]
+
+    def add(self, platform: str, original_url: str):
+        self._filter(platform).add(original_url)
+
+    def might_contain(self, platform: str, original_url: str) -> bool:
+        bloom = self.filters.get(platform)
+        return bloom is not None and original_url in bloom
+
+    def candidates(self, projects: List[ProjectCreate]) -> Set[str]:
+        """이미 저장되었을 수 있는 original_url (Bloom filter 양성)
+
+        음성인 프로젝트는 확실히 새 프로젝트이므로 writer가 기존 행(content_hash) 조회를 생략한다.
+        양성인 프로젝트도 저장은 생략하지 않는다 (content_hash로 내용 변경을 확인해야 함).
+        """
+        self.lookups += len(projects)
+        urls = {
+            project.original_url for project in projects
+            if self.might_contain(project.platform, project.original_url)
+        }
+        self.positives += len(urls)
+        return urls
+
+    def record(self, rows: Iterable[Dict[str, Any]], candidates: Set[str]):
+        """저장된 행을 추가하고, 양성이었지만 새로 추가된 행은 거짓 양성으로 집계"""
+        for row in rows:
+            if row["is_new"] and row["original_url"] in candidates:
+                self.false_positives += 1
+            self.add(row["platform"], row["original_url"])
+
+    async def warm(self):
+        """스냅샷을 불러온 뒤 그 이후에 저장된 프로젝트만 DB에서 추가"""
+        since = self.load_snapshot()
+        stmt = select(ProjectModel.platform, ProjectModel.original_url)
+        if since is not None:
+            stmt = stmt.where(ProjectModel.created_at >= since)
+        loaded = 0
+        async with async_session() as session:
+            result = await session.stream(stmt.execution_options(yield_per=10000))
+            async for platform, original_url in result:
+                self.add(platform, original_url)
+                loaded += 1
+        self.warmed_at = datetime.now(timezone.utc)
+        self.logger.info(f"Seen-set warmed: {loaded} urls from database (snapshot: {since})")
+
+    def load_snapshot(self) -> Optional[datetime]:
+        """스냅샷을 불러와 기준 시각을 반환. 손상되었거나 현재 설정과 크기가 다르면 None (DB에서 전부 다시 읽음)"""
+        if not os.path.exists(self.snapshot_path):
+            return None
+        expected = BloomFilter.dimensions(self.capacity, self.error_rate)
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                data = f.read()
+            if not data.startswith(self._SNAPSHOT_MAGIC):
+                raise ValueError("unknown snapshot format")
+            body, checksum = data[:-self._CHECKSUM_SIZE], data[-self._CHECKSUM_SIZE:]
+            if hashlib.blake2b(body, digest_size=self._CHECKSUM_SIZE).digest() != checksum:
+                raise ValueError("checksum mismatch")
+            offset = len(self._SNAPSHOT_MAGIC)
+            taken_at, filter_count = struct.unpack_from("<dI", body, offset)
+            offset += struct.calcsize("<dI")
+            filters = {}
+            for _ in range(filter_count):
+                name_len, blob_len = struct.unpack_from("<HQ", body, offset)
+                offset += struct.calcsize("<HQ")
+                name = body[offset:offset + name_len].decode()
+                offset += name_len
+                bloom = BloomFilter.from_bytes(body[offset:offset + blob_len])
+                offset += blob_len
+                if (bloom.size, bloom.hash_count) != expected:
+                    raise ValueError(
+                        f"filter {name} has m={bloom.size}, k={bloom.hash_count}, expected m={expected[0]}, k={expected[1]}"
+                    )
+                filters[name] = bloom
+            if offset != len(body):
+                raise ValueError("trailing data")
+        except (OSError, ValueError, struct.error) as e:
+            self.logger.error(f"Ignoring seen-set snapshot {self.snapshot_path}: {e}")
+            return None
+        self.filters = filters
+        return datetime.fromtimestamp(taken_at, timezone.utc)
+
+    def snapshot(self):
+        """같은 디렉터리의 임시 파일에 기록한 뒤 교체하여 원자적으로 저장"""
+        taken_at = self.warmed_at or datetime.now(timezone.utc)
+        parts = [self._SNAPSHOT_MAGIC, struct.pack("<dI", taken_at.timestamp(), len(self.filters))]
+        for name, bloom in self.filters.items():
+            blob = bloom.to_bytes()
+            encoded = name.encode()
+            parts.append(struct.pack("<HQ", len(encoded), len(blob)))
+            parts.append(encoded)
+            parts.append(blob)
+        body = b"".join(parts)
+
+        directory = os.path.dirname(self.snapshot_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # 프로세스마다 다른 임시 파일을 써서 동시에 저장해도 서로 덮어쓰지 않음
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.snapshot_path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+                f.write(hashlib.blake2b(body, digest_size=self._CHECKSUM_SIZE).digest())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    async def snapshot_loop(self):
+        while True:
+            await asyncio.sleep(settings.SEEN_SET_SNAPSHOT_INTERVAL)
+            try:
+                # 스냅샷 시각 이전에 추가된 항목은 모두 포함되어 있으므로 기준 시각을 갱신
+                self.warmed_at = datetime.now(timezone.utc)
+                await asyncio.to_thread(self.snapshot)
+                self.logger.info(f"Seen-set snapshot written: {self.stats()}")
+            except Exception as e:
+                self.logger.error(f"Failed to write seen-set snapshot: {e}")
+
+    def stats(self) -> dict:
+        # 실제로 새 프로젝트였던 조회 수 대비 거짓 양성 비율
+        negatives = self.lookups - (self.positives - self.false_positives)
+        return {
+            "platforms": {
+                platform: {
+                    "items": bloom.count,
+                    "memory_bytes": bloom.memory_bytes,
+                    "estimated_false_positive_rate": bloom.false_positive_rate,
+                }
+                for platform, bloom in self.filters.items()
+            },
+            "memory_bytes": sum(bloom.memory_bytes for bloom in self.filters.values()),
+            "lookups": self.lookups,
+            "positives": self.positives,
+            "false_positives": self.false_positives,
+            "observed_false_positive_rate": self.false_positives / negatives if negatives else 0.0,
+        }
+
+seen_set = SeenSet(
+    capacity=settings.SEEN_SET_CAPACITY,
+    error_rate=settings.SEEN_SET_ERROR_RATE,
+    snapshot_path=settings.SEEN_SET_SNAPSHOT_PATH,
+)
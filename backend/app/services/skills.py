@@ -0,0 +1,101 @@
+import json
+import os
+import re
+from typing import Dict, Iterable, List
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.skill import Skill
+from ..schemas.project import ProjectCreate
+
+_WHITESPACE = re.compile(r"\s+")
+ALIASES_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "skill_aliases.json")
+
+def normalize_skill(name: str) -> str:
+    """저장/검색에 쓰는 정규화된 스킬 이름 (공백 정리, 소문자)"""
+    return _WHITESPACE.sub(" ", name).strip().lower()
+
+def normalize_skills(names: Iterable[str]) -> List[str]:
+    """정규화 후 순서를 유지하며 중복 제거"""
+    seen = {}
+    for name in names or []:
+        if not isinstance(name, str):
+            continue
+        normalized = normalize_skill(name)
+        if normalized:
+            seen.setdefault(normalized, None)
+    return list(seen)
+
+class SkillMatcher:
+    """별칭 사전으로 만든 trie를 하나의 정규식으로 컴파일한 다중 패턴 매처
+
+    텍스트를 한 번만 훑으며, 같은 위치에서는 가장 긴 별칭을 우선한다.
+    영문/숫자 별칭은 단어 경계가 맞아야 하고, 한글 별칭 뒤에는 조사가 붙어도 된다.
+    """
+
+    def __init__(self, aliases: Dict[str, str]):
+        self.aliases = aliases  # 별칭(정규화) -> canonical
+        trie: dict = {}
+        for alias in aliases:
+            node = trie
+            for char in alias:
+                node = node.setdefault(char, {})
+            node[""] = True
+        self._pattern = re.compile(r"(?<![a-z0-9])(" + self._to_regex(trie) + r")(?![a-z0-9])")
+
+    def _to_regex(self, node: dict) -> str:
+        branches = [re.escape(char) + self._to_regex(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # 여기서 끝나는 별칭이 있으면 더 긴 매치를 먼저 시도한 뒤 생략 가능
+        return f"(?:{body})?" if "" in node else body
+
+    def find(self, text: str) -> List[str]:
+        """텍스트에 등장하는 canonical 스킬 (처음 등장 순서)"""
+        found = {}
+        for match in self._pattern.finditer(normalize_skill(text)):
+            found.setdefault(self.aliases[match.group(1)], None)
+        return list(found)
+
+def _load_aliases(path: str):
+    with open(path, encoding="utf-8") as f:
+        dictionary = json.load(f)
+    display_names = {}  # canonical -> 표기
+    aliases = {}  # 별칭 -> canonical
+    for display_name, names in dictionary.items():
+        canonical = normalize_skill(display_name)
+        display_names[canonical] = display_name
+        for name in names:
+            aliases[normalize_skill(name)] = canonical
+    return display_names, aliases
+
+DISPLAY_NAMES, ALIASES = _load_aliases(ALIASES_PATH)
+skill_matcher = SkillMatcher(ALIASES)
+
+def canonicalize_skill(name: str) -> str:
+    """별칭이면 canonical 이름으로, 사전에 없으면 정규화된 이름 그대로"""
+    normalized = normalize_skill(name)
+    return ALIASES.get(normalized, normalized)
+
+def canonicalize_skills(names: Iterable[str]) -> List[str]:
+    return normalize_skills(canonicalize_skill(name) for name in names or [] if isinstance(name, str))
+
+def extract_skills(title: str, description: str, tags: Iterable[str] = ()) -> List[str]:
+    """수집된 태그를 canonical로 바꾸고 제목/설명에서 찾은 스킬을 덧붙임"""
+    skills = canonicalize_skills(tags)
+    extracted = skill_matcher.find(f"{title or ''}\n{description or ''}")
+    return skills + [skill for skill in extracted if skill not in skills]
+
+def project_skills(project: ProjectCreate) -> List[str]:
+    return extract_skills(project.title, project.description, project.skills)
+
+async def register_skills(session: AsyncSession, skill_lists: Iterable[Iterable[str]]):
+    """배치에 등장한 스킬을 skills 사전 테이블에 추가 (이미 있으면 무시)"""
+    names = {skill for skills in skill_lists for skill in skills or []}
+    if not names:
+        return
+    stmt = insert(Skill).values([
+        {"name": name[:100], "display_name": DISPLAY_NAMES.get(name, name)[:100]}
+        for name in sorted(names)
+    ]).on_conflict_do_nothing(index_elements=[Skill.name])
+    await session.execute(stmt)
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+from sqlalchemy import func, select
+from ..config import settings
+from ..crawlers.registry import enabled_platforms
+from ..db.database import read_session
+from ..models.project import Project as ProjectModel
+from .project_writer import UpsertResult
+
+StatsKey = Tuple[str, str, str]  # (platform, work_type, payment_type)
+
+class StatsCache:
+    """/api/stats 집계 캐시
+
+    GROUP BY 한 번으로 (platform, work_type, payment_type)별 건수를 읽고,
+    이후에는 수집 경로에서 새로 추가된 행만큼 증가시킨다. 최근 24시간 건수는
+    시간이 지나면 줄어들어야 하므로 ttl 길이의 시각 구간이 바뀌면 DB에서 다시 읽는다.
+    구간 번호는 벽시계 기준이라 모든 워커에서 같으므로 ETag에 그대로 쓴다.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._counts: Optional[Dict[StatsKey, list]] = None
+        self.window: Optional[int] = None  # 현재 건수를 읽은 시각 구간 (ETag 계산용)
+        self._lock = asyncio.Lock()
+
+    def current_window(self) -> int:
+        return int(time.time() // self.ttl)
+
+    def _stale(self) -> bool:
+        return self._counts is None or self.window != self.current_window()
+
+    async def get(self) -> dict:
+        if self._stale():
+            async with self._lock:
+                if self._stale():
+                    await self._load()
+        return self._build()
+
+    async def _load(self):
+        window = self.current_window()
+        new_since = func.now() - timedelta(hours=24)
+        stmt = select(
+            ProjectModel.platform,
+            ProjectModel.work_type,
+            ProjectModel.payment_type,
+            func.count(),
+            func.count().filter(ProjectModel.created_at >= new_since),
+        ).group_by(ProjectModel.platform, ProjectModel.work_type, ProjectModel.payment_type)
+        async with read_session() as session:
+            result = await session.execute(stmt)
+            counts = {
+                (platform, work_type or "undefined", payment_type or "undefined"): [total, new_24h]
+                for platform, work_type, payment_type, total, new_24h in result
+            }
+        self._counts = counts
+        self.window = window
+
+    def invalidate(self):
+        self._counts = None
+
+    async def on_remote_change(self, payload: dict):
+        """change feed 핸들러: 다른 프로세스에서 행이 삭제되었으면 DB에서 다시 읽음"""
+        if payload.get("deleted"):
+            self.invalidate()
+
+    async def on_ingested(self, result: UpsertResult):
+        """ingest 리스너: 새로 추가된 행만큼 캐시된 건수를 증가"""
+        if self._counts is None:
+            return
+        for row in result.rows:
+            if not row["is_new"]:
+                continue
+            key = (row["platform"], row["work_type"], row["payment_type"])
+            counts = self._counts.setdefault(key, [0, 0])
+            counts[0] += 1
+            counts[1] += 1
+
+    def _build(self) -> dict:
+        # 아직 수집된 프로젝트가 없는 활성 플랫폼도 0건으로 표시
+        platforms = {
+            platform: {"total": 0, "new_24h": 0, "work_type": defaultdict(int), "payment_type": defaultdict(int)}
+            for platform in enabled_platforms()
+        }
+        work_types = defaultdict(int)
+        payment_types = defaultdict(int)
+        total = new_24h = 0
+        for (platform, work_type, payment_type), (count, new_count) in self._counts.items():
+            stats = platforms.setdefault(platform, {
+                "total": 0,
+                "new_24h": 0,
+                "work_type": defaultdict(int),
+                "payment_type": defaultdict(int),
+            })
+            stats["total"] += count
+            stats["new_24h"] += new_count
+            stats["work_type"][work_type] += count
+            stats["payment_type"][payment_type] += count
+            work_types[work_type] += count
+            payment_types[payment_type] += count
+            total += count
+            new_24h += new_count
+        return {
+            "total": total,
+            "new_24h": new_24h,
+            "platforms": platforms,
+            "work_type": work_types,
+            "payment_type": payment_types,
+        }
+
+stats_cache = StatsCache(ttl=settings.STATS_CACHE_TTL)
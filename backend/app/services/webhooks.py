@@ -0,0 +1,291 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+import aiohttp
+from sqlalchemy import bindparam, insert as sa_insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+from ..config import settings
+from ..core.logging import setup_logger
+from ..db.database import async_session
+from ..models.webhook import WebhookDelivery, WebhookEndpoint
+from .broadcast import EVENT_FIELDS
+from .project_writer import UpsertResult
+
+SIGNATURE_HEADER = "X-Webhook-Signature"
+
+def sign_payload(secret: str, timestamp: int, body: bytes) -> str:
+    """HMAC-SHA256 서명 헤더 값 (t=<unix time>,v1=<hex>). 수신 측은 같은 방식으로 검증한다"""
+    digest = hmac.new(secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={digest}"
+
+def verify_signature(secret: str, header: str, body: bytes, tolerance: int = 300) -> bool:
+    try:
+        parts = dict(part.split("=", 1) for part in header.split(","))
+        timestamp = int(parts["t"])
+    except (ValueError, KeyError):
+        return False
+    if abs(time.time() - timestamp) > tolerance:
+        return False
+    return hmac.compare_digest(sign_payload(secret, timestamp, body), header)
+
+def project_payload(row: Dict[str, Any]) -> Dict[str, Any]:
+    return json.loads(json.dumps({name: row.get(name) for name in EVENT_FIELDS}, default=str, ensure_ascii=False))
+
+async def enqueue_deliveries(
+    session: AsyncSession,
+    rows: Iterable[Dict[str, Any]],
+    notifications: Iterable[Dict[str, int]],
+) -> int:
+    """새로 저장된 프로젝트의 웹훅 전송 건을 outbox에 기록 (호출자의 트랜잭션 안에서 실행)
+
+    구독이 지정된 엔드포인트는 그 구독에 매칭된 프로젝트만, 나머지는 모든 신규 프로젝트를 받는다.
+    """
+    new_rows = {row["id"]: row for row in rows if row["is_new"]}
+    if not new_rows:
+        return 0
+    endpoints = (await session.execute(
+        select(WebhookEndpoint.id, WebhookEndpoint.subscription_id).where(WebhookEndpoint.active.is_(True))
+    )).all()
+    if not endpoints:
+        return 0
+
+    matched = defaultdict(list)
+    for notification in notifications:
+        matched[notification["subscription_id"]].append(notification["project_id"])
+
+    payloads: Dict[int, Dict[str, Any]] = {}
+    deliveries = []
+    for endpoint_id, subscription_id in endpoints:
+        project_ids = list(new_rows) if subscription_id is None else matched.get(subscription_id, [])
+        for project_id in project_ids:
+            if project_id not in payloads:
+                payloads[project_id] = project_payload(new_rows[project_id])
+            deliveries.append({"endpoint_id": endpoint_id, "project_id": project_id, "payload": payloads[project_id]})
+
+    if deliveries:
+        await session.execute(sa_insert(WebhookDelivery), deliveries)
+    return len(deliveries)
+
+class WebhookDispatcher:
+    """outbox의 전송 건을 엔드포인트별로 묶어 POST 하는 백그라운드 전송기
+
+    수집 경로는 outbox에 기록만 하므로 느린 수신자가 수집을 막지 않는다.
+    전송 건은 lease(next_attempt_at 연장)로 가져오므로 프로세스가 죽으면 lease가 끝난 뒤 다시 전송된다 (at-least-once).
+    엔드포인트별 동시 요청 수(_in_flight)는 프로세스 메모리에 있으므로 리더 작업(run)으로 한 프로세스에서만 실행한다.
+    """
+
+    def __init__(self, batch_size: int, max_concurrency: int, max_attempts: int, timeout: float,
+                 poll_interval: float, backoff_base: float, backoff_max: float):
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # 전송 중인 요청이 끝나기 전에 다시 가져가지 않도록 timeout보다 넉넉하게
+        self.lease = timedelta(seconds=timeout * 3)
+
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._in_flight: Dict[int, int] = defaultdict(int)
+        self._requests: Set[asyncio.Task] = set()
+
+        self.delivered = 0
+        self.failed = 0
+        self.dead = 0
+        self.logger = setup_logger(self.__class__.__name__)
+
+    async def start(self):
+        # 모든 엔드포인트가 공유하는 커넥션 풀 (엔드포인트별 동시 요청 수는 _in_flight로 제한)
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self._task = asyncio.create_task(self._run())
+
+    async def run(self):
+        """리더 작업으로 실행 (리더에서 물러나 취소되면 전송기도 멈춤)"""
+        await self.start()
+        try:
+            await self._task
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        """전송 중인 요청은 취소한다 (lease가 끝나면 다시 전송됨)"""
+        tasks = [task for task in [self._task, *self._requests] if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        if self._http:
+            await self._http.close()
+            self._http = None
+
+    async def on_ingested(self, result: UpsertResult):
+        """ingest 리스너: 새 전송 건이 생겼을 수 있으므로 폴링 대기를 깨움"""
+        if result.inserted:
+            self.wake()
+
+    def wake(self):
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                await self._poll()
+            except Exception as e:
+                self.logger.error(f"Webhook poll failed: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _poll(self):
+        due = (
+            select(WebhookDelivery.endpoint_id)
+            .where(WebhookDelivery.status == "pending", WebhookDelivery.next_attempt_at <= func.now())
+            .distinct()
+        )
+        async with async_session() as session:
+            endpoints = (await session.execute(
+                select(WebhookEndpoint).where(WebhookEndpoint.active.is_(True), WebhookEndpoint.id.in_(due))
+            )).scalars().all()
+
+            claimed = []
+            for endpoint in endpoints:
+                free = self.max_concurrency - self._in_flight[endpoint.id]
+                if free <= 0:
+                    continue
+                rows = await self._claim(session, endpoint.id, free * self.batch_size)
+                claimed.append((endpoint, rows))
+            await session.commit()
+
+        for endpoint, rows in claimed:
+            for start in range(0, len(rows), self.batch_size):
+                self._in_flight[endpoint.id] += 1
+                batch = rows[start:start + self.batch_size]
+                task = asyncio.create_task(self._deliver(endpoint.id, endpoint.url, endpoint.secret, batch))
+                self._requests.add(task)
+                task.add_done_callback(self._requests.discard)
+
+    async def _claim(self, session: AsyncSession, endpoint_id: int, limit: int):
+        due = (
+            select(WebhookDelivery.id)
+            .where(
+                WebhookDelivery.endpoint_id == endpoint_id,
+                WebhookDelivery.status == "pending",
+                WebhookDelivery.next_attempt_at <= func.now(),
+            )
+            .order_by(WebhookDelivery.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.execute(
+            update(WebhookDelivery)
+            .where(WebhookDelivery.id.in_(due.scalar_subquery()))
+            .values(next_attempt_at=func.now() + self.lease)
+            .returning(WebhookDelivery.id, WebhookDelivery.payload, WebhookDelivery.attempts)
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(result.all())
+
+    async def _deliver(self, endpoint_id: int, url: str, secret: str, rows):
+        try:
+            body = json.dumps(
+                {"deliveries": [{"id": delivery_id, "project": payload} for delivery_id, payload, _ in rows]},
+                ensure_ascii=False,
+            ).encode()
+            timestamp = int(time.time())
+            headers = {"Content-Type": "application/json", SIGNATURE_HEADER: sign_payload(secret, timestamp, body)}
+            try:
+                async with self._http.post(url, data=body, headers=headers) as response:
+                    if response.status >= 300:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info, response.history, status=response.status, message=response.reason or "",
+                        )
+            except Exception as e:
+                await self._mark_failed(rows, f"{type(e).__name__}: {e}"[:1000])
+            else:
+                await self._mark_delivered([delivery_id for delivery_id, _, _ in rows])
+        except Exception as e:
+            # 상태 기록 실패 시 lease가 끝나면 다시 전송됨
+            self.logger.error(f"Failed to record webhook result for endpoint {endpoint_id}: {str(e)}")
+        finally:
+            self._in_flight[endpoint_id] -= 1
+            self._wakeup.set()
+
+    async def _mark_delivered(self, delivery_ids: List[int]):
+        async with async_session() as session:
+            await session.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.id.in_(delivery_ids))
+                .values(status="delivered", delivered_at=func.now(), attempts=WebhookDelivery.attempts + 1, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        self.delivered += len(delivery_ids)
+
+    def _backoff(self, attempts: int) -> timedelta:
+        delay = min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+        return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+    async def _mark_failed(self, rows, error: str):
+        now = datetime.now(timezone.utc)
+        updates = []
+        for delivery_id, _, attempts in rows:
+            attempts += 1
+            dead = attempts >= self.max_attempts
+            updates.append({
+                "pk": delivery_id,
+                "status": "dead" if dead else "pending",
+                "attempts": attempts,
+                "next_attempt_at": now if dead else now + self._backoff(attempts),
+                "last_error": error,
+            })
+            self.dead += dead
+        async with async_session() as session:
+            await session.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.id == bindparam("pk"))
+                .values(
+                    status=bindparam("status"),
+                    attempts=bindparam("attempts"),
+                    next_attempt_at=bindparam("next_attempt_at"),
+                    last_error=bindparam("last_error"),
+                ),
+                updates,
+                execution_options={"synchronize_session": False},
+            )
+            await session.commit()
+        self.failed += len(rows)
+        self.logger.error(f"Webhook delivery of {len(rows)} projects failed: {error}")
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "in_flight_requests": len(self._requests),
+            "delivered": self.delivered,
+            "failed_attempts": self.failed,
+            "dead": self.dead,
+        }
+
+webhook_dispatcher = WebhookDispatcher(
+    batch_size=settings.WEBHOOK_BATCH_SIZE,
+    max_concurrency=settings.WEBHOOK_MAX_CONCURRENCY,
+    max_attempts=settings.WEBHOOK_MAX_ATTEMPTS,
+    timeout=settings.WEBHOOK_TIMEOUT,
+    poll_interval=settings.WEBHOOK_POLL_INTERVAL,
+    backoff_base=settings.WEBHOOK_BACKOFF_BASE,
+    backoff_max=settings.WEBHOOK_BACKOFF_MAX,
+)
@@ -0,0 +1,85 @@
+import hashlib
+import string
+from functools import lru_cache
+from typing import Optional
+from ..config import settings
+
+ALPHABET = string.digits + string.ascii_letters  # base62
+WIDTH = 11  # 62^11 > 2^64
+ID_BITS = 40  # 복호화 결과의 상위 24비트가 0이 아니면 위조/오타로 판단
+ROUNDS = 4
+_MASK32 = 0xFFFFFFFF
+_INDEX = {char: value for value, char in enumerate(ALPHABET)}
+
+class PublicIdCodec:
+    """정수 id <-> 고정 길이 base62 문자열의 키 기반 가역 변환
+
+    64비트 블록에 4라운드 Feistel 네트워크(라운드 함수: keyed blake2b)를 적용한다.
+    같은 키를 쓰는 모든 워커/재시작에서 결과가 같고, DB 조회 없이 O(1)로 복원된다.
+    암호학적 기밀성이 목적이 아니라 순차 id를 드러내지 않는 것이 목적이다.
+    """
+
+    def __init__(self, key: bytes):
+        key = hashlib.blake2b(key, digest_size=32).digest()
+        # 라운드별 키 상태를 미리 만들어 두고 copy()로 재사용 (매번 키를 설정하는 것보다 빠름)
+        self._hashers = [hashlib.blake2b(bytes([index]), key=key, digest_size=4) for index in range(ROUNDS)]
+
+    def _round(self, index: int, half: int) -> int:
+        hasher = self._hashers[index].copy()
+        hasher.update(half.to_bytes(4, "little"))
+        return int.from_bytes(hasher.digest(), "little")
+
+    def encode(self, project_id: int) -> str:
+        if not 0 <= project_id < 1 << ID_BITS:
+            raise ValueError(f"Project id out of range: {project_id}")
+        left, right = project_id >> 32, project_id & _MASK32
+        for index in range(ROUNDS):
+            left, right = right, left ^ self._round(index, right)
+        value = (left << 32) | right
+
+        chars = []
+        for _ in range(WIDTH):
+            value, remainder = divmod(value, 62)
+            chars.append(ALPHABET[remainder])
+        return "".join(reversed(chars))
+
+    def decode(self, public_id: str) -> Optional[int]:
+        """유효하지 않은 문자열이면 None"""
+        if len(public_id) != WIDTH:
+            return None
+        value = 0
+        for char in public_id:
+            digit = _INDEX.get(char)
+            if digit is None:
+                return None
+            value = value * 62 + digit
+        if value >> 64:
+            return None
+
+        left, right = value >> 32, value & _MASK32
+        for index in reversed(range(ROUNDS)):
+            left, right = right ^ self._round(index, left), left
+        project_id = (left << 32) | right
+        return project_id if project_id < 1 << ID_BITS else None
+
+MIN_KEY_LENGTH = 16
+
+def _key() -> bytes:
+    # DB 비밀번호 등 다른 설정에서 유도하지 않음 (자격 증명을 바꾸면 공개 URL이 모두 깨지므로)
+    key = settings.PUBLIC_ID_KEY.encode()
+    if len(key) < MIN_KEY_LENGTH:
+        raise ValueError(
+            f"PUBLIC_ID_KEY must be at least {MIN_KEY_LENGTH} bytes "
+            "(e.g. python -c \"import secrets; print(secrets.token_urlsafe(32))\")"
+        )
+    return key
+
+codec = PublicIdCodec(_key())
+
+@lru_cache(maxsize=settings.PUBLIC_ID_CACHE_SIZE)
+def encode_id(project_id: int) -> str:
+    return codec.encode(project_id)
+
+@lru_cache(maxsize=settings.PUBLIC_ID_CACHE_SIZE)
+def decode_id(public_id: str) -> Optional[int]:
+    return codec.decode(public_id)
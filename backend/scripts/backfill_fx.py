@@ -0,0 +1,40 @@
+"""저장된 프로젝트의 USD 환산 예산 컬럼을 현재 환율로 채움
+
+사용법: cd backend && python -m scripts.backfill_fx
+"""
+import asyncio
+from sqlalchemy import case, update
+from app.db.database import async_session
+from app.models.project import Project as ProjectModel
+from app.services.fx import HOURS_PER_MONTH, fx_rates
+
+async def backfill():
+    try:
+        await fx_rates.refresh()
+    except Exception as e:
+        print(f"Using cached/default FX rates: {e}")
+
+    async with async_session() as session:
+        for currency, rate in fx_rates.rates.items():
+            min_usd = ProjectModel.budget_min / rate
+            max_usd = ProjectModel.budget_max / rate
+            upper = case((ProjectModel.budget_max > 0, max_usd), else_=min_usd)
+            result = await session.execute(
+                update(ProjectModel)
+                .where(ProjectModel.currency == currency)
+                .values(
+                    budget_min_usd=case((ProjectModel.budget_min > 0, min_usd)),
+                    budget_max_usd=case((ProjectModel.budget_max > 0, max_usd)),
+                    budget_hourly_usd=case(
+                        (ProjectModel.payment_type == "hourly", upper),
+                        (ProjectModel.payment_type == "monthly", upper / HOURS_PER_MONTH),
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                print(f"{currency}: {result.rowcount} rows")
+        await session.commit()
+
+if __name__ == "__main__":
+    asyncio.run(backfill())
@@ -0,0 +1,49 @@
+"""저장된 프로젝트의 project_metadata에서 승격 컬럼(applicants, client_rating 등)을 채움
+
+수집 경로와 같은 규칙(services.metadata_fields)으로 모든 행의 승격 컬럼을 다시 계산해 덮어쓰므로,
+추출 규칙이 바뀐 뒤(범위 값 해석, 플랫폼 고정값 제외 등) 다시 실행하면 기존 값도 바로잡힌다.
+
+사용법: cd backend && python -m scripts.backfill_metadata
+"""
+import asyncio
+from sqlalchemy import bindparam, select, update
+from app.db.database import async_session
+from app.models.project import Project as ProjectModel
+from app.services.metadata_fields import PROMOTED_FIELDS, extract_metadata_fields
+
+BATCH_SIZE = 5000
+
+async def backfill():
+    last_id = 0
+    total = 0
+    stmt = (
+        update(ProjectModel)
+        .where(ProjectModel.id == bindparam("pk"))
+        .values({name: bindparam(name) for name in PROMOTED_FIELDS})
+    )
+    while True:
+        async with async_session() as session:
+            result = await session.execute(
+                select(ProjectModel.id, ProjectModel.platform, ProjectModel.project_metadata)
+                .where(ProjectModel.id > last_id)
+                .order_by(ProjectModel.id)
+                .limit(BATCH_SIZE)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            await session.execute(
+                stmt,
+                [
+                    dict(extract_metadata_fields(platform, metadata), pk=project_id)
+                    for project_id, platform, metadata in rows
+                ],
+                execution_options={"synchronize_session": False},
+            )
+            await session.commit()
+        last_id = rows[-1][0]
+        total += len(rows)
+        print(f"{total} rows updated")
+
+if __name__ == "__main__":
+    asyncio.run(backfill())
@@ -0,0 +1,86 @@
+"""저장된 프로젝트로 project_rollups를 월 단위로 다시 만듦 (월별로 병렬 처리)
+
+각 월은 한 트랜잭션에서 그 달의 projects 파티션에 SHARE 잠금을 건 뒤 읽고, 롤업을 지우고 다시 쓴다.
+SHARE 잠금끼리는 충돌하지 않으므로 여러 달을 동시에 처리할 수 있고, 그동안 그 달의 수집만 잠시 대기한다.
+
+사용법: cd backend && python -m scripts.backfill_rollups [--start 2024-01] [--end 2024-12] [--workers 4]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from sqlalchemy import delete, func, select, text
+from app.config import settings
+from app.db.database import async_session, engine
+from app.models.project import Project as ProjectModel
+from app.models.rollup import ProjectRollup
+from app.services.partitions import add_months, month_start, partition_manager, partition_name
+from app.services.rollups import accumulate, upsert_rollups
+
+COLUMNS = [
+    ProjectModel.posted_date, ProjectModel.platform, ProjectModel.work_type, ProjectModel.payment_type,
+    ProjectModel.skills, ProjectModel.budget_min_usd, ProjectModel.budget_max_usd, ProjectModel.budget_hourly_usd,
+]
+
+async def rebuild_month(month, semaphore: asyncio.Semaphore) -> int:
+    next_month = add_months(month, 1)
+    async with semaphore:
+        async with async_session() as session:
+            if not partition_manager.enabled:
+                await session.execute(text(f"LOCK TABLE {ProjectModel.__tablename__} IN SHARE MODE"))
+            elif month in partition_manager.months:
+                await session.execute(text(f"LOCK TABLE {partition_name(month)} IN SHARE MODE"))
+
+            stmt = (
+                select(*COLUMNS)
+                .where(ProjectModel.posted_date >= month, ProjectModel.posted_date < next_month)
+                .execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+            )
+            rollups = {}
+            total = 0
+            result = await session.stream(stmt)
+            async for chunk in result.partitions():
+                accumulate((row._mapping for row in chunk), rollups)
+                total += len(chunk)
+
+            await session.execute(
+                delete(ProjectRollup).where(ProjectRollup.bucket >= month, ProjectRollup.bucket < next_month)
+            )
+            await upsert_rollups(session, rollups)
+            await session.commit()
+    print(f"{month:%Y-%m}: {total} projects, {len(rollups)} rollup rows")
+    return total
+
+def parse_month(value: str):
+    return month_start(datetime.strptime(value, "%Y-%m"))
+
+async def backfill(start, end, workers: int):
+    await partition_manager.start()
+    if start is None or end is None:
+        async with async_session() as session:
+            first, last = (await session.execute(
+                select(func.min(ProjectModel.posted_date), func.max(ProjectModel.posted_date))
+            )).one()
+        if first is None:
+            print("No projects")
+            return
+        start = start or month_start(first)
+        end = end or month_start(last)
+
+    months = []
+    month = start
+    while month <= end:
+        months.append(month)
+        month = add_months(month, 1)
+
+    semaphore = asyncio.Semaphore(workers)
+    totals = await asyncio.gather(*(rebuild_month(month, semaphore) for month in months))
+    print(f"Rebuilt {len(months)} months from {sum(totals)} projects")
+    await engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--start", type=parse_month, help="첫 달 (YYYY-MM)")
+    parser.add_argument("--end", type=parse_month, help="마지막 달 (YYYY-MM)")
+    parser.add_argument("--workers", type=int, default=settings.ROLLUP_BACKFILL_WORKERS)
+    args = parser.parse_args()
+    asyncio.run(backfill(args.start, args.end, args.workers))
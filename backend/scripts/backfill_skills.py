@@ -0,0 +1,55 @@
+"""저장된 프로젝트의 skills를 현재 별칭 사전/추출 규칙으로 다시 계산
+
+사용법: cd backend && python -m scripts.backfill_skills [batch_size]
+"""
+import asyncio
+import sys
+import time
+from sqlalchemy import bindparam, select, update
+from app.db.database import async_session
+from app.models.project import Project as ProjectModel
+from app.services.project_writer import HASHED_COLUMNS, compute_content_hash
+from app.services.skills import extract_skills, register_skills
+
+async def backfill(batch_size: int):
+    columns = [getattr(ProjectModel, name) for name in HASHED_COLUMNS]
+    last_id = 0
+    scanned = changed = 0
+    started = time.perf_counter()
+    while True:
+        async with async_session() as session:
+            result = await session.execute(
+                select(ProjectModel.id, *columns)
+                .where(ProjectModel.id > last_id)
+                .order_by(ProjectModel.id)
+                .limit(batch_size)
+            )
+            rows = [dict(row._mapping) for row in result]
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            scanned += len(rows)
+
+            updates = []
+            for row in rows:
+                skills = extract_skills(row["title"], row["description"], row["skills"])
+                if skills != (row["skills"] or []):
+                    row["skills"] = skills
+                    updates.append({"pk": row["id"], "skills": skills, "content_hash": compute_content_hash(row)})
+            if updates:
+                await session.execute(
+                    update(ProjectModel)
+                    .where(ProjectModel.id == bindparam("pk"))
+                    .values(skills=bindparam("skills"), content_hash=bindparam("content_hash")),
+                    updates,
+                    execution_options={"synchronize_session": False},
+                )
+                await register_skills(session, [update_row["skills"] for update_row in updates])
+                await session.commit()
+                changed += len(updates)
+
+        elapsed = time.perf_counter() - started
+        print(f"scanned={scanned} changed={changed} ({scanned / elapsed:,.0f} rows/s)")
+
+if __name__ == "__main__":
+    asyncio.run(backfill(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
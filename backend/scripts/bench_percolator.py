@@ -0,0 +1,83 @@
+"""Percolator 매칭 속도 측정 (DB 불필요, 인메모리 인덱스만 사용)
+
+사용법: cd backend && python -m scripts.bench_percolator 10000 250
+
+기본값은 구독 10,000개와 크롤러 5개의 1회 수집량(플랫폼당 약 50건)이며,
+모든 구독을 순회하는 방식과 결과가 같은지도 함께 확인한다.
+"""
+import random
+import sys
+import time
+from app.services.percolator import CompiledSubscription, Percolator
+from app.services.skills import DISPLAY_NAMES
+
+PLATFORMS = ["upwork", "wishket", "guru", "freelancer", "freemoa"]
+WORK_TYPES = ["remote", "onsite", "hybrid"]
+PAYMENT_TYPES = ["fixed", "hourly"]
+SKILLS = sorted(DISPLAY_NAMES)
+
+def make_subscriptions(count: int, rng: random.Random):
+    subscriptions = []
+    for i in range(count):
+        subscriptions.append(CompiledSubscription(
+            id=i + 1,
+            skills=frozenset(rng.sample(SKILLS, rng.choice([0, 1, 1, 2, 2, 3]))),
+            platforms=frozenset(rng.sample(PLATFORMS, rng.choice([0, 0, 1, 2]))),
+            work_types=frozenset(rng.sample(WORK_TYPES, rng.choice([0, 0, 1]))),
+            payment_types=frozenset(rng.sample(PAYMENT_TYPES, rng.choice([0, 0, 1]))),
+            min_budget_usd=rng.choice([None, None, 500, 1000, 5000]),
+            min_hourly_usd=rng.choice([None, None, 25, 50, 100]),
+        ))
+    return subscriptions
+
+def make_projects(count: int, rng: random.Random):
+    return [
+        {
+            "id": i + 1,
+            "is_new": True,
+            "platform": PLATFORMS[i % len(PLATFORMS)],
+            "work_type": rng.choice(WORK_TYPES),
+            "payment_type": rng.choice(PAYMENT_TYPES),
+            "skills": rng.sample(SKILLS, rng.randint(1, 6)),
+            "budget_max_usd": rng.choice([None, 300, 1500, 8000]),
+            "budget_hourly_usd": rng.choice([None, 20, 45, 80, 150]),
+        }
+        for i in range(count)
+    ]
+
+def main(subscription_count: int, project_count: int):
+    rng = random.Random(42)
+    subscriptions = make_subscriptions(subscription_count, rng)
+    projects = make_projects(project_count, rng)
+
+    started = time.perf_counter()
+    percolator = Percolator()
+    for subscription in subscriptions:
+        percolator.add(subscription)
+    print(f"build      {subscription_count} subscriptions in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    started = time.perf_counter()
+    indexed = [sorted(percolator.match(project)) for project in projects]
+    elapsed = time.perf_counter() - started
+    print(
+        f"indexed    {project_count} projects in {elapsed * 1000:.1f}ms "
+        f"({elapsed / project_count * 1e6:.0f}us/project, "
+        f"{percolator.candidates_checked / project_count:.0f} candidates/project)"
+    )
+
+    started = time.perf_counter()
+    scanned = [
+        sorted(sub.id for sub in subscriptions if sub.matches(project, frozenset(project["skills"])))
+        for project in projects
+    ]
+    elapsed = time.perf_counter() - started
+    print(f"full scan  {project_count} projects in {elapsed * 1000:.1f}ms ({elapsed / project_count * 1e6:.0f}us/project)")
+
+    assert indexed == scanned, "indexed matches differ from full scan"
+    print(f"matches    {sum(map(len, indexed))} notifications, identical to full scan")
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 250,
+    )
@@ -0,0 +1,44 @@
+"""공개 id 인코딩/디코딩 비용 비교 (DB 불필요)
+
+사용법: cd backend && python -m scripts.bench_public_id
+
+Fernet(AES-CBC + HMAC + base64) 경로는 cryptography가 설치된 경우에만 측정한다.
+"""
+import time
+from app.utils.public_id import PublicIdCodec, decode_id, encode_id
+
+COUNT = 100000
+
+def measure(label: str, func, values):
+    started = time.perf_counter()
+    for value in values:
+        func(value)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {elapsed / len(values) * 1e6:>8.2f}us/op")
+
+def main():
+    ids = list(range(1, COUNT + 1))
+    codec = PublicIdCodec(b"benchmark")
+    public_ids = [codec.encode(project_id) for project_id in ids]
+    measure("feistel encode", codec.encode, ids)
+    measure("feistel decode", codec.decode, public_ids)
+
+    # 목록 API에서 반복되는 id는 LRU 캐시에서 바로 반환
+    cached = [encode_id(project_id) for project_id in ids[:1000]] * (COUNT // 1000)
+    for public_id in cached[:1000]:
+        decode_id(public_id)
+    measure("cached encode", encode_id, ids[:1000] * (COUNT // 1000))
+    measure("cached decode", decode_id, cached)
+
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        print("cryptography is not installed, skipping Fernet")
+        return
+    fernet = Fernet(Fernet.generate_key())
+    tokens = [fernet.encrypt(str(project_id).encode()) for project_id in ids]
+    measure("fernet encrypt", lambda project_id: fernet.encrypt(str(project_id).encode()), ids)
+    measure("fernet decrypt", lambda token: int(fernet.decrypt(token)), tokens)
+
+if __name__ == "__main__":
+    main()
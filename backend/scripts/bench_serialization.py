@@ -0,0 +1,80 @@
+"""목록 응답 직렬화 비교 (DB 불필요)
+
+사용법: cd backend && python -m scripts.bench_serialization
+
+기존 경로: ORM 객체 -> Project.model_validate -> ProjectPage 재검증 -> model_dump(mode="json") -> json.dumps
+새 경로:   Core 행(dict) -> orjson.dumps
+"""
+import json
+import time
+from datetime import datetime, timedelta
+import orjson
+from app.models.project import Project as ProjectModel
+from app.schemas.project import Project, ProjectPage
+from app.services.project_query import LIST_COLUMNS
+
+def make_row(i: int) -> dict:
+    return {
+        "id": i,
+        "platform": "upwork",
+        "title": f"React / Node.js developer for SaaS dashboard #{i}",
+        "description": "We need an experienced developer to build a dashboard. " * 20,
+        "budget_min": 1000.0,
+        "budget_max": 5000.0 + i,
+        "currency": "USD",
+        "budget_min_usd": 1000.0,
+        "budget_max_usd": 5000.0 + i,
+        "budget_hourly_usd": None,
+        "posted_date": datetime(2024, 1, 1) + timedelta(minutes=i),
+        "deadline": None,
+        "skills": ["react", "node.js", "typescript", "postgresql"],
+        "url": f"https://www.upwork.com/jobs/~{i}",
+        "status": "active",
+        "original_url": f"https://www.upwork.com/jobs/~{i}",
+        "work_type": "remote",
+        "payment_type": "fixed",
+        "cluster_id": i,
+        "applicants": i % 20,
+        "view_count": i % 300,
+        "experience_level": "Intermediate",
+        "client_rating": 4.9,
+        "is_private": None,
+        "term": "3 to 6 months",
+        "location": None,
+        "metadata": {"project_id": str(i), "applicants": "10 to 15", "client": {"rating": 4.9, "country": "US"}},
+    }
+
+def old_path(objects) -> bytes:
+    page = ProjectPage(items=[Project.model_validate(project) for project in objects], next_cursor=None)
+    # FastAPI는 response_model로 한 번 더 검증한 뒤 JSON 호환 값으로 바꿔 json.dumps 한다
+    content = ProjectPage.model_validate(page).model_dump(mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+def new_path(rows) -> bytes:
+    return orjson.dumps({"items": rows, "next_cursor": None})
+
+def measure(label: str, func, data, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<6} {len(data) / best:>12,.0f} rows/s ({best * 1000:.1f}ms)")
+    return best
+
+def main():
+    names = [column.key for column in LIST_COLUMNS]
+    for size in (1000, 10000):
+        rows = [make_row(i) for i in range(size)]
+        assert sorted(names) == sorted(rows[0])
+        objects = [
+            ProjectModel(**{("project_metadata" if name == "metadata" else name): value for name, value in row.items()})
+            for row in rows
+        ]
+        print(f"{size} rows")
+        old = measure("old", old_path, objects)
+        new = measure("new", new_path, rows)
+        print(f"  speedup {old / new:.1f}x")
+
+if __name__ == "__main__":
+    main()
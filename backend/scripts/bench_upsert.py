@@ -0,0 +1,60 @@
+"""upsert_projects 처리량 측정 (로컬 Postgres 필요)
+
+사용법: cd backend && python -m scripts.bench_upsert 20000
+"""
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime
+from sqlalchemy import delete
+from app.db.database import async_session
+from app.models.project import Project as ProjectModel
+from app.schemas.project import ProjectCreate, WorkType, PaymentType
+from app.services.project_writer import upsert_projects
+
+def make_projects(run_id: str, count: int, revision: int = 0):
+    return [
+        ProjectCreate(
+            platform="bench",
+            title=f"Benchmark project {i}",
+            description=f"React / Python 개발 프로젝트 {i} rev {revision}" + " lorem ipsum" * 40,
+            budget_min=100.0,
+            budget_max=200.0 + i % 50,
+            currency="USD",
+            posted_date=datetime.now(),
+            skills=["React", "Python"],
+            url=f"https://bench.invalid/{run_id}/{i}",
+            status="active",
+            original_url=f"https://bench.invalid/{run_id}/{i}",
+            work_type=WorkType.REMOTE,
+            payment_type=PaymentType.FIXED,
+            metadata={"project_id": str(i), "applicants": i % 10},
+        )
+        for i in range(count)
+    ]
+
+async def run_pass(label: str, projects):
+    started = time.perf_counter()
+    async with async_session() as session:
+        result = await upsert_projects(session, projects)
+        await session.commit()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<10} {len(projects)} rows in {elapsed:.2f}s ({len(projects) / elapsed:,.0f} rows/s) "
+        f"inserted={result.inserted} updated={result.updated} unchanged={result.unchanged}"
+    )
+
+async def main(count: int):
+    run_id = uuid.uuid4().hex
+    try:
+        await run_pass("insert", make_projects(run_id, count))
+        await run_pass("unchanged", make_projects(run_id, count))
+        await run_pass("update", make_projects(run_id, count, revision=1))
+    finally:
+        async with async_session() as session:
+            await session.execute(delete(ProjectModel).where(ProjectModel.platform == "bench"))
+            await session.commit()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,72 @@
+"""API 프로세스 cold start 시간 예산 확인 (app.main import)
+
+새 인터프리터에서 app.main을 import 하는 시간을 재고, 브라우저 크롤러 의존성이 함께
+import 되지 않았는지 확인한다. 예산을 넘거나 금지된 모듈이 있으면 종료 코드 1.
+
+사용법: cd backend && python -m scripts.check_import_time [--budget-ms 1500] [--repeat 5] [--top 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+# API 전용 프로세스에서 import 되면 안 되는 모듈 (크롤러를 실행할 때만 필요)
+FORBIDDEN = ["selenium", "playwright", "bs4", "undetected_chromedriver", "selenium_stealth"]
+
+PROBE = (
+    "import sys, app.main; "
+    f"print(','.join(name for name in {FORBIDDEN!r} if name in sys.modules))"
+)
+
+def run(*flags: str) -> subprocess.CompletedProcess:
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", PROBE],
+        cwd=backend, capture_output=True, text=True, check=True,
+    )
+
+def slowest_imports(stderr: str, top: int):
+    """-X importtime 출력에서 최상위 import의 누적 시간 (us)"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # 중첩된 import는 들여쓰기가 더 깊음 (" " + "  " * level + name)
+        if not name[1:].startswith(" "):
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:top]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append((time.perf_counter() - started) * 1000)
+    best = min(timings)
+    forbidden = [name for name in result.stdout.strip().split(",") if name]
+
+    profile = run("-X", "importtime")
+    print("Slowest top-level imports (cumulative):")
+    for cumulative, name in slowest_imports(profile.stderr, args.top):
+        print(f"  {cumulative / 1000:8.1f}ms  {name}")
+
+    print(f"Cold start (best of {args.repeat}): {best:.0f}ms, budget {args.budget_ms:.0f}ms")
+    failed = False
+    if forbidden:
+        print(f"FAIL: crawler dependencies imported by app.main: {', '.join(forbidden)}")
+        failed = True
+    if best > args.budget_ms:
+        print("FAIL: over budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
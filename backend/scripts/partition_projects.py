@@ -0,0 +1,64 @@
+"""기존 projects 테이블을 posted_date 월 단위 range 파티션 테이블로 옮김
+
+수집/API 프로세스를 멈춘 뒤 한 번 실행한다. 한 트랜잭션에서 처리하므로 실패하면 원래 상태로 돌아간다.
+
+사용법: cd backend && python -m scripts.partition_projects [--keep-legacy]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from sqlalchemy import text
+from app.config import settings
+from app.db.database import engine, init_db
+from app.models.project import Project as ProjectModel
+from app.services.partitions import add_months, create_partition_sql, month_start
+
+LEGACY = "projects_legacy"
+
+async def migrate(keep_legacy: bool):
+    # 기존 테이블에 최신 컬럼/인덱스를 먼저 반영
+    await init_db()
+
+    async with engine.begin() as conn:
+        relkind = (await conn.execute(text("SELECT relkind FROM pg_class WHERE relname = 'projects'"))).scalar()
+        if relkind == "p":
+            print("projects is already partitioned")
+            return
+
+        # 새 테이블과 이름이 겹치지 않도록 기존 테이블, 인덱스(제약 조건 포함), 시퀀스 이름 변경
+        await conn.execute(text(f"ALTER TABLE projects RENAME TO {LEGACY}"))
+        indexes = (await conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": LEGACY}
+        )).scalars().all()
+        for name in indexes:
+            await conn.execute(text(f'ALTER INDEX "{name}" RENAME TO "{name[:55]}_legacy"'))
+        await conn.execute(text(f"ALTER SEQUENCE IF EXISTS projects_id_seq RENAME TO {LEGACY}_id_seq"))
+
+        await conn.run_sync(lambda sync_conn: ProjectModel.__table__.create(sync_conn))
+
+        first, last = (await conn.execute(text(f"SELECT min(posted_date), max(posted_date) FROM {LEGACY}"))).one()
+        now = datetime.now()
+        month = month_start(min(first or now, now))
+        end = add_months(month_start(max(last or now, now)), settings.PARTITION_MONTHS_AHEAD)
+        while month <= end:
+            await conn.execute(text(create_partition_sql(month)))
+            month = add_months(month, 1)
+
+        # search_vector는 생성 컬럼이므로 복사하지 않음
+        columns = ", ".join(column.name for column in ProjectModel.__table__.columns if column.name != "search_vector")
+        result = await conn.execute(text(f"INSERT INTO projects ({columns}) SELECT {columns} FROM {LEGACY}"))
+        print(f"Copied {result.rowcount} rows")
+        await conn.execute(text("SELECT setval('projects_id_seq', (SELECT coalesce(max(id), 0) + 1 FROM projects), false)"))
+
+        if keep_legacy:
+            print(f"Kept the old table as {LEGACY}")
+        else:
+            await conn.execute(text(f"DROP TABLE {LEGACY}"))
+
+    await engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keep-legacy", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.keep_legacy))
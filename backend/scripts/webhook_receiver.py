@@ -0,0 +1,46 @@
+"""웹훅 전송 테스트용 로컬 수신 서버
+
+사용법: cd backend && python -m scripts.webhook_receiver --secret <secret> [--port 8088] [--delay 5] [--fail-rate 0.3]
+
+POST /api/webhooks 로 http://localhost:8088/hook 을 등록하고 응답의 secret을 넘긴다.
+--delay 로 느린 수신자, --fail-rate 로 실패(500 응답)를 흉내 내 재시도/dead 상태를 확인할 수 있다.
+"""
+import argparse
+import asyncio
+import json
+import random
+from aiohttp import web
+from app.services.webhooks import SIGNATURE_HEADER, verify_signature
+
+def make_app(secret: str, delay: float, fail_rate: float) -> web.Application:
+    seen = set()
+
+    async def receive(request: web.Request) -> web.Response:
+        body = await request.read()
+        if not verify_signature(secret, request.headers.get(SIGNATURE_HEADER, ""), body):
+            print("rejected: invalid signature")
+            return web.Response(status=401)
+        if delay:
+            await asyncio.sleep(delay)
+        if random.random() < fail_rate:
+            print("failing on purpose")
+            return web.Response(status=500)
+
+        deliveries = json.loads(body)["deliveries"]
+        duplicates = sum(delivery["id"] in seen for delivery in deliveries)
+        seen.update(delivery["id"] for delivery in deliveries)
+        print(f"received {len(deliveries)} projects (duplicates={duplicates}, total={len(seen)})")
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/hook", receive)
+    return app
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    web.run_app(make_app(args.secret, args.delay, args.fail_rate), port=args.port)
@@ -0,0 +1,9 @@
+import os
+
+# app.config는 필수 설정이 없으면 import 되지 않으므로 테스트용 값을 채움 (DB에는 연결하지 않음)
+os.environ.setdefault("POSTGRES_USER", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("POSTGRES_DB", "test")
+os.environ.setdefault("PUBLIC_ID_KEY", "test-public-id-key-0123456789")
@@ -0,0 +1,85 @@
+import asyncio
+import glob
+import json
+import os
+from datetime import datetime
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app.schemas.project import ProjectCreate
+from app.services.ingest_buffer import IngestBuffer, is_connection_error
+from app.services.project_writer import UpsertResult
+
+def make_project(index: int) -> ProjectCreate:
+    return ProjectCreate(
+        platform="wishket",
+        title=f"Project {index}",
+        currency="KRW",
+        posted_date=datetime(2024, 1, 1),
+        skills=["react"],
+        url=f"https://example.com/{index}",
+        status="active",
+        original_url=f"https://example.com/{index}",
+        metadata={"project_id": str(index)},
+    )
+
+@pytest.fixture
+def buffer(tmp_path):
+    return IngestBuffer(max_size=100, batch_size=10, flush_interval=1.0, spill_dir=str(tmp_path))
+
+def test_spill_and_replay(buffer, tmp_path):
+    batch = [make_project(i) for i in range(3)]
+    buffer._spill(batch)
+    assert len(glob.glob(os.path.join(tmp_path, "ingest-*.ndjson"))) == 1
+
+    asyncio.run(buffer.replay_spill())
+    replayed = [buffer.queue.get_nowait() for _ in range(buffer.queue.qsize())]
+    assert replayed == batch
+    assert os.listdir(tmp_path) == []
+
+def test_replay_skips_files_claimed_by_another_worker(buffer, tmp_path):
+    buffer._spill([make_project(1)])
+    path = glob.glob(os.path.join(tmp_path, "ingest-*.ndjson"))[0]
+    os.rename(path, f"{path}.replaying-other")
+
+    asyncio.run(buffer.replay_spill())
+    assert buffer.queue.empty()
+
+def test_connection_errors():
+    assert is_connection_error(OperationalError("SELECT 1", {}, Exception("connection refused")))
+    assert is_connection_error(ConnectionResetError())
+    assert is_connection_error(asyncio.TimeoutError())
+    assert not is_connection_error(IntegrityError("INSERT", {}, Exception("violates check constraint")))
+    assert not is_connection_error(ValueError())
+
+def test_bad_rows_are_quarantined(buffer, tmp_path):
+    batch = [make_project(i) for i in range(8)]
+    bad = {batch[2].original_url, batch[5].original_url}
+    writes = []
+
+    async def write(projects):
+        writes.append(len(projects))
+        if any(project.original_url in bad for project in projects):
+            raise IntegrityError("INSERT", {}, Exception("violates check constraint"))
+        return UpsertResult(inserted=len(projects))
+
+    buffer._write = write
+    result = asyncio.run(buffer._write_isolating(batch))
+
+    assert result.inserted == 6
+    assert buffer.rejected_rows == 2
+    [rejected_path] = glob.glob(os.path.join(tmp_path, "rejected-*.ndjson"))
+    with open(rejected_path, encoding="utf-8") as f:
+        rejected = [json.loads(line) for line in f]
+    assert {entry["project"]["original_url"] for entry in rejected} == bad
+    # 격리 파일은 다시 적재하지 않음
+    asyncio.run(buffer.replay_spill())
+    assert buffer.queue.empty()
+
+def test_connection_error_is_not_bisected(buffer):
+    async def write(projects):
+        raise OperationalError("INSERT", {}, Exception("connection refused"))
+
+    buffer._write = write
+    with pytest.raises(OperationalError):
+        asyncio.run(buffer._write_isolating([make_project(i) for i in range(4)]))
+    assert buffer.rejected_rows == 0
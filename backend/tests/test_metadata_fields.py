@@ -0,0 +1,36 @@
+import pytest
+from app.services.metadata_fields import _int, _rating, extract_metadata_fields
+
+@pytest.mark.parametrize("value, expected", [
+    (5, 5),
+    (4.7, 4),
+    ("12명", 12),
+    ("1,234", 1234),
+    ("10 to 15", 10),
+    ("Less than 5", 5),
+    ("50+", 50),
+    ("", None),
+    ("없음", None),
+    (True, None),
+    (None, None),
+])
+def test_int(value, expected):
+    assert _int(value) == expected
+
+@pytest.mark.parametrize("value, expected", [(4.8, 4.8), ("4.5", 4.5), (0, None), (-1, None), ("n/a", None), (None, None)])
+def test_rating(value, expected):
+    assert _rating(value) == expected
+
+def test_platform_placeholder_is_dropped():
+    assert extract_metadata_fields("upwork", {"applicants": 0})["applicants"] is None
+    assert extract_metadata_fields("wishket", {"applicants": 0})["applicants"] == 0
+
+def test_extract_metadata_fields():
+    fields = extract_metadata_fields("wishket", {
+        "applicants": "3명", "view_count": 120, "client_rating": 0, "is_private": "yes",
+        "term": " 3개월 ", "location": "",
+    })
+    assert fields == {
+        "applicants": 3, "view_count": 120, "experience_level": None, "client_rating": None,
+        "is_private": None, "term": "3개월", "location": None,
+    }
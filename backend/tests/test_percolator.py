@@ -0,0 +1,45 @@
+import random
+import pytest
+from app.services.percolator import CompiledSubscription, Percolator, budget_bucket
+from scripts.bench_percolator import make_projects, make_subscriptions
+
+def subscription(id, **conditions):
+    defaults = dict(
+        skills=frozenset(), platforms=frozenset(), work_types=frozenset(), payment_types=frozenset(),
+        min_budget_usd=None, min_hourly_usd=None,
+    )
+    return CompiledSubscription(id=id, **dict(defaults, **conditions))
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_full_scan(seed):
+    rng = random.Random(seed)
+    subscriptions = make_subscriptions(2000, rng)
+    projects = make_projects(200, rng)
+    percolator = Percolator()
+    for sub in subscriptions:
+        percolator.add(sub)
+
+    for project in projects:
+        skills = frozenset(project["skills"])
+        expected = sorted(sub.id for sub in subscriptions if sub.matches(project, skills))
+        assert sorted(percolator.match(project)) == expected
+
+def test_budget_anchor_matches_only_at_or_above_minimum():
+    percolator = Percolator()
+    percolator.add(subscription(1, min_budget_usd=1000))
+    assert percolator.match({"budget_max_usd": 999}) == []
+    assert percolator.match({"budget_max_usd": 1000}) == [1]
+    assert percolator.match({"budget_max_usd": None}) == []
+
+def test_remove_and_replace():
+    percolator = Percolator()
+    percolator.add(subscription(1, skills=frozenset({"react"})))
+    percolator.add(subscription(1, platforms=frozenset({"upwork"})))
+    assert percolator.match({"skills": ["react"], "platform": "guru"}) == []
+    assert percolator.match({"skills": [], "platform": "upwork"}) == [1]
+    percolator.remove(1)
+    assert percolator.match({"platform": "upwork"}) == []
+
+@pytest.mark.parametrize("value, expected", [(0, 0), (0.5, 0), (1, 0), (2, 1), (1023, 9), (1024, 10)])
+def test_budget_bucket(value, expected):
+    assert budget_bucket(value) == expected
@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+import pytest
+from app.services.project_query import SORTS, decode_cursor, encode_cursor, to_tsquery_text
+
+def test_newest_cursor_round_trip():
+    posted = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(posted, 42)) == (posted, 42)
+
+@pytest.mark.parametrize("sort, value", [("applicants", 3), ("client_rating", 4.5), ("view_count", 1200)])
+def test_numeric_cursor_round_trip(sort, value):
+    assert sort in SORTS
+    assert decode_cursor(encode_cursor(value, 7), sort) == (value, 7)
+
+@pytest.mark.parametrize("cursor, sort", [
+    ("not-base64!", "newest"),
+    (encode_cursor("yesterday", 1), "newest"),
+    (encode_cursor("3", 1), "applicants"),
+    (encode_cursor(True, 1), "view_count"),
+])
+def test_invalid_cursor(cursor, sort):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, sort)
+
+def test_tsquery_prefix_terms():
+    assert to_tsquery_text("React  개발") == "'react':* & '개발':*"
+
+def test_tsquery_escapes_quotes_and_backslashes():
+    assert to_tsquery_text("o'reilly a\\b") == "'o''reilly':* & 'a\\\\b':*"
+
+def test_tsquery_operators_are_quoted():
+    assert to_tsquery_text("c++ | !rust") == "'c++':* & '|':* & '!rust':*"
+
+def test_tsquery_empty():
+    with pytest.raises(ValueError):
+        to_tsquery_text("   ")
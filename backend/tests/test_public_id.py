@@ -0,0 +1,33 @@
+import pytest
+from app.utils.public_id import ID_BITS, WIDTH, PublicIdCodec
+
+codec = PublicIdCodec(b"test-public-id-key-0123456789")
+
+@pytest.mark.parametrize("project_id", [0, 1, 2, 1000, 2 ** 31, (1 << ID_BITS) - 1])
+def test_round_trip(project_id):
+    public_id = codec.encode(project_id)
+    assert len(public_id) == WIDTH
+    assert codec.decode(public_id) == project_id
+
+def test_ids_do_not_reveal_order():
+    encoded = [codec.encode(i) for i in range(1, 101)]
+    assert len(set(encoded)) == len(encoded)
+    assert encoded != sorted(encoded)
+
+def test_key_changes_encoding():
+    assert PublicIdCodec(b"another-key-0123456789").encode(1) != codec.encode(1)
+
+@pytest.mark.parametrize("project_id", [-1, 1 << ID_BITS])
+def test_out_of_range(project_id):
+    with pytest.raises(ValueError):
+        codec.encode(project_id)
+
+@pytest.mark.parametrize("public_id", ["", "short", "0" * (WIDTH + 1), "!" * WIDTH, "z" * WIDTH])
+def test_invalid_public_id(public_id):
+    assert codec.decode(public_id) is None
+
+def test_tampered_id_is_rejected():
+    # 한 글자를 바꾸면 상위 비트가 채워져 대부분 거부됨
+    public_id = codec.encode(12345)
+    tampered = [public_id[:-1] + char for char in "0123456789abcdef" if char != public_id[-1]]
+    assert sum(codec.decode(value) is None for value in tampered) >= len(tampered) - 1
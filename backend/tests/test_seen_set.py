@@ -0,0 +1,47 @@
+import pytest
+from app.services.seen_set import BloomFilter, SeenSet
+
+@pytest.fixture
+def seen_set(tmp_path):
+    return SeenSet(capacity=1000, error_rate=0.01, snapshot_path=str(tmp_path / "seen_set.bin"))
+
+def test_bloom_round_trip():
+    bloom = BloomFilter(1000, 0.01)
+    bloom.add("https://example.com/1")
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+    assert "https://example.com/1" in restored
+    assert "https://example.com/2" not in restored
+    assert restored.count == 1
+
+def test_bloom_rejects_truncated_data():
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(BloomFilter(1000, 0.01).to_bytes()[:-1])
+
+def test_snapshot_round_trip(seen_set, tmp_path):
+    seen_set.add("wishket", "https://example.com/1")
+    seen_set.snapshot()
+    assert [path.name for path in tmp_path.iterdir()] == ["seen_set.bin"]
+
+    restored = SeenSet(capacity=1000, error_rate=0.01, snapshot_path=seen_set.snapshot_path)
+    assert restored.load_snapshot() is not None
+    assert restored.might_contain("wishket", "https://example.com/1")
+    assert not restored.might_contain("guru", "https://example.com/1")
+
+def test_corrupt_snapshot_is_ignored(seen_set):
+    seen_set.add("wishket", "https://example.com/1")
+    seen_set.snapshot()
+    with open(seen_set.snapshot_path, "r+b") as f:
+        f.seek(40)
+        byte = f.read(1)
+        f.seek(40)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    restored = SeenSet(capacity=1000, error_rate=0.01, snapshot_path=seen_set.snapshot_path)
+    assert restored.load_snapshot() is None
+    assert restored.filters == {}
+
+def test_snapshot_with_other_dimensions_is_ignored(seen_set):
+    seen_set.add("wishket", "https://example.com/1")
+    seen_set.snapshot()
+    restored = SeenSet(capacity=5000, error_rate=0.01, snapshot_path=seen_set.snapshot_path)
+    assert restored.load_snapshot() is None
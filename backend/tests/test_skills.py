@@ -0,0 +1,27 @@
+from app.services.skills import (
+    SkillMatcher, canonicalize_skill, canonicalize_skills, extract_skills, normalize_skill,
+)
+
+def test_normalize_skill():
+    assert normalize_skill("  React\tNative ") == "react native"
+
+def test_canonicalize_aliases():
+    assert canonicalize_skill("ReactJS") == "react"
+    assert canonicalize_skill("리액트") == "react"
+    assert canonicalize_skill("next js") == "next.js"
+
+def test_unknown_skill_is_normalized():
+    assert canonicalize_skill("  Some  Tool ") == "some tool"
+
+def test_canonicalize_skills_dedupes_in_order():
+    assert canonicalize_skills(["React.js", "vue", "reactjs", None, " "]) == ["react", "vue.js"]
+
+def test_extract_skills_appends_found_skills():
+    skills = extract_skills("리액트로 만드는 대시보드", "Next.js와 TypeScript 경험", tags=["Vue"])
+    assert skills[0] == "vue.js"
+    assert {"react", "next.js"} <= set(skills)
+
+def test_matcher_prefers_longest_alias_and_word_boundaries():
+    matcher = SkillMatcher({"react": "react", "react native": "react native", "go": "go"})
+    assert matcher.find("React Native app") == ["react native"]
+    assert matcher.find("google ads") == []
@@ -0,0 +1,22 @@
+import time
+from app.services.webhooks import sign_payload, verify_signature
+
+SECRET = "whsec_test"
+BODY = b'{"deliveries": []}'
+
+def test_valid_signature():
+    assert verify_signature(SECRET, sign_payload(SECRET, int(time.time()), BODY), BODY)
+
+def test_wrong_secret_or_body():
+    header = sign_payload(SECRET, int(time.time()), BODY)
+    assert not verify_signature("other", header, BODY)
+    assert not verify_signature(SECRET, header, BODY + b" ")
+
+def test_expired_timestamp():
+    header = sign_payload(SECRET, int(time.time()) - 600, BODY)
+    assert not verify_signature(SECRET, header, BODY)
+    assert verify_signature(SECRET, header, BODY, tolerance=900)
+
+def test_malformed_header():
+    for header in ["", "garbage", "t=abc,v1=00", "v1=00"]:
+        assert not verify_signature(SECRET, header, BODY)